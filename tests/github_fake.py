@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Local fake GitHub API server shared by the research tests."""
+
+import hashlib
+import json
+import threading
+import time
+import urllib.parse
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeGitHub(BaseHTTPRequestHandler):
+    """Local stand-in for the GitHub list endpoints.
+
+    Serves `self.server.items[endpoint]` in pages with Link headers and
+    ETags (keeping only items updated at or after a `since` parameter),
+    answers matching If-None-Match with 304, and returns
+    `self.server.rate_limits` (a list of Retry-After values) as 429s first.
+    `/repos/<owner>/<repo>` serves `self.server.repos_rest`. Connections
+    are kept alive; `self.server.connections` counts accepted ones.
+    """
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def send_json(self, body, headers=()):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_empty(self, code, headers=()):
+        self.send_response(code)
+        self.send_header("Content-Length", "0")
+        for name, value in headers:
+            self.send_header(name, value)
+        self.end_headers()
+
+    def do_GET(self):
+        parts = urllib.parse.urlsplit(self.path)
+        query = dict(urllib.parse.parse_qsl(parts.query))
+        self.server.requests.append((parts.path, query))
+
+        if self.server.rate_limits:
+            self.send_empty(429, [
+                ("Retry-After", str(self.server.rate_limits.pop(0))), ("X-RateLimit-Remaining", "0")
+            ])
+            return
+
+        if parts.path.startswith('/repos/') and parts.path.count('/') == 3:
+            repo = self.server.repos_rest.get(parts.path[len('/repos/'):])
+            if repo is None:
+                self.send_empty(404)
+            else:
+                # Answer out of order, so slow early repositories finish last
+                time.sleep(repo.get('delay', 0))
+                body = json.dumps(repo).encode()
+                self.send_json(body, [("ETag", '"' + hashlib.sha1(body).hexdigest() + '"')])
+            return
+
+        items = self.server.items.get(parts.path.rsplit('/', 1)[-1], [])
+        if 'since' in query:
+            items = [item for item in items if item['updated_at'] >= query['since']]
+        per_page = int(query.get('per_page', 30))
+        page = int(query.get('page', 1))
+        last = max(1, -(-len(items) // per_page))
+        body = json.dumps(items[(page - 1) * per_page:page * per_page]).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+
+        links = []
+        base = f"http://{self.headers['Host']}{parts.path}"
+        for rel, number in (('next', page + 1), ('last', last)):
+            if page < last:
+                links.append(f'<{base}?{urllib.parse.urlencode({**query, "page": number})}>; rel="{rel}"')
+
+        if self.headers.get('If-None-Match') == etag:
+            self.send_empty(304, [("ETag", etag)])
+            return
+        headers = [("ETag", etag), ("X-RateLimit-Remaining", "4999")]
+        if links:
+            headers.append(("Link", ", ".join(links)))
+        self.send_json(body, headers)
+
+    def do_POST(self):
+        """Minimal GraphQL endpoint for the activity and repository queries."""
+        request = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        variables = request['variables']
+        self.server.requests.append((self.path, variables))
+
+        if 'pullRequests' in request['query']:
+            repository = {}
+            for field, key, cursor in (('pullRequests', 'pulls', 'prCursor'), ('issues', 'issues', 'issueCursor')):
+                if not variables['withPrs' if key == 'pulls' else 'withIssues']:
+                    continue
+                items = self.server.items.get(key, [])
+                if key == 'issues':
+                    items = [item for item in items if item['updatedAt'] >= variables['since']]
+                start = int(variables.get(cursor) or 0)
+                repository[field] = {
+                    'nodes': items[start:start + 100],
+                    'pageInfo': {'hasNextPage': start + 100 < len(items), 'endCursor': str(start + 100)},
+                }
+            response = {'data': {'repository': repository}}
+        elif 'stargazerCount' in request['query']:
+            data, errors = {}, []
+            for i in range(len(variables) // 2):
+                full_name = f"{variables[f'owner{i}']}/{variables[f'name{i}']}"
+                data[f'r{i}'] = self.server.repos.get(full_name)
+                if data[f'r{i}'] is None:
+                    errors.append({'message': f"Could not resolve to a Repository with the name '{full_name}'."})
+            response = {'data': data, 'errors': errors}
+        else:
+            response = {'errors': [{'message': 'unsupported query'}]}
+
+        self.send_json(json.dumps(response).encode())
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_fake_github(test):
+    """Start a FakeGitHub server for a test case; returns (server, base URL)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHub)
+    server.daemon_threads = True
+    server.items = {}
+    server.repos = {}
+    server.repos_rest = {}
+    server.requests = []
+    server.rate_limits = []
+    server.connections = 0
+    server.lock = threading.Lock()
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    test.addCleanup(server.server_close)
+    test.addCleanup(server.shutdown)
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def github_stamp(days_ago):
+    """GitHub timestamp `days_ago` days before now."""
+    return (datetime.now(timezone.utc) - timedelta(days=days_ago)).strftime('%Y-%m-%dT%H:%M:%SZ')
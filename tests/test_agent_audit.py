@@ -1,19 +1,23 @@
 #!/usr/bin/env python3
 """Tests for agent audit functionality."""
 
+import dataclasses
 import json
 import tempfile
 import unittest
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import sys
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
 
+import agent_audit
 from agent_audit import (
     AgentSignature,
     AuditLog,
     validate_pr_signature,
+    validate_signatures,
     generate_agent_checklist,
     check_spec_references,
     validate_spec_compliance,
@@ -71,6 +75,42 @@ This PR adds a feature.
         
         self.assertIsNone(sig)
 
+    def test_find_all_returns_signatures_with_offsets(self):
+        """Test extracting several co-agent signatures in one pass."""
+        first = "<!-- AGENT_SIGNATURE: role=role:architect, version=1.0, timestamp=2026-01-15T06:00:00Z -->"
+        second = "<!-- AGENT_SIGNATURE: role=role:swe, version=1.1, timestamp=2026-01-16T06:00:00Z -->"
+        pr_body = f"# PR\n\n{first}\n\nBody text\n{second}\n"
+        
+        signatures = AgentSignature.find_all(pr_body)
+        
+        self.assertEqual([s.role for s in signatures], ["role:architect", "role:swe"])
+        self.assertEqual(signatures[0].offset, pr_body.index(first))
+        self.assertEqual(signatures[1].offset, pr_body.index(second))
+        self.assertEqual(AgentSignature.from_text(pr_body).role, "role:architect")
+
+    def test_find_all_is_cached_per_body(self):
+        """Test that the same body is only scanned once."""
+        pr_body = "<!-- AGENT_SIGNATURE: role=role:spec, version=1.0, timestamp=2026-01-15T06:00:00Z --> cached"
+        AgentSignature.find_all(pr_body)
+        
+        with patch.object(AgentSignature, "SIGNATURE_PATTERN") as pattern:
+            signatures = AgentSignature.find_all(pr_body)
+            pattern.finditer.assert_not_called()
+        self.assertEqual(signatures[0].role, "role:spec")
+
+    def test_cached_signatures_are_immutable(self):
+        """Test that signatures shared through the scan cache cannot be modified."""
+        pr_body = "<!-- AGENT_SIGNATURE: role=role:spec, version=1.0, timestamp=2026-01-15T06:00:00Z --> frozen"
+        signature = AgentSignature.find_all(pr_body)[0]
+        
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            signature.role = "role:swe"
+        self.assertEqual(AgentSignature.find_all(pr_body)[0].role, "role:spec")
+
+    def test_find_all_empty_text(self):
+        """Test that empty text yields no signatures."""
+        self.assertEqual(AgentSignature.find_all(""), [])
+
     def test_validate_valid_signature(self):
         """Test validation of a valid signature."""
         sig = AgentSignature("role:swe", "1.0", "2026-01-15T06:00:00Z")
@@ -129,12 +169,29 @@ This PR implements feature X.
         self.assertGreater(len(errors), 0)
         self.assertTrue(any("signature" in err.lower() for err in errors))
 
+    def test_validate_pr_with_invalid_co_signature(self):
+        """Test that every co-agent signature is validated."""
+        pr_body = """
+<!-- AGENT_SIGNATURE: role=role:swe, version=1.0, timestamp=2026-01-15T06:00:00Z -->
+<!-- AGENT_SIGNATURE: role=testing, version=1.0, timestamp=2026-01-15T06:00:00Z -->
+"""
+        is_valid, errors = validate_pr_signature(pr_body)
+        
+        self.assertFalse(is_valid)
+        self.assertEqual(len(errors), 1)
+        self.assertTrue(errors[0].startswith("Signature 2 (testing):"))
+
+    def test_validate_signatures_empty_list(self):
+        """Test that an empty signature list reports a missing signature."""
+        errors = validate_signatures([])
+        self.assertTrue(any("No agent signature found" in err for err in errors))
+
     def test_validate_empty_pr_body(self):
         """Test validation fails for empty PR body."""
         is_valid, errors = validate_pr_signature("")
         
         self.assertFalse(is_valid)
-        self.assertGreater(len(errors), 0)
+        self.assertEqual(errors, [agent_audit.EMPTY_PR_BODY_ERROR])
 
 
 class TestAuditLog(unittest.TestCase):
@@ -265,6 +322,80 @@ class TestCheckSpecReferences(unittest.TestCase):
             self.assertGreater(len(issues), 0)
             self.assertTrue(any("not found" in issue.lower() for issue in issues))
 
+    def _make_repo(self, root: Path) -> None:
+        """Create a minimal tree with one role prompt referencing all of its specs."""
+        agents_dir = root / ".github" / "agents"
+        agents_dir.mkdir(parents=True)
+        for spec_name in ["architect", "debugging", "deployment", "security", "spec", "swe", "testing"]:
+            spec_dir = root / "specs" / "kerrigan" / "agents" / spec_name
+            spec_dir.mkdir(parents=True)
+            refs = [
+                f"specs/kerrigan/agents/{spec_name}/{doc}"
+                for doc in ["spec.md", "quality-bar.md", "architecture.md", "acceptance-tests.md"]
+            ]
+            for ref in refs:
+                (root / ref).write_text("# Spec\n", encoding="utf-8")
+            (agents_dir / f"role.{spec_name}.md").write_text("\n".join(refs), encoding="utf-8")
+
+    def test_check_spec_references_cached_until_tree_changes(self):
+        """Test that results are reused until a role prompt changes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            self._make_repo(temp_path)
+            
+            is_valid, issues = check_spec_references(temp_path)
+            self.assertTrue(is_valid, issues)
+            self.assertTrue((temp_path / agent_audit.AUDIT_CACHE_DIR / "spec-references.json").exists())
+            
+            with patch.object(agent_audit, "_check_spec_references_uncached") as uncached:
+                self.assertEqual(check_spec_references(temp_path), (True, []))
+                uncached.assert_not_called()
+            
+            role_path = temp_path / ".github" / "agents" / "role.swe.md"
+            role_path.write_text("no references", encoding="utf-8")
+            
+            is_valid, issues = check_spec_references(temp_path)
+            self.assertFalse(is_valid)
+            self.assertTrue(any("role.swe.md" in issue for issue in issues))
+
+    def test_check_spec_references_recomputed_when_checker_changes(self):
+        """Test that a persisted result is not reused by a changed checker."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            self._make_repo(temp_path)
+            check_spec_references(temp_path)
+            
+            with patch.object(agent_audit, "_checker_digest", return_value="changed"), \
+                    patch.object(agent_audit, "_check_spec_references_uncached", return_value=(True, [])) as uncached:
+                check_spec_references(temp_path)
+                uncached.assert_called_once_with(temp_path)
+
+    def test_check_spec_references_reuses_disk_cache(self):
+        """Test that a persisted result is reused by a fresh process."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            self._make_repo(temp_path)
+            check_spec_references(temp_path)
+            
+            agent_audit._spec_reference_cache.clear()
+            with patch.object(agent_audit, "_check_spec_references_uncached") as uncached:
+                is_valid, issues = check_spec_references(temp_path)
+                uncached.assert_not_called()
+            self.assertTrue(is_valid, issues)
+
+    def test_check_spec_references_detects_removed_spec_file(self):
+        """Test that deleting a referenced spec file invalidates the cache."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            self._make_repo(temp_path)
+            self.assertTrue(check_spec_references(temp_path)[0])
+            
+            (temp_path / "specs" / "kerrigan" / "agents" / "swe" / "spec.md").unlink()
+            
+            is_valid, issues = check_spec_references(temp_path)
+            self.assertFalse(is_valid)
+            self.assertIn("Referenced spec file does not exist: specs/kerrigan/agents/swe/spec.md", issues)
+
 
 class TestValidateSpecCompliance(unittest.TestCase):
     """Test spec compliance validation."""
@@ -306,6 +437,19 @@ This PR implements feature X.
         self.assertTrue(any("does not match" in issue for issue in issues))
 
 
+    def test_validate_compliance_with_co_agent_signatures(self):
+        """Test that any co-agent signature can satisfy the expected role."""
+        repo_root = Path(__file__).resolve().parent.parent
+        pr_body = """
+<!-- AGENT_SIGNATURE: role=role:architect, version=1.0, timestamp=2026-01-15T06:00:00Z -->
+<!-- AGENT_SIGNATURE: role=role:swe, version=1.0, timestamp=2026-01-15T07:00:00Z -->
+"""
+        
+        is_compliant, issues = validate_spec_compliance("role:swe", pr_body, repo_root)
+        
+        self.assertTrue(is_compliant, f"Compliance validation failed: {issues}")
+
+
 class TestCheckQualityBarCompliance(unittest.TestCase):
     """Test quality bar compliance checking."""
 
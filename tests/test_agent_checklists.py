@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""Tests for the spec-derived agent checklist registry."""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from agent_checklists import (
+    ChecklistRegistry,
+    DEFAULT_CHECKLISTS,
+    generate_all_checklists,
+    parse_quality_bar,
+)
+
+
+QUALITY_BAR = """# Quality Bar: Example Agent
+
+## Definition of Done
+
+Work is "done" when:
+- [ ] First requirement met
+- [x] Second requirement met
+- [ ] status.json was checked before starting work
+
+## Validation Checklist
+- [ ] Not part of the definition of done
+"""
+
+
+class TestParseQualityBar(unittest.TestCase):
+    """Test quality bar parsing."""
+
+    def test_parse_definition_of_done(self):
+        """Test that only Definition of Done items are extracted."""
+        label, items = parse_quality_bar(QUALITY_BAR)
+        
+        self.assertEqual(label, "Example Agent")
+        self.assertEqual(items, [
+            "First requirement met",
+            "Second requirement met",
+            "status.json was checked before starting work",
+        ])
+
+    def test_parse_numbered_checkmark_items(self):
+        """Test that numbered ✅ items are recognized."""
+        content = "# Quality Bar: Design Agent\n\n## Definition of Done\n\n1. ✅ Tokens exist\n2. ✅ Playground works\n"
+        label, items = parse_quality_bar(content)
+        
+        self.assertEqual(label, "Design Agent")
+        self.assertEqual(items, ["Tokens exist", "Playground works"])
+
+    def test_parse_without_items(self):
+        """Test that documents without a Definition of Done yield nothing."""
+        self.assertIsNone(parse_quality_bar("# Quality Bar: Empty\n\n## Other\n- [ ] Item\n"))
+
+
+class TestChecklistRegistry(unittest.TestCase):
+    """Test checklist registry loading and caching."""
+
+    def setUp(self):
+        """Create a temporary specs directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.specs_dir = Path(self.temp_dir.name)
+        (self.specs_dir / "example").mkdir()
+        self.quality_bar = self.specs_dir / "example" / "quality-bar.md"
+        self.quality_bar.write_text(QUALITY_BAR, encoding="utf-8")
+        self.registry = ChecklistRegistry(self.specs_dir)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_render_spec_derived_checklist(self):
+        """Test rendering a checklist from a quality bar."""
+        checklist = self.registry.render("role:example")
+        
+        self.assertTrue(checklist.startswith("## Agent Checklist (Example Agent)"))
+        self.assertIn("- [ ] Second requirement met", checklist)
+        self.assertNotIn("Not part of", checklist)
+
+    def test_reloads_when_mtime_changes(self):
+        """Test that edits to the quality bar invalidate the cache."""
+        self.registry.render("role:example")
+        
+        self.quality_bar.write_text(
+            QUALITY_BAR.replace("First requirement met", "Updated requirement"),
+            encoding="utf-8"
+        )
+        stat = self.quality_bar.stat()
+        os.utime(self.quality_bar, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        self.assertIn("Updated requirement", self.registry.render("role:example"))
+
+    def test_caches_unparsable_quality_bar(self):
+        """Test that a quality bar without items is not re-read until it changes."""
+        self.quality_bar.write_text("# Quality Bar: Example Agent\n", encoding="utf-8")
+        with patch("agent_checklists.parse_quality_bar", wraps=parse_quality_bar) as parse:
+            self.assertIsNone(self.registry.get("role:example"))
+            self.assertIsNone(self.registry.get("role:example"))
+            self.assertEqual(parse.call_count, 1)
+
+            self.quality_bar.write_text(QUALITY_BAR, encoding="utf-8")
+            stat = self.quality_bar.stat()
+            os.utime(self.quality_bar, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(self.registry.get("role:example")[0], "Example Agent")
+            self.assertEqual(parse.call_count, 2)
+
+    def test_falls_back_to_builtin_checklist(self):
+        """Test that roles without a quality bar use built-in checklists."""
+        checklist = self.registry.render("role:triage")
+        
+        self.assertIn("Triage Agent", checklist)
+        self.assertIn("Reviewed PRs for completeness and quality", checklist)
+
+    def test_unknown_role(self):
+        """Test the generic checklist for unknown roles."""
+        checklist = self.registry.render("role:unknown")
+        
+        self.assertIn("Agent Checklist (role:unknown)", checklist)
+        self.assertIn("Completed assigned work", checklist)
+
+    def test_rejects_path_traversal(self):
+        """Test that role names cannot escape the specs directory."""
+        self.assertIsNone(self.registry.get("role:../example"))
+
+    def test_render_all(self):
+        """Test bulk rendering covers spec-derived and built-in roles."""
+        checklists = self.registry.render_all()
+        
+        self.assertIn("role:example", checklists)
+        for role in DEFAULT_CHECKLISTS:
+            self.assertIn(role, checklists)
+
+
+class TestRepositoryChecklists(unittest.TestCase):
+    """Test checklists generated from this repository's specs."""
+
+    def test_every_spec_role_has_checklist(self):
+        """Test that every agent spec yields a checklist."""
+        repo_root = Path(__file__).resolve().parent.parent
+        checklists = generate_all_checklists(repo_root)
+        
+        for spec_dir in (repo_root / "specs" / "kerrigan" / "agents").iterdir():
+            if (spec_dir / "quality-bar.md").exists():
+                role = f"role:{spec_dir.name}"
+                self.assertIn(role, checklists)
+                self.assertIn("- [ ] ", checklists[role])
+
+
+if __name__ == "__main__":
+    unittest.main()
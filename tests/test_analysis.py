@@ -0,0 +1,745 @@
+"""
+Tests for the self-improvement analysis package.
+
+This module validates the scalable analysis building blocks in tools/analysis.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+import yaml
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from analysis import FeedbackFeatures, MinHasher, MinHashLSH, cluster_near_duplicates, group_related_feedback
+from analysis import AnalysisState, KeywordMatcher, generate_report, write_report, write_report_file, MarkdownSections, PriorityScorer, load_priority_weights, loader
+from analysis.loader import filename_date, load_feedback_files
+from analysis import incremental
+from analysis.metrics import PhaseTimer, metrics_format, write_metrics_file
+from analysis.records import FeedbackDocuments, FeedbackRecord, features_of, record_shingles
+from analysis.similarity import jaccard, lsh_params, shingles
+
+
+def make_item(name, category, title='', description='', related_files=None):
+    """Build a minimal feedback item for tests"""
+    item = {'_filename': name, 'category': category, 'title': title, 'description': description}
+    if related_files is not None:
+        item['related_files'] = related_files
+    return item
+
+
+def pairwise_groups(items):
+    """Reference O(n²) grouping used to verify the indexed implementation"""
+    features = [FeedbackFeatures(item) for item in items]
+    groups = []
+    processed = set()
+    for i in range(len(items)):
+        if i in processed:
+            continue
+        related = [i] + [
+            j for j in range(i + 1, len(items))
+            if j not in processed and features[i].is_related(features[j])
+        ]
+        if len(related) > 1:
+            groups.append({
+                'count': len(related),
+                'category': items[i].get('category', 'unknown'),
+                'items': [items[k]['_filename'] for k in related]
+            })
+            processed.update(related)
+    return groups
+
+
+class TestFeedbackGrouping(unittest.TestCase):
+    """Test suite for related-feedback grouping"""
+
+    def test_groups_by_shared_file(self):
+        """Test that items sharing a related file are grouped"""
+        items = [
+            make_item('a.yaml', 'tool_limitation', related_files=['ci.yml']),
+            make_item('b.yaml', 'tool_limitation', related_files=['ci.yml', 'x.py']),
+            make_item('c.yaml', 'tool_limitation', related_files=['other.py']),
+        ]
+        groups = group_related_feedback(items)
+        self.assertEqual(groups, [{'count': 2, 'category': 'tool_limitation', 'items': ['a.yaml', 'b.yaml']}])
+
+    def test_groups_by_shared_keyword(self):
+        """Test that items sharing a pattern keyword are grouped"""
+        items = [
+            make_item('a.yaml', 'workflow_friction', title='Workflow is slow'),
+            make_item('b.yaml', 'workflow_friction', description='The WORKFLOW hangs'),
+        ]
+        groups = group_related_feedback(items)
+        self.assertEqual(groups[0]['items'], ['a.yaml', 'b.yaml'])
+
+    def test_different_categories_not_grouped(self):
+        """Test that a shared keyword across categories is not enough"""
+        items = [
+            make_item('a.yaml', 'prompt_clarity', title='testing gaps'),
+            make_item('b.yaml', 'tool_limitation', title='testing gaps'),
+        ]
+        self.assertEqual(group_related_feedback(items), [])
+
+    def test_matches_pairwise_grouping(self):
+        """Test that indexed grouping reproduces the pairwise algorithm"""
+        import random
+        rng = random.Random(42)
+        keywords = ['testing', 'workflow', 'quality', 'handoff', 'unrelated', 'noise']
+        items = [
+            make_item(
+                f'{i}.yaml',
+                rng.choice(['a', 'b', 'c']),
+                title=' '.join(rng.sample(keywords, 2)),
+                related_files=rng.sample(['f1', 'f2', 'f3', 'f4', 'f5'], rng.randint(0, 2)),
+            )
+            for i in range(300)
+        ]
+        self.assertEqual(group_related_feedback(items), pairwise_groups(items))
+
+
+class TestNearDuplicateClustering(unittest.TestCase):
+    """Test suite for MinHash/LSH near-duplicate clustering"""
+
+    def test_shingles(self):
+        """Test word shingling, including texts shorter than a shingle"""
+        self.assertEqual(shingles("A b c d", 3), frozenset({'a b c', 'b c d'}))
+        self.assertEqual(shingles("Too short", 3), frozenset({'too short'}))
+        self.assertEqual(shingles("", 3), frozenset())
+
+    def test_signature_is_deterministic(self):
+        """Test that signatures do not depend on process hash seeds"""
+        sample = shingles("feedback about the handoff workflow being unclear")
+        self.assertEqual(MinHasher(64).signature(sample), MinHasher(64).signature(sample))
+        self.assertEqual(len(MinHasher(64).signature(sample)), 64)
+
+    def test_signature_estimates_jaccard(self):
+        """Test that signature agreement approximates Jaccard similarity"""
+        a = frozenset(f"s{i}" for i in range(100))
+        b = frozenset(f"s{i}" for i in range(50, 150))
+        hasher = MinHasher(256)
+        sig_a, sig_b = hasher.signature(a), hasher.signature(b)
+        estimate = sum(x == y for x, y in zip(sig_a, sig_b)) / 256
+        self.assertAlmostEqual(estimate, jaccard(a, b), delta=0.1)
+
+    def test_lsh_params_track_threshold(self):
+        """Test that higher thresholds use more rows per band"""
+        bands, rows = lsh_params(0.9, 128)
+        self.assertLessEqual(bands * rows, 128)
+        self.assertGreater(rows, lsh_params(0.3, 128)[1])
+
+    def test_lsh_rejects_invalid_threshold(self):
+        """Test that thresholds outside (0, 1] are rejected"""
+        with self.assertRaises(ValueError):
+            MinHashLSH(threshold=0.0)
+
+    def test_clusters_near_duplicates(self):
+        """Test that near-identical complaints form one cluster"""
+        text = "ci workflow fails when the validator cannot find the status file in new projects"
+        items = [make_item(f'{i}.yaml', 'tool_limitation', description=text + f' run {i % 2}') for i in range(6)]
+        items.append(make_item('x.yaml', 'tool_limitation', description='prompt wording is confusing'))
+        clusters = cluster_near_duplicates(items, threshold=0.7)
+        self.assertEqual(len(clusters), 1)
+        self.assertEqual(clusters[0]['items'], [f'{i}.yaml' for i in range(6)])
+
+    def test_large_bucket_compared_linearly(self):
+        """Test that hundreds of near-identical complaints cost a comparison each, not one per pair"""
+        text = ("ci workflow fails when the validator cannot find the status file in new projects "
+                "created from the template because the path is resolved against the wrong directory")
+        items = [make_item(f'{i}.yaml', 'tool_limitation', description=f'{text} token{i}') for i in range(300)]
+        calls = []
+
+        def counting_jaccard(a, b):
+            calls.append(1)
+            return jaccard(a, b)
+
+        with patch('analysis.similarity.jaccard', side_effect=counting_jaccard):
+            clusters = cluster_near_duplicates(items, threshold=0.8)
+        self.assertEqual([c['count'] for c in clusters], [300])
+        self.assertLess(len(calls), 2 * len(items))
+
+    def test_chained_links_join_one_cluster(self):
+        """Test that A~B and B~C cluster A, B and C together even when A and C are not similar"""
+        items = [make_item(f'{name}.yaml', 'c') for name in 'abc']
+        base = list(range(140))
+        hashed = [base[:100], base[20:120], base[40:140]]
+        self.assertLess(jaccard(set(hashed[0]), set(hashed[2])), 0.6)
+
+        for order in [(0, 1, 2), (0, 2, 1), (2, 0, 1)]:
+            with patch('analysis.similarity.MinHashLSH.candidate_buckets', return_value=[order]):
+                clusters = cluster_near_duplicates(items, threshold=0.6, hashed_shingles=hashed)
+            self.assertEqual([c['items'] for c in clusters], [['a.yaml', 'b.yaml', 'c.yaml']], order)
+
+    def test_threshold_controls_clustering(self):
+        """Test that a strict threshold keeps moderately similar items apart"""
+        items = [
+            make_item('a.yaml', 'c', description='one two three four five six seven eight'),
+            make_item('b.yaml', 'c', description='one two three four five six nine ten'),
+        ]
+        self.assertEqual(len(cluster_near_duplicates(items, threshold=0.3)), 1)
+        self.assertEqual(cluster_near_duplicates(items, threshold=0.95), [])
+
+    def test_matches_exact_pairwise_clustering(self):
+        """Test that LSH finds the same clusters as exhaustive comparison"""
+        import random
+        rng = random.Random(7)
+        words = [f'w{i}' for i in range(300)]
+        bases = [rng.choices(words, k=25) for _ in range(15)]
+        items = []
+        for i in range(120):
+            tokens = list(bases[i % 15])
+            tokens[rng.randrange(25)] = 'changed'
+            items.append(make_item(f'{i}.yaml', 'c', description=' '.join(tokens)))
+        sets = [shingles(f"{item['title']} {item['description']}") for item in items]
+        expected = {
+            frozenset(j for j in range(len(items)) if j == i or jaccard(sets[i], sets[j]) >= 0.5)
+            for i in range(len(items))
+        }
+        expected = {group for group in expected if len(group) > 1}
+        found = {frozenset(int(name.split('.')[0]) for name in c['items'])
+                 for c in cluster_near_duplicates(items, threshold=0.5)}
+        self.assertEqual(found, expected)
+
+
+class TestFeedbackLoading(unittest.TestCase):
+    """Test suite for cached feedback loading"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.feedback_dir = self.root / "feedback"
+        self.feedback_dir.mkdir()
+        self.cache_dir = self.root / ".analysis_cache"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write(self, name, content):
+        path = self.feedback_dir / name
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_filename_date(self):
+        """Test parsing of the date prefix in feedback filenames"""
+        self.assertEqual(filename_date("2026-01-17-slug.yaml").isoformat(), "2026-01-17")
+        self.assertIsNone(filename_date("slug.yaml"))
+        self.assertIsNone(filename_date("2026-13-40-bad.yaml"))
+
+    def test_skips_templates_and_old_files_unopened(self):
+        """Test that templates and files dated before the window are skipped"""
+        self.write("TEMPLATE.yaml", "title: template")
+        self.write("2026-01-02-copy.yaml", "# Copy this template\ntitle: copy")
+        self.write("2025-01-01-old.yaml", "title: [unclosed")
+        self.write("2026-01-02-new.yaml", "title: New")
+        since = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        items = load_feedback_files(self.feedback_dir, since_date=since)
+        self.assertEqual([item['_filename'] for item in items], ["2026-01-02-new.yaml"])
+
+    def test_cache_reused_until_file_changes(self):
+        """Test that unchanged files are not re-parsed on the next load"""
+        path = self.write("2026-01-02-a.yaml", "title: First\ntimestamp: 2026-01-02T00:00:00Z")
+        first = load_feedback_files(self.feedback_dir, cache_dir=self.cache_dir)
+
+        with patch.object(loader, "parse_feedback_file", side_effect=AssertionError("re-parsed")):
+            self.assertEqual(load_feedback_files(self.feedback_dir, cache_dir=self.cache_dir), first)
+
+        path.write_text("title: Second, edited", encoding="utf-8")
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+        items = load_feedback_files(self.feedback_dir, cache_dir=self.cache_dir)
+        self.assertEqual(items[0]['title'], "Second, edited")
+
+    def test_cache_survives_new_mtimes(self):
+        """Test that a checkout touching every file (same content, new mtime) does not re-parse"""
+        path = self.write("2026-01-02-a.yaml", "title: First")
+        first = load_feedback_files(self.feedback_dir, cache_dir=self.cache_dir)
+
+        os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 1_000_000))
+        with patch.object(loader, "parse_feedback_file", side_effect=AssertionError("re-parsed")):
+            self.assertEqual(load_feedback_files(self.feedback_dir, cache_dir=self.cache_dir), first)
+        # The entry was re-stamped, so the next run does not even hash the file
+        with patch.object(loader, "file_digest", side_effect=AssertionError("re-hashed")):
+            self.assertEqual(load_feedback_files(self.feedback_dir, cache_dir=self.cache_dir), first)
+
+    def test_cache_preserves_yaml_types(self):
+        """Test that dates parsed by YAML survive the JSON cache"""
+        self.write("2026-01-02-a.yaml", "timestamp: 2026-01-02T10:00:00Z\nday: 2026-01-02")
+        fresh = load_feedback_files(self.feedback_dir, cache_dir=self.cache_dir)
+        cached = load_feedback_files(self.feedback_dir, cache_dir=self.cache_dir)
+        self.assertEqual(cached, fresh)
+        self.assertIsInstance(cached[0]['timestamp'], datetime)
+
+    def test_invalid_yaml_warns_and_is_not_cached(self):
+        """Test that parse errors are reported and retried on the next run"""
+        self.write("2026-01-02-bad.yaml", "title: [unclosed")
+        with patch('builtins.print') as mock_print:
+            self.assertEqual(load_feedback_files(self.feedback_dir, cache_dir=self.cache_dir), [])
+        self.assertIn("Could not load 2026-01-02-bad.yaml", mock_print.call_args[0][0])
+        with patch('builtins.print') as mock_print:
+            load_feedback_files(self.feedback_dir, cache_dir=self.cache_dir)
+        mock_print.assert_called()
+
+    def test_parallel_load_matches_sequential(self):
+        """Test that the process pool path returns the same documents"""
+        for i in range(loader.PARALLEL_THRESHOLD + 4):
+            self.write(f"2026-01-{i + 1:02d}-item.yaml", f"title: Item {i}\ncategory: c{i % 3}")
+        parallel = load_feedback_files(self.feedback_dir)
+        with patch.object(loader, "PARALLEL_THRESHOLD", 10_000):
+            sequential = load_feedback_files(self.feedback_dir)
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(len(parallel), loader.PARALLEL_THRESHOLD + 4)
+
+
+class TestPriorityScorer(unittest.TestCase):
+    """Test suite for weighted feedback prioritization"""
+
+    def legacy_top(self, items, limit):
+        """Score-and-sort reference for the default weights"""
+        def score(item):
+            total = {'high': 10, 'medium': 5}.get(item.get('severity', 'low'), 0)
+            total += {'new': 8, 'reviewed': 5}.get(item.get('status', 'new'), 0)
+            category = item.get('category', '')
+            total += 3 if category in ['tool_limitation', 'artifact_conflict'] else 2 if category == 'prompt_clarity' else 0
+            return total
+        return [item for _, item in sorted(((score(i), i) for i in items), key=lambda x: x[0], reverse=True)[:limit]]
+
+    def test_top_matches_full_sort(self):
+        """Test that heap selection matches sorting every item, ties included"""
+        import random
+        rng = random.Random(11)
+        items = [
+            {'_filename': str(i),
+             'severity': rng.choice(['high', 'medium', 'low', None]),
+             'status': rng.choice(['new', 'reviewed', 'implemented']),
+             'category': rng.choice(['tool_limitation', 'prompt_clarity', 'other'])}
+            for i in range(200)
+        ]
+        for item in items[::7]:
+            del item['status']
+        self.assertEqual(PriorityScorer().top(items, 5), self.legacy_top(items, 5))
+
+    def test_score_cached_per_weight_table(self):
+        """Test that scores are cached per scorer without touching the item"""
+        item = {'severity': 'high', 'status': 'new', 'category': 'tool_limitation'}
+        original = dict(item)
+        scorer = PriorityScorer()
+        self.assertEqual(scorer.score(item), 21)
+        self.assertIs(scorer.info(item), scorer.info(item))
+        custom = PriorityScorer({'severity': {'high': 1}})
+        self.assertEqual(custom.score(item), 1)
+        self.assertEqual(item, original)
+        self.assertEqual(json.loads(json.dumps(item)), original)
+
+    def test_load_priority_weights_merges_defaults(self):
+        """Test that a weights file overrides only the values it lists"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "weights.yaml"
+            path.write_text("category:\n  workflow_friction: 4\nseverity:\n  high: 20\n", encoding="utf-8")
+            weights = load_priority_weights(path)
+        self.assertEqual(weights['severity'], {'high': 20, 'medium': 5})
+        self.assertEqual(weights['category']['workflow_friction'], 4)
+        self.assertEqual(weights['status'], {'new': 8, 'reviewed': 5})
+
+
+class TestMarkdownSections(unittest.TestCase):
+    """Test suite for the single-pass markdown section map"""
+
+    def regex_section(self, content, heading):
+        """The per-heading regex the section map replaces"""
+        import re
+        pattern = rf'^##+ {re.escape(heading)}.*?\n(.*?)(?=^##+ |\Z)'
+        match = re.search(pattern, content, re.MULTILINE | re.DOTALL | re.IGNORECASE)
+        return match.group(1).strip() if match else ""
+
+    def test_sections(self):
+        """Test heading lookup, nesting and case-insensitive prefix matching"""
+        content = "# Title\n## Lessons Learned (M6)\nkeep tests\n# Not a section\n### Challenges\nslow CI\n## Other\nx"
+        sections = MarkdownSections(content)
+        self.assertEqual(sections.get('lessons learned'), "keep tests\n# Not a section")
+        self.assertEqual(sections.get('Challenges'), "slow CI")
+        self.assertEqual(sections.get('Recommendations'), "")
+
+    def test_matches_regex_extraction(self):
+        """Test that the section map agrees with the regex on varied documents"""
+        import random
+        rng = random.Random(0)
+        pieces = ['## Lessons Learned', '### Challenges faced', '# Challenges', '##Challenges',
+                  '## recommendations', 'text', '- item ## x', '', '  ## Lessons Learned', '## Lessons']
+        for _ in range(2000):
+            content = '\n'.join(rng.choice(pieces) for _ in range(rng.randint(0, 10)))
+            if rng.random() < 0.5:
+                content += '\n'
+            sections = MarkdownSections(content)
+            for heading in ('Lessons Learned', 'Challenges', 'Recommendations'):
+                self.assertEqual(sections.get(heading), self.regex_section(content, heading), content)
+
+
+class TestKeywordMatcher(unittest.TestCase):
+    """Test suite for multi-keyword counting"""
+
+    def test_automaton_matches_str_count(self):
+        """Test that the automaton reproduces str.count, overlaps included"""
+        import random
+        rng = random.Random(1)
+        for _ in range(2000):
+            keywords = [''.join(rng.choice('ab c') for _ in range(rng.randint(1, 4))) for _ in range(rng.randint(1, 6))]
+            text = ''.join(rng.choice('ab c') for _ in range(rng.randint(0, 40)))
+            expected = {k: text.count(k) for k in keywords if text.count(k)}
+            self.assertEqual(KeywordMatcher(keywords, use_automaton=True).count(text), expected)
+            self.assertEqual(KeywordMatcher(keywords, use_automaton=False).count(text), expected)
+
+    def test_present(self):
+        """Test keyword presence detection"""
+        matcher = KeywordMatcher(['testing', 'agent prompt', 'workflow'], use_automaton=True)
+        self.assertEqual(matcher.present("the agent prompt lacks testing notes"), frozenset({'testing', 'agent prompt'}))
+
+
+class TestReportWriter(unittest.TestCase):
+    """Test suite for streaming report generation"""
+
+    def setUp(self):
+        self.proposal = {
+            'type': 'bug_fix', 'priority': 'high', 'title': 'Fix it', 'category': 'c',
+            'description': 'd', 'evidence': 'e', 'proposed_solution': 's', 'labels': ['kerrigan'],
+        }
+        self.args = (
+            {'total_feedback': 2, 'by_category': {'c': 2}, 'related_groups': [{'category': 'c', 'count': 2}]},
+            ['Recurring theme: testing'],
+            [self.proposal, dict(self.proposal, source='external', relevance_score=0.9)],
+            [{'type': 'web_search', 'title': 'Finding', 'relevance': 0.9}],
+        )
+
+    def test_stream_matches_generated_report(self):
+        """Test that streaming writes exactly what generate_report returns"""
+        import io
+        with patch('analysis.report.datetime') as mock_datetime:
+            mock_datetime.now.return_value = datetime(2026, 1, 2, tzinfo=timezone.utc)
+            expected = generate_report(*self.args)
+            out = io.StringIO()
+            write_report(out, *self.args)
+        self.assertEqual(out.getvalue(), expected)
+        self.assertIn("### Internal Analysis Proposals", expected)
+        self.assertIn("#### External Proposal 1: Fix it", expected)
+
+    def test_write_report_file(self):
+        """Test that the report file is created with parent directories"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "out" / "report.md"
+            with patch('builtins.print'):
+                self.assertEqual(write_report_file(path, *self.args), path)
+            self.assertTrue(path.read_text(encoding="utf-8").startswith("# Kerrigan Self-Improvement Analysis Report"))
+
+
+def full_analysis(items):
+    """Reference (non-incremental) feedback aggregates"""
+    from collections import Counter
+    severities = Counter(item.get('severity', 'unknown') for item in items)
+    statuses = Counter(item.get('status', 'new') for item in items)
+    return {
+        'total_feedback': len(items),
+        'by_category': dict(Counter(item.get('category', 'unknown') for item in items)),
+        'by_severity': dict(severities),
+        'by_agent': dict(Counter(item.get('agent_role', 'unknown') for item in items)),
+        'by_status': dict(statuses),
+        'related_groups': group_related_feedback(items),
+        'high_severity_count': severities.get('high', 0),
+        'unaddressed_count': statuses.get('new', 0) + statuses.get('reviewed', 0),
+    }
+
+
+class TestFeedbackRecords(unittest.TestCase):
+    """Test suite for compact feedback records"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.feedback_dir = Path(self._tmp.name)
+        self.documents = FeedbackDocuments(self.feedback_dir, capacity=2)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def record(self, name, **fields):
+        item = make_item(name, 'tool_limitation', title='Validator bug',
+                         description='The validator rejects valid files', related_files=['a.py'])
+        item.update(fields)
+        (self.feedback_dir / name).write_text(yaml.safe_dump({k: v for k, v in item.items() if k != '_filename'}))
+        return FeedbackRecord(item, self.documents)
+
+    def test_compact_fields_without_reading_file(self):
+        """Test that counter fields and features are served from the record"""
+        record = self.record('a.yaml', severity='high')
+        self.assertEqual(record.get('severity'), 'high')
+        self.assertEqual(record['_filename'], 'a.yaml')
+        self.assertEqual(record.get('status', 'new'), 'new')
+        self.assertNotIn('status', record)
+        self.assertIs(features_of(record), record.features)
+        self.assertFalse(hasattr(record, '__dict__'))
+        self.assertEqual(self.documents.reads, 0)
+
+    def test_text_fields_load_lazily(self):
+        """Test that full text is read from the file only when accessed"""
+        record = self.record('a.yaml', proposed_solution='Relax the schema')
+        self.assertEqual(record.get('description'), 'The validator rejects valid files')
+        self.assertEqual(record['proposed_solution'], 'Relax the schema')
+        self.assertEqual(self.documents.reads, 1)
+        with self.assertRaises(KeyError):
+            record['missing']
+
+    def test_document_reader_is_bounded(self):
+        """Test that only the most recent documents stay loaded"""
+        records = [self.record(f'{i}.yaml') for i in range(3)]
+        for record in records + records[:1]:
+            record.get('description')
+        # 0.yaml was evicted by 2.yaml and read again
+        self.assertEqual(self.documents.reads, 4)
+
+    def test_records_are_read_only(self):
+        """Test that records are read-only and keep the priority in their slot"""
+        record = self.record('a.yaml')
+        scorer = PriorityScorer()
+        self.assertEqual(scorer.score(record), scorer.score(make_item('a.yaml', 'tool_limitation')))
+        self.assertIs(record.priority, scorer.info(record))
+        self.assertNotIn('_priority', record)
+        with self.assertRaises(TypeError):
+            record['severity'] = 'low'
+
+    def test_grouping_matches_documents(self):
+        """Test that records group exactly like the documents they replace"""
+        items = [
+            make_item(f'{i}.yaml', 'tool_limitation', title=f'Issue {i}',
+                      description='validation failed' if i % 2 else 'unclear prompt',
+                      related_files=[f'f{i % 3}.py'])
+            for i in range(8)
+        ]
+        records = [FeedbackRecord(item, self.documents) for item in items]
+        self.assertEqual(
+            group_related_feedback(records, [features_of(r) for r in records]),
+            group_related_feedback(items)
+        )
+        self.assertEqual(self.documents.reads, 0)
+
+    def test_clustering_matches_documents_without_reads(self):
+        """Test that records kept for minhash cluster like their documents without reading files"""
+        text = "the validator rejects valid status json files when the project name has dashes"
+        items = [
+            make_item(f'{i}.yaml', 'tool_limitation', title='Validator bug',
+                      description=text + (' again' if i % 2 else '') if i < 6 else f'unrelated note {i}')
+            for i in range(8)
+        ]
+        records = [FeedbackRecord(item, self.documents, keep_shingles=True) for item in items]
+        clusters = cluster_near_duplicates(records, threshold=0.6, hashed_shingles=record_shingles(records))
+        self.assertEqual(clusters, cluster_near_duplicates(items, threshold=0.6))
+        self.assertEqual(clusters[0]['count'], 6)
+        self.assertEqual(self.documents.reads, 0)
+
+    def test_lazy_fields_come_from_parse_cache(self):
+        """Test that unchanged files are read back from the parse cache instead of re-parsed"""
+        cache_dir = self.feedback_dir / ".cache"
+        self.record('a.yaml', proposed_solution='Relax the schema')
+        records = [FeedbackRecord(item, FeedbackDocuments(self.feedback_dir, cache_dir=cache_dir))
+                   for item in load_feedback_files(self.feedback_dir, cache_dir=cache_dir)]
+        self.assertEqual(records[0]['proposed_solution'], 'Relax the schema')
+        self.assertEqual(records[0]._documents.reads, 0)
+
+
+class TestRunMetrics(unittest.TestCase):
+    """Test suite for run metrics export"""
+
+    METRICS = {'feedback_processed': 4, 'proposals_generated': 2, 'note': 'skipped'}
+    TIMINGS = {'loading': 0.5, 'report': 0.25}
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_phase_timer_accumulates(self):
+        """Test that repeated phases add up and keep first-seen order"""
+        timer = PhaseTimer()
+        for name in ('loading', 'grouping', 'loading'):
+            with timer.phase(name):
+                pass
+        self.assertEqual(list(timer.timings), ['loading', 'grouping'])
+        self.assertGreaterEqual(timer.total, sum(timer.timings.values()))
+
+    def test_format_from_suffix(self):
+        """Test that the file suffix selects the metrics format"""
+        self.assertEqual(metrics_format(Path('m.json')), 'json')
+        self.assertEqual(metrics_format(Path('m.prom')), 'prometheus')
+        self.assertEqual(metrics_format(Path('m.om')), 'openmetrics')
+        with self.assertRaises(ValueError):
+            metrics_format(Path('m.txt'))
+
+    def test_json_metrics(self):
+        """Test the JSON metrics file layout"""
+        path = write_metrics_file(self.root / 'out' / 'm.json', self.METRICS, self.TIMINGS, 1.0)
+        data = json.loads(path.read_text())
+        self.assertEqual(data['metrics'], self.METRICS)
+        self.assertEqual(data['phase_seconds'], self.TIMINGS)
+        self.assertEqual(data['total_seconds'], 1.0)
+        self.assertFalse(path.with_name('m.json.tmp').exists())
+
+    def test_prometheus_metrics(self):
+        """Test Prometheus text exposition output"""
+        text = write_metrics_file(self.root / 'm.prom', self.METRICS, self.TIMINGS, 1.0).read_text()
+        self.assertIn("kerrigan_self_improvement_feedback_processed 4\n", text)
+        self.assertIn('kerrigan_self_improvement_phase_duration_seconds{phase="loading"} 0.500000\n', text)
+        self.assertIn("# TYPE kerrigan_self_improvement_run_duration_seconds gauge\n", text)
+        self.assertNotIn("note", text)
+        self.assertNotIn("# EOF", text)
+        self.assertNotIn("# UNIT", text)
+
+    def test_openmetrics_metrics(self):
+        """Test OpenMetrics output adds units and the EOF marker"""
+        text = write_metrics_file(self.root / 'm.om', self.METRICS, self.TIMINGS, 1.0).read_text()
+        self.assertIn("# UNIT kerrigan_self_improvement_phase_duration_seconds seconds\n", text)
+        self.assertTrue(text.endswith("# EOF\n"))
+
+
+class TestIncrementalState(unittest.TestCase):
+    """Test suite for persisted incremental analysis state"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "analysis-state.json"
+        self.params = {'similarity': 'keyword'}
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def make_items(self, rng, start, count):
+        keywords = ['testing', 'workflow', 'quality', 'handoff', 'misc']
+        return [
+            {
+                '_filename': f'{start + i:04d}.yaml',
+                'category': rng.choice(['a', 'b']),
+                'severity': rng.choice(['high', 'medium', 'low']),
+                'agent_role': rng.choice(['swe', 'spec']),
+                'status': rng.choice(['new', 'reviewed', 'implemented']),
+                'title': rng.choice(keywords),
+                'related_files': rng.sample(['f1', 'f2', 'f3', 'f4'], rng.randint(0, 1)),
+            }
+            for i in range(count)
+        ]
+
+    def run_state(self, items, fingerprints, full_rebuild=False):
+        state = AnalysisState(self.path, self.params, full_rebuild=full_rebuild)
+        delta = state.ingest_feedback(items, fingerprints)
+        state.save()
+        return state, delta
+
+    def test_daily_appends_match_full_analysis(self):
+        """Test that appending feedback day by day matches a full recompute"""
+        import random
+        rng = random.Random(3)
+        items = []
+        fingerprints = {}
+        for day in range(12):
+            new_items = self.make_items(rng, len(items), rng.randint(0, 6))
+            items.extend(new_items)
+            fingerprints.update({item['_filename']: f'day-{day}' for item in new_items})
+            state, delta = self.run_state(items, fingerprints)
+            self.assertEqual(delta['added'], len(new_items))
+            self.assertEqual(state.feedback_analysis(), full_analysis(items) if items else {})
+            self.assertEqual(state.rebuilt, day == 0)
+
+    def test_edits_and_expiry_match_full_analysis(self):
+        """Test that edited and aged-out feedback is subtracted from aggregates"""
+        import random
+        rng = random.Random(5)
+        items = self.make_items(rng, 0, 30)
+        fingerprints = {item['_filename']: 'v1' for item in items}
+        self.run_state(items, fingerprints)
+
+        items = items[5:]
+        items[3] = dict(items[3], severity='high', title='workflow')
+        fingerprints[items[3]['_filename']] = 'v2'
+        state, delta = self.run_state(items, fingerprints)
+        self.assertEqual(delta, {'added': 0, 'changed': 1, 'removed': 5})
+        self.assertEqual(state.feedback_analysis(), full_analysis(items))
+
+    def test_moving_window_matches_full_analysis(self):
+        """Test that a window moving forward a day at a time stays exact without rebuilding"""
+        import random
+        rng = random.Random(7)
+        days = {day: self.make_items(rng, day * 10, rng.randint(1, 5)) for day in range(20)}
+        for today in range(7, 20):
+            items = [item for day in range(today - 6, today + 1) for item in days[day]]
+            fingerprints = {item['_filename']: 'v1' for item in items}
+            state, delta = self.run_state(items, fingerprints)
+            self.assertEqual(state.rebuilt, today == 7)
+            if today > 7:
+                self.assertEqual(delta, {'added': len(days[today]), 'changed': 0, 'removed': len(days[today - 7])})
+            self.assertEqual(state.feedback_analysis(), full_analysis(items))
+
+    def test_files_leaving_window_do_not_regroup(self):
+        """Test that dropping old members and whole old groups updates groups in place"""
+        old = [make_item('1-a.yaml', 'c', title='testing'), make_item('1-b.yaml', 'c', title='workflow'),
+               make_item('1-c.yaml', 'c', title='workflow')]
+        kept = [make_item('2-a.yaml', 'c', title='quality'), make_item('2-b.yaml', 'c', title='quality'),
+                make_item('2-c.yaml', 'c', title='handoff')]
+        items = old + kept
+        self.run_state(items, {item['_filename']: 'v1' for item in items})
+
+        items = kept + [make_item('3-a.yaml', 'c', title='quality')]
+        with patch('analysis.incremental.group_related_feedback', side_effect=AssertionError("regrouped")):
+            state, delta = self.run_state(items, {item['_filename']: 'v1' for item in items})
+        self.assertEqual(delta, {'added': 1, 'changed': 0, 'removed': 3})
+        self.assertEqual(state.feedback_analysis(), full_analysis(items))
+
+    def test_removed_leader_regroups_only_its_category(self):
+        """Test that a removed leader with remaining members only regroups its own category"""
+        items = [make_item('1-a.yaml', 'c', title='testing'), make_item('1-b.yaml', 'd', title='handoff'),
+                 make_item('2-a.yaml', 'c', title='testing'), make_item('2-b.yaml', 'd', title='workflow'),
+                 make_item('2-c.yaml', 'd', title='workflow')]
+        self.run_state(items, {item['_filename']: 'v1' for item in items})
+
+        items = items[2:]
+        regrouped = []
+        original = incremental.group_related_feedback
+
+        def group(group_items, features):
+            regrouped.extend(item['_filename'] for item in group_items)
+            return original(group_items, features)
+
+        with patch('analysis.incremental.group_related_feedback', side_effect=group):
+            state, _ = self.run_state(items, {item['_filename']: 'v1' for item in items})
+        self.assertEqual(regrouped, ['2-a.yaml'])
+        self.assertEqual(state.feedback_analysis(), full_analysis(items))
+
+    def test_params_change_forces_rebuild(self):
+        """Test that changed parameters or --full-rebuild ignore old state"""
+        items = [make_item('a.yaml', 'c', title='testing')]
+        self.run_state(items, {'a.yaml': 'v1'})
+        self.assertFalse(AnalysisState(self.path, self.params).rebuilt)
+        self.assertTrue(AnalysisState(self.path, self.params, full_rebuild=True).rebuilt)
+        self.assertTrue(AnalysisState(self.path, {'similarity': 'minhash'}).rebuilt)
+
+    def test_retrospectives_only_reread_when_changed(self):
+        """Test that unchanged retrospectives reuse stored keyword counts"""
+        reads = []
+
+        def counts(name):
+            reads.append(name)
+            return {'testing': 1}
+
+        state = AnalysisState(self.path, self.params)
+        totals = state.ingest_retrospectives({'a.md': 'v1', 'b.md': 'v1'}, counts)
+        self.assertEqual(totals, {'testing': 2})
+        state.save()
+
+        state = AnalysisState(self.path, self.params)
+        totals = state.ingest_retrospectives({'a.md': 'v1', 'b.md': 'v2'}, counts)
+        self.assertEqual(reads, ['a.md', 'b.md', 'b.md'])
+        self.assertEqual(totals, {'testing': 2})
+
+
+if __name__ == "__main__":
+    unittest.main()
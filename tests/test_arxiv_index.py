@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Tests for the offline arXiv index and the paper researcher.
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from research import (
+    ArxivIndex,
+    PaperResearcher,
+    build_index,
+)
+
+
+class TestArxivIndex(unittest.TestCase):
+    """Test the offline arXiv index: BM25 search and incremental updates"""
+
+    PAPERS = [
+        ('2401.00001', 'Multi-agent orchestration with large language models',
+         'We coordinate LLM agents through explicit handoffs and shared artifacts.', 'cs.AI cs.MA'),
+        ('2401.00002', 'Self-improving autonomous agents',
+         'Agents refine their own prompts from a feedback loop over past failures.', 'cs.AI'),
+        ('2401.00003', 'Graph colouring bounds',
+         'We prove new bounds for colouring sparse graphs.', 'math.CO'),
+        ('2401.00004', 'Verifying agent-written software',
+         'Test generation catches defects in code written by autonomous agents.', 'cs.SE'),
+    ]
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp_dir = Path(self._tmp.name)
+        self.dump = self.tmp_dir / "arxiv.jsonl"
+        self.index_path = self.tmp_dir / "index.sqlite3"
+        self.append(self.PAPERS)
+
+    def append(self, papers, updated='2024-01-01'):
+        with open(self.dump, 'a') as f:
+            for arxiv_id, title, abstract, categories in papers:
+                f.write(json.dumps({'id': arxiv_id, 'title': title, 'abstract': abstract,
+                                    'categories': categories, 'update_date': updated}) + "\n")
+
+    def test_build_filters_categories(self):
+        """Test that only papers in the selected categories are indexed"""
+        stats = build_index(self.index_path, [self.dump])
+        self.assertEqual((stats['read'], stats['added'], stats['filtered']), (4, 3, 1))
+        with ArxivIndex(self.index_path) as index:
+            self.assertEqual(index.size, 3)
+            self.assertEqual(index.search("graph colouring bounds"), [])
+
+    def test_bm25_ranks_matching_papers_first(self):
+        """Test that the paper matching most (and rarest) query terms ranks first"""
+        build_index(self.index_path, [self.dump])
+        with ArxivIndex(self.index_path) as index:
+            results = index.search("orchestration of language model agents")
+        self.assertEqual(results[0]['arxiv_id'], '2401.00001')
+        self.assertEqual(results[0]['coverage'], 1.0)
+        self.assertEqual({r['arxiv_id'] for r in results}, {'2401.00001', '2401.00002', '2401.00004'})
+        self.assertTrue(all(a['score'] >= b['score'] for a, b in zip(results, results[1:])))
+
+    def test_incremental_update_reads_only_appended_lines(self):
+        """Test that a rerun indexes appended and revised papers only"""
+        build_index(self.index_path, [self.dump])
+        self.assertEqual(build_index(self.index_path, [self.dump])['read'], 0)
+
+        self.append([('2401.00005', 'Planning agents', 'Agents plan tool use.', 'cs.AI'),
+                     ('2401.00002', 'Self-improving agents revisited', 'Curriculum feedback.', 'cs.AI')],
+                    updated='2024-02-01')
+        stats = build_index(self.index_path, [self.dump])
+
+        self.assertEqual((stats['read'], stats['added'], stats['updated']), (2, 1, 1))
+        with ArxivIndex(self.index_path) as index:
+            self.assertEqual(index.size, 4)
+            self.assertEqual(index.search("curriculum")[0]['arxiv_id'], '2401.00002')
+            # Postings of the previous version are gone
+            self.assertEqual(index.search("prompts failures"), [])
+
+    def test_category_change_requires_rebuild(self):
+        """Test that indexing other categories into an existing index is refused without rebuild"""
+        build_index(self.index_path, [self.dump])
+        with self.assertRaises(ValueError):
+            build_index(self.index_path, [self.dump], categories=['math.CO'])
+        stats = build_index(self.index_path, [self.dump], categories=['math.CO'], rebuild=True)
+        self.assertEqual(stats['added'], 1)
+
+    def test_paper_researcher_searches_offline(self):
+        """Test that paper research turns index matches into findings without network access"""
+        build_index(self.index_path, [self.dump])
+        researcher = PaperResearcher(enabled=True, index_path=str(self.index_path))
+
+        findings = researcher.search_arxiv(max_results=2)
+
+        self.assertEqual(len(findings), 2)
+        self.assertTrue(all(f['type'] == 'paper' and f['evidence'].startswith('arXiv:') for f in findings))
+        self.assertTrue(all(0 < f['relevance'] <= 1 for f in findings))
+
+    def test_paper_researcher_without_index(self):
+        """Test that paper research without an index returns no findings"""
+        researcher = PaperResearcher(enabled=True, index_path=str(self.tmp_dir / "missing.sqlite3"))
+        self.assertEqual(researcher.search_arxiv(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Tests for checklist completion scoring."""
+
+import subprocess
+import unittest
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from checklist_scoring import (
+    ChecklistMatcher,
+    ChecklistScorer,
+    load_export,
+    parse_checkboxes,
+)
+
+
+ITEMS = [
+    "Checked project status.json before starting",
+    "Ran linting and fixed all issues",
+    "Added regression test",
+    "Updated documentation if needed",
+]
+
+
+class TestParseCheckboxes(unittest.TestCase):
+    """Test checkbox extraction from PR bodies."""
+
+    def test_parse_checked_and_unchecked(self):
+        """Test that checked and unchecked items are distinguished."""
+        body = "## Checklist\n- [x] First\n- [ ] Second\n* [X] Third\nNot a - [x] box"
+        
+        self.assertEqual(
+            parse_checkboxes(body),
+            [(True, "First"), (False, "Second"), (True, "Third")]
+        )
+
+    def test_parse_empty_body(self):
+        """Test that empty bodies have no checkboxes."""
+        self.assertEqual(parse_checkboxes(""), [])
+
+
+class TestChecklistMatcher(unittest.TestCase):
+    """Test fuzzy matching of PR items against a checklist."""
+
+    def setUp(self):
+        self.matcher = ChecklistMatcher("role:debugging", ITEMS)
+
+    def test_exact_and_fuzzy_matches(self):
+        """Test that reworded items still match their checklist entry."""
+        body = """
+- [x] Checked project status.json before starting
+- [x] Ran the linting and fixed issues
+- [ ] Added a regression test
+"""
+        result = self.matcher.score(body)
+        
+        self.assertEqual(result.checked, ITEMS[:2])
+        self.assertEqual(result.unchecked, [ITEMS[2]])
+        self.assertEqual(result.missing, [ITEMS[3]])
+        self.assertAlmostEqual(result.score, 0.5)
+
+    def test_plural_wording_matches(self):
+        """Test that items match across singular and plural wording."""
+        result = self.matcher.score("- [x] Added tests\n")
+
+        self.assertEqual(result.checked, [ITEMS[2]])
+
+    def test_unrelated_items_do_not_match(self):
+        """Test that unrelated checkboxes are ignored."""
+        result = self.matcher.score("- [x] Deployed to staging\n- [x] Celebrated")
+        
+        self.assertEqual(result.checked, [])
+        self.assertEqual(len(result.missing), len(ITEMS))
+
+    def test_each_pr_item_matches_once(self):
+        """Test that a single PR item cannot satisfy two checklist items."""
+        matcher = ChecklistMatcher("role:x", ["Added unit tests", "Added integration tests"])
+        result = matcher.score("- [x] Added unit tests")
+        
+        self.assertEqual(result.checked, ["Added unit tests"])
+        self.assertEqual(result.missing, ["Added integration tests"])
+
+    def test_matching_is_deterministic(self):
+        """Test that repeated scoring yields identical results."""
+        body = "- [x] Added test\n- [ ] Added regression test\n- [x] Updated documentation"
+        first = self.matcher.score(body).to_dict()
+        
+        for _ in range(5):
+            self.assertEqual(self.matcher.score(body).to_dict(), first)
+
+    def test_does_not_import_research(self):
+        """Test that scoring does not pay for importing the research package."""
+        tools_dir = Path(__file__).resolve().parent.parent / "tools"
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, checklist_scoring; print('research' in sys.modules)"],
+            cwd=tools_dir, capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+
+
+class TestChecklistScorer(unittest.TestCase):
+    """Test scoring with the repository's checklists."""
+
+    def setUp(self):
+        self.scorer = ChecklistScorer(Path(__file__).resolve().parent.parent)
+
+    def test_score_full_checklist(self):
+        """Test that a fully ticked generated checklist scores 1.0."""
+        from agent_checklists import generate_agent_checklist
+        body = generate_agent_checklist("role:triage").replace("- [ ]", "- [x]")
+        
+        result = self.scorer.score("role:triage", body, pr_number=7)
+        
+        self.assertEqual(result.score, 1.0)
+        self.assertEqual(result.pr_number, 7)
+
+    def test_score_export_in_one_pass(self):
+        """Test batch scoring of an export with mixed record formats."""
+        from agent_checklists import generate_agent_checklist
+        complete = generate_agent_checklist("role:triage").replace("- [ ]", "- [x]")
+        records = load_export([
+            {"number": 1, "body": complete, "labels": [{"name": "role:triage"}]},
+            {"number": 2, "body": generate_agent_checklist("role:triage"), "labels": ["role:triage"]},
+            {"pr_number": 3, "agent_role": "role:triage", "metadata": {"pr_body": complete}},
+            {"number": 4, "body": "No checklist", "labels": []},
+        ])
+        
+        report = self.scorer.score_export(records)
+        
+        self.assertEqual([s["pr_number"] for s in report["scores"]], [1, 2, 3])
+        self.assertEqual(report["skipped"], 1)
+        summary = report["by_role"]["role:triage"]
+        self.assertEqual(summary["prs"], 3)
+        self.assertEqual(summary["fully_complete"], 2)
+        self.assertAlmostEqual(summary["average_score"], 2 / 3, places=3)
+
+    def test_role_from_signature(self):
+        """Test that records without labels use the signature role."""
+        body = (
+            "<!-- AGENT_SIGNATURE: role=role:triage, version=1.0, timestamp=2026-01-15T06:00:00Z -->\n"
+            "- [x] Verified tests and documentation"
+        )
+        report = self.scorer.score_export([{"number": 5, "body": body}])
+        
+        self.assertEqual(report["scores"][0]["agent_role"], "role:triage")
+        self.assertEqual(report["scores"][0]["checked"], ["Verified tests and documentation"])
+
+    def test_load_audit_log_export(self):
+        """Test that audit log files are accepted as exports."""
+        self.assertEqual(load_export({"entries": [{"a": 1}, "bad"]}), [{"a": 1}])
+        self.assertEqual(load_export("garbage"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
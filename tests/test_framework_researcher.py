@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Tests for concurrent framework analysis and framework list files.
+"""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from research import FrameworkAnalysisResearcher, SqliteResearchCache
+from research.framework_researcher import load_frameworks
+from tests.github_fake import start_fake_github
+
+
+class TestFrameworkResearcher(unittest.TestCase):
+    """Test concurrent framework analysis and framework list files"""
+
+    def setUp(self):
+        self.server, self.api_url = start_fake_github(self)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.tmp_dir = Path(self._tmp.name)
+
+    def write_frameworks(self, content):
+        path = self.tmp_dir / "frameworks.yml"
+        path.write_text(content)
+        return str(path)
+
+    def test_fetches_concurrently_in_configured_order(self):
+        """Test that frameworks are fetched in parallel over pooled connections but reported in file order"""
+        names = [f"Framework{n}" for n in range(12)]
+        frameworks_file = self.write_frameworks(
+            "frameworks:\n" + "".join(f"  - {{owner: org, repo: repo{n}, name: {name}}}\n" for n, name in enumerate(names))
+        )
+        # Earlier repositories answer slower, so completion order is reversed
+        self.server.repos_rest = {
+            f"org/repo{n}": {'description': f"Agent framework {n}", 'topics': ['agents'],
+                             'stargazers_count': n, 'delay': 0.05 * (12 - n) / 12}
+            for n in range(12)
+        }
+        researcher = FrameworkAnalysisResearcher(enabled=True, frameworks_file=frameworks_file, max_workers=4)
+
+        with patch.dict('os.environ', {'GITHUB_API_URL': self.api_url}, clear=False):
+            findings = researcher.analyze_frameworks()
+
+        self.assertEqual([f['framework'] for f in findings if f['framework'] != 'comparative'], names)
+        self.assertLessEqual(self.server.connections, 4)
+        self.assertEqual(len(self.server.requests), 12)
+
+    def test_missing_repository_is_skipped(self):
+        """Test that a repository GitHub does not know is skipped with the others kept"""
+        frameworks_file = self.write_frameworks(
+            "- {owner: org, repo: known}\n- {owner: org, repo: gone}\n"
+        )
+        self.server.repos_rest = {'org/known': {'description': 'Agent toolkit', 'topics': []}}
+        researcher = FrameworkAnalysisResearcher(enabled=True, frameworks_file=frameworks_file)
+
+        with patch.dict('os.environ', {'GITHUB_API_URL': self.api_url}, clear=False):
+            findings = researcher.analyze_frameworks()
+
+        self.assertEqual([f['framework'] for f in findings if f['framework'] != 'comparative'], ['known'])
+
+    def test_metadata_cached_in_one_namespace(self):
+        """Test that repository metadata is cached under 'frameworks' only, not again as a GitHub response"""
+        frameworks_file = self.write_frameworks("- {owner: org, repo: known}\n")
+        self.server.repos_rest = {'org/known': {'description': 'Agent toolkit', 'topics': []}}
+        cache = SqliteResearchCache(self.tmp_dir / "cache.sqlite3")
+        self.addCleanup(cache.close)
+        researcher = FrameworkAnalysisResearcher(enabled=True, frameworks_file=frameworks_file, cache=cache)
+
+        with patch.dict('os.environ', {'GITHUB_API_URL': self.api_url}, clear=False):
+            researcher.analyze_frameworks()
+            researcher.analyze_frameworks()
+
+        namespaces = [row[0] for row in cache._db.execute("SELECT namespace FROM entries")]
+        self.assertEqual(namespaces, ['frameworks'])
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_load_frameworks(self):
+        """Test framework list parsing: name defaults, insights and duplicates"""
+        frameworks_file = self.write_frameworks(
+            "- {owner: org, repo: tool}\n"
+            "- {owner: org, repo: helper, name: Helper, title: T, summary: S, application: A}\n"
+            "- {owner: ORG, repo: TOOL}\n"
+        )
+        frameworks = load_frameworks(Path(frameworks_file))
+        self.assertEqual([f['name'] for f in frameworks], ['tool', 'Helper'])
+        self.assertEqual(frameworks[1]['title'], 'T')
+
+        with self.assertRaises(ValueError):
+            load_frameworks(Path(self.write_frameworks("- {owner: org}\n")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+"""
+Tests for the GitHub REST client and batched GraphQL queries.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from research import (
+    FileResearchCache,
+    FrameworkAnalysisResearcher,
+    GitHubAnalysisResearcher,
+    GitHubClient,
+    RateLimitError,
+)
+from research.github_client import GraphQLError, parse_link_header
+from research.github_graphql import fetch_activity, fetch_repositories
+from tests.github_fake import start_fake_github
+
+
+class TestGitHubClient(unittest.TestCase):
+    """Test GitHub pagination, conditional requests and rate limits against a fake server"""
+
+    def setUp(self):
+        self.server, self.api_url = start_fake_github(self)
+        self.server.items = {'issues': [{'number': n} for n in range(250, 0, -1)]}
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache_dir = Path(self._tmp.name)
+
+    def client(self, **kwargs):
+        return GitHubClient("token", api_url=self.api_url, cache=FileResearchCache(self.cache_dir), **kwargs)
+
+    def test_parse_link_header(self):
+        """Test parsing of rel links from a Link header"""
+        links = parse_link_header('<https://x/a?page=2>; rel="next", <https://x/a?page=5>; rel="last"')
+        self.assertEqual(links, {'next': 'https://x/a?page=2', 'last': 'https://x/a?page=5'})
+        self.assertEqual(parse_link_header(None), {})
+
+    def test_fetches_every_page_in_order(self):
+        """Test that all pages are fetched and concatenated in page order"""
+        items = self.client().paginate("repos/o/r/issues", {'state': 'all'})
+        self.assertEqual([item['number'] for item in items], list(range(250, 0, -1)))
+        self.assertEqual(sorted(q['page'] for _, q in self.server.requests[1:]), ['2', '3'])
+        self.assertTrue(all(q['state'] == 'all' for _, q in self.server.requests))
+
+    def test_stop_skips_later_pages(self):
+        """Test that paging stops once the stop callback is satisfied"""
+        items = self.client(max_workers=1).paginate(
+            "repos/o/r/issues", stop=lambda page: page[-1]['number'] <= 150
+        )
+        self.assertEqual(len(items), 200)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_max_pages_bounds_fetching(self):
+        """Test that no more than max_pages pages are requested"""
+        items = self.client().paginate("repos/o/r/issues", max_pages=2)
+        self.assertEqual(len(items), 200)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_conditional_requests_use_cache(self):
+        """Test that unchanged pages are revalidated with ETags and served from cache"""
+        first = self.client().paginate("repos/o/r/issues")
+        client = self.client()
+        self.assertEqual(client.paginate("repos/o/r/issues"), first)
+        self.assertEqual(client.stats['not_modified'], 3)
+
+    def test_connections_are_kept_alive(self):
+        """Test that sequential requests reuse one pooled connection"""
+        client = self.client(max_workers=1)
+        items = client.paginate("repos/o/r/issues")
+        self.assertEqual(len(items), 250)
+        self.assertEqual(client.transport.stats['requests'], 3)
+        self.assertEqual(client.transport.stats['connections'], 1)
+        self.assertEqual(self.server.connections, 1)
+
+    def test_retry_after_is_honoured(self):
+        """Test that a short Retry-After is waited out and the request retried"""
+        self.server.rate_limits = [0]
+        client = self.client()
+        items = client.paginate("repos/o/r/issues", max_pages=1)
+        self.assertEqual(len(items), 100)
+        self.assertEqual(client.stats['rate_limited'], 1)
+
+    def test_long_rate_limit_raises(self):
+        """Test that a rate limit longer than the allowed wait raises"""
+        self.server.rate_limits = [3600]
+        with self.assertRaises(RateLimitError):
+            self.client(max_rate_limit_wait=1).paginate("repos/o/r/issues")
+
+    def test_researcher_fetches_only_the_window(self):
+        """Test that the researcher pages back only as far as the analysis window"""
+        now = datetime.now(timezone.utc)
+
+        def stamp(days):
+            return (now - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        # Newest-updated first, as requested with sort=updated&direction=desc
+        self.server.items['pulls'] = [{'number': n, 'updated_at': stamp(n / 10 + 0.05)} for n in range(1, 501)]
+        researcher = GitHubAnalysisResearcher(
+            "o", "r", "token", api_url=self.api_url, cache_dir=str(self.cache_dir)
+        )
+        researcher.client.max_workers = 1
+
+        prs = researcher._fetch_prs(days_back=15)
+
+        self.assertEqual(len(prs), 149)
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.requests[0][1]['sort'], 'updated')
+
+
+class TestGitHubGraphQL(unittest.TestCase):
+    """Test batched GraphQL fetching against a fake server"""
+
+    def setUp(self):
+        self.server, self.api_url = start_fake_github(self)
+        self.client = GitHubClient("token", api_url=self.api_url)
+
+        now = datetime.now(timezone.utc)
+
+        def stamp(days):
+            return (now - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+        self.since = stamp(15)
+        # Newest-updated first; every third PR merged, every fifth closed unmerged
+        self.server.items = {
+            'pulls': [
+                {'number': n, 'state': 'MERGED' if n % 3 == 0 else 'CLOSED' if n % 5 == 0 else 'OPEN',
+                 'merged': n % 3 == 0, 'mergedAt': stamp(n / 10) if n % 3 == 0 else None,
+                 'updatedAt': stamp(n / 10 + 0.05), 'labels': {'nodes': []}}
+                for n in range(1, 501)
+            ],
+            'issues': [
+                {'number': n, 'state': 'OPEN', 'updatedAt': stamp(n / 10 + 0.05),
+                 'labels': {'nodes': [{'name': 'bug' if n % 2 else 'docs'}]}}
+                for n in range(1, 251)
+            ],
+        }
+
+    def test_activity_in_few_round_trips(self):
+        """Test that PRs and issues share round trips and stop at the window"""
+        prs, issues = fetch_activity(self.client, "o", "r", self.since)
+
+        self.assertEqual(len(prs), 149)
+        self.assertEqual(len(issues), 149)
+        # Two round trips cover 149 PRs and 149 issues (REST needs four)
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(prs[2], {
+            'number': 3, 'state': 'closed', 'merged_at': self.server.items['pulls'][2]['mergedAt'],
+            'updated_at': self.server.items['pulls'][2]['updatedAt'], 'labels': [],
+        })
+        self.assertEqual(issues[0]['labels'], [{'name': 'bug'}])
+
+    def test_repositories_in_one_query(self):
+        """Test that several repositories are fetched in a single request"""
+        self.server.repos = {
+            'a/one': {'description': 'Agents', 'stargazerCount': 5,
+                      'repositoryTopics': {'nodes': [{'topic': {'name': 'ai'}}]}},
+            'b/two': {'description': None, 'stargazerCount': 1, 'repositoryTopics': {'nodes': []}},
+        }
+        infos = fetch_repositories(self.client, [('a', 'one'), ('b', 'two'), ('c', 'missing')])
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(infos[('a', 'one')], {'description': 'Agents', 'topics': ['ai'], 'stargazers_count': 5})
+        self.assertEqual(infos[('b', 'two')]['description'], '')
+        self.assertIsNone(infos[('c', 'missing')])
+
+    def test_query_without_data_raises(self):
+        """Test that a response with only errors raises GraphQLError"""
+        with self.assertRaises(GraphQLError):
+            self.client.graphql("query { viewer { login } }")
+
+    def test_researcher_graphql_mode(self):
+        """Test that the researcher analyzes GraphQL data like REST data"""
+        researcher = GitHubAnalysisResearcher(
+            "o", "r", "token", api_url=self.api_url, cache_dir=None, use_graphql=True
+        )
+        findings = researcher.analyze_patterns(days_back=15)
+
+        pr_finding = next(f for f in findings if 'merge rate' in f['title'])
+        self.assertEqual(pr_finding['metrics']['total_prs'], 149)
+        self.assertEqual(pr_finding['metrics']['merged'], 49)
+        self.assertTrue(all(path == '/graphql' for path, _ in self.server.requests))
+
+    def test_framework_researcher_batches_repositories(self):
+        """Test that framework metadata comes from one GraphQL query"""
+        researcher = FrameworkAnalysisResearcher(enabled=True, github_token="token", use_graphql=True)
+        self.server.repos = {
+            f"{framework['owner']}/{framework['repo']}": {
+                'description': 'Agent framework', 'stargazerCount': 10, 'repositoryTopics': {'nodes': []}
+            }
+            for framework in researcher.frameworks
+        }
+        with patch.dict('os.environ', {'GITHUB_API_URL': self.api_url}, clear=False):
+            os.environ.pop('GITHUB_GRAPHQL_URL', None)
+            findings = researcher.analyze_frameworks()
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(
+            sum(1 for f in findings if f.get('framework') != 'comparative'), len(researcher.frameworks)
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the incremental GitHub store and its rolling window analytics.
+"""
+
+import sys
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from research import (
+    GitHubAnalysisResearcher,
+    GitHubClient,
+    GitHubStore,
+)
+from tests.github_fake import github_stamp, start_fake_github
+
+
+class TestGitHubStore(unittest.TestCase):
+    """Test incremental GitHub sync into the local store and its window analytics"""
+
+    def setUp(self):
+        self.server, self.api_url = start_fake_github(self)
+        self.client = GitHubClient("token", api_url=self.api_url)
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.store = GitHubStore(Path(self._tmp.name) / "store.sqlite3")
+        self.addCleanup(self.store.close)
+        # PRs newest-updated first, issues oldest first, as the sync requests them
+        self.server.items = {
+            'pulls': [{'number': n, 'state': 'closed', 'created_at': github_stamp(n + 1),
+                       'merged_at': github_stamp(n), 'updated_at': github_stamp(n)} for n in range(1, 21)],
+            'issues': [{'number': 100 + n, 'state': 'open', 'updated_at': github_stamp(n)}
+                       for n in range(10, 0, -1)],
+        }
+        self.server.items['issues'].append({'number': 5, 'pull_request': {}, 'updated_at': github_stamp(0)})
+
+    def test_second_sync_fetches_only_updates(self):
+        """Test that the first sync backfills and the next one resumes from the watermarks"""
+        self.assertEqual(self.store.sync(self.client, "o", "r"), {'pulls': 20, 'issues': 10})
+        self.assertEqual(self.store.watermark("o/r", "pulls"), self.server.items['pulls'][0]['updated_at'])
+        # The pull request listed last by the issues endpoint moves the issue watermark too
+        self.assertEqual(self.store.watermark("o/r", "issues"), self.server.items['issues'][-1]['updated_at'])
+
+        watermark = self.store.watermark("o/r", "issues")
+        self.server.items['pulls'].insert(0, {'number': 21, 'state': 'open', 'updated_at': github_stamp(0)})
+        self.server.items['issues'].append({'number': 200, 'state': 'open', 'updated_at': github_stamp(0)})
+        self.server.requests.clear()
+
+        # Items updated exactly at the watermark are fetched again
+        self.assertEqual(self.store.sync(self.client, "o", "r"), {'pulls': 2, 'issues': 1})
+        self.assertEqual(len(self.server.requests), 2)
+        self.assertEqual(self.server.requests[1][1]['since'], watermark)
+        self.assertEqual(len(self.store.items("o/r", "pulls", github_stamp(90))), 21)
+        self.assertEqual(self.store.items("o/r", "issues", github_stamp(0.5))[0]['number'], 200)
+
+    def test_pull_request_only_pages_advance_issue_watermark(self):
+        """Test that issue listings holding only pull requests still move the issue watermark"""
+        self.server.items['issues'] = [
+            {'number': n, 'pull_request': {}, 'updated_at': github_stamp(n)} for n in range(5, 0, -1)
+        ]
+
+        self.assertEqual(self.store.sync(self.client, "o", "r")['issues'], 0)
+        watermark = self.store.watermark("o/r", "issues")
+        self.assertEqual(watermark, self.server.items['issues'][-1]['updated_at'])
+
+        self.server.requests.clear()
+        self.store.sync(self.client, "o", "r")
+        self.assertEqual(self.server.requests[-1][1]['since'], watermark)
+
+    def test_window_stats(self):
+        """Test merge rates, per-label merge rates and time-to-merge percentiles per window"""
+        def pr(number, days_ago, merge_hours=None, labels=()):
+            created = datetime.now(timezone.utc) - timedelta(days=days_ago)
+            merged = (created + timedelta(hours=merge_hours)).strftime('%Y-%m-%dT%H:%M:%SZ') if merge_hours else None
+            return {'number': number, 'state': 'closed', 'created_at': github_stamp(days_ago),
+                    'updated_at': merged or github_stamp(days_ago), 'merged_at': merged,
+                    'labels': [{'name': label} for label in labels]}
+
+        self.store.upsert("o/r", "pulls", [
+            pr(1, 2, 1, ['bug']), pr(2, 3, 2, ['bug']), pr(3, 4, None, ['bug']), pr(4, 5, 10),
+            pr(5, 20, 100, ['docs']), pr(6, 60),
+        ])
+        self.store.upsert("o/r", "issues", [
+            {'number': 10, 'state': 'open', 'updated_at': github_stamp(1), 'labels': [{'name': 'bug'}]},
+        ])
+
+        stats = self.store.rolling_stats("o/r")
+
+        self.assertEqual(list(stats), ['7d', '30d', '90d'])
+        week = stats['7d']
+        self.assertEqual((week['total_prs'], week['merged'], week['closed_unmerged']), (4, 3, 1))
+        self.assertEqual(week['merge_rate'], 75.0)
+        self.assertEqual(week['label_merge_rates']['bug']['total'], 3)
+        self.assertAlmostEqual(week['label_merge_rates']['bug']['merge_rate'], 200 / 3)
+        self.assertAlmostEqual(week['time_to_merge_hours']['p50'], 2, places=2)
+        self.assertAlmostEqual(week['time_to_merge_hours']['p90'], 10, places=2)
+        self.assertEqual(week['top_issue_labels'], {'bug': 1})
+        self.assertEqual(stats['30d']['label_merge_rates']['docs']['merge_rate'], 100.0)
+        self.assertEqual(stats['90d']['total_prs'], 6)
+
+    def test_researcher_store_mode(self):
+        """Test that the researcher analyzes the synced store and reports rolling windows"""
+        store_path = str(Path(self._tmp.name) / "researcher.sqlite3")
+        for pull in self.server.items['pulls'][10:]:
+            pull['merged_at'] = None
+
+        def analyze():
+            return GitHubAnalysisResearcher(
+                "o", "r", "token", api_url=self.api_url, cache_dir=None, store_path=store_path
+            ).analyze_patterns(days_back=30)
+
+        findings = analyze()
+        pr_finding = next(f for f in findings if 'merge rate' in f['title'])
+        self.assertEqual(pr_finding['metrics']['total_prs'], 20)
+        self.assertEqual(pr_finding['metrics']['windows']['30d']['merged'], 10)
+
+        # A failed sync falls back to the stored data
+        self.server.items = {}
+        self.server.rate_limits = [0] * 20
+        with patch('time.sleep'):
+            self.assertEqual(analyze()[0]['metrics']['total_prs'], 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Tests for parallel quality bar compliance checks."""
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import sys
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+import quality_bar_audit
+from quality_bar_audit import (
+    check_quality_bar,
+    check_quality_bar_compliance,
+    count_lines,
+    missing_sections,
+)
+
+
+class QualityBarTestCase(unittest.TestCase):
+    """Base class providing a temporary directory for artifacts."""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, name: str, content: str) -> Path:
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8", newline="")
+        return path
+
+
+class TestCountLines(QualityBarTestCase):
+    """Test byte-based line counting."""
+
+    def test_matches_text_mode_iteration(self):
+        """Test that counts match iterating the file in text mode."""
+        samples = ["", "a", "a\n", "a\nb", "a\r\nb\r\n", "a\rb\rc", "\n\n\n"]
+        for index, content in enumerate(samples):
+            path = self.write(f"sample{index}.py", content)
+            with open(path, "r", encoding="utf-8") as f:
+                expected = sum(1 for _ in f)
+            self.assertEqual(count_lines(path), expected, repr(content))
+
+
+class TestMissingSections(QualityBarTestCase):
+    """Test streaming section detection."""
+
+    def test_reports_missing_sections_in_order(self):
+        """Test that only absent sections are reported."""
+        path = self.write("spec.md", "# Spec\n## Goal\ntext\n## Non-goals\n")
+        
+        self.assertEqual(
+            missing_sections(path, ["## Goal", "## Scope", "## Non-goals"]),
+            ["## Scope"]
+        )
+
+
+class TestCheckQualityBar(QualityBarTestCase):
+    """Test the structured quality bar check."""
+
+    def test_separates_errors_and_warnings(self):
+        """Test that warnings are not reported as errors."""
+        warn = self.write("warn.py", "x = 1\n" * 500)
+        fail = self.write("fail.py", "x = 1\n" * 900)
+        
+        result = check_quality_bar("role:swe", [warn, fail])
+        
+        self.assertFalse(result.meets_standards)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn("fail.py", result.errors[0])
+        self.assertEqual(len(result.warnings), 1)
+        self.assertIn("warn.py", result.warnings[0])
+
+    def test_warnings_only_meets_standards(self):
+        """Test that a file approaching the limit still meets standards."""
+        path = self.write("warn.py", "x = 1\n" * 500)
+        
+        result = check_quality_bar("role:swe", [path])
+        
+        self.assertTrue(result.meets_standards)
+        self.assertEqual(len(result.warnings), 1)
+
+    def test_small_files_are_not_read(self):
+        """Test that files too small to exceed the warning limit are skipped."""
+        path = self.write("tiny.py", "\n" * 400)
+        
+        with patch.object(quality_bar_audit, "count_lines") as counter:
+            result = check_quality_bar("role:swe", [path])
+            counter.assert_not_called()
+        self.assertEqual(result.warnings, [])
+
+    def test_parallel_results_keep_input_order(self):
+        """Test that thread-pooled checks report in artifact order."""
+        paths = [
+            self.write(f"file{index:02d}.py", "x = 1\n" * 850)
+            for index in range(quality_bar_audit.PARALLEL_THRESHOLD * 3)
+        ]
+        paths.insert(5, self.root / "missing.py")
+        
+        result = check_quality_bar("role:swe", paths, max_workers=4)
+        
+        self.assertEqual(len(result.errors), len(paths))
+        self.assertIn("Artifact not found", result.errors[5])
+        self.assertIn("file00.py", result.errors[0])
+        self.assertIn(f"file{len(paths) - 2:02d}.py", result.errors[-1])
+
+    def test_required_sections_for_architect(self):
+        """Test that architecture.md sections are checked for architect role."""
+        path = self.write("architecture.md", "## Overview\n## Tradeoffs\n")
+        
+        result = check_quality_bar("role:architect", [path])
+        
+        self.assertEqual(len(result.errors), 2)
+        self.assertTrue(any("Components & interfaces" in e for e in result.errors))
+        self.assertTrue(check_quality_bar("role:swe", [path]).meets_standards)
+
+
+class TestLegacyCompliance(QualityBarTestCase):
+    """Test the flat (bool, issues) interface."""
+
+    def test_warning_prefix_preserved(self):
+        """Test that warnings keep the WARNING: prefix in the flat list."""
+        path = self.write("warn.py", "x = 1\n" * 500)
+        
+        meets_standards, issues = check_quality_bar_compliance("role:swe", [path])
+        
+        self.assertFalse(meets_standards)
+        self.assertTrue(issues[0].startswith("WARNING: "))
+
+
+    def test_issues_keep_check_order(self):
+        """Test that errors and warnings stay interleaved in artifact order."""
+        spec = self.write("spec.md", "## Goal\n## Scope\n## Non-goals\n")
+        warn = self.write("warn.py", "x = 1\n" * 500)
+        fail = self.write("fail.py", "x = 1\n" * 900)
+        warn_again = self.write("warn2.py", "x = 1\n" * 450)
+        
+        _, issues = check_quality_bar_compliance("role:spec", [spec, warn, fail, warn_again])
+        
+        self.assertEqual(issues, [
+            f"WARNING: File {warn} has 500 lines (approaching 800 line limit)",
+            f"File {fail} has 900 lines (exceeds 800 line quality bar limit)",
+            f"WARNING: File {warn_again} has 450 lines (approaching 800 line limit)",
+            f"Required section '## Acceptance criteria' missing in {spec}",
+        ])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared token-bucket rate limiter.
+"""
+
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from research import TokenBucket
+
+
+class FakeClock:
+    """Manual clock; sleeping advances it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test the shared token-bucket rate limiter"""
+
+    def test_burst_then_rate(self):
+        """Test that a full bucket allows a burst, then spaces requests at the rate"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=0.5, burst=3, clock=clock, sleep=clock.sleep)
+        for _ in range(5):
+            self.assertTrue(bucket.acquire())
+        self.assertEqual(clock.sleeps, [2.0, 2.0])
+
+    def test_refills_while_idle(self):
+        """Test that idle time refills the bucket up to its capacity"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=2, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        bucket.acquire()
+        clock.now += 100
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 1.0)
+
+    def test_timeout_reserves_nothing(self):
+        """Test that a wait longer than the timeout fails without taking tokens"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=1, clock=clock, sleep=clock.sleep)
+        bucket.acquire()
+        self.assertFalse(bucket.acquire(timeout=0.5))
+        self.assertEqual(bucket.reserve(), 1.0)
+
+    def test_concurrent_callers_share_the_rate(self):
+        """Test that threads waiting on one bucket are spaced out, not serialized behind fixed sleeps"""
+        bucket = TokenBucket(rate=50, burst=2)
+        started = time.monotonic()
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Two immediately, four more at 50/s: about 0.08s in total
+        self.assertGreaterEqual(time.monotonic() - started, 0.07)
+        self.assertLess(time.monotonic() - started, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
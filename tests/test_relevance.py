@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for batched relevance scoring and near-duplicate removal.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from research import FindingMatrix, remove_near_duplicates
+
+
+class TestRelevance(unittest.TestCase):
+    """Test batched relevance scoring and near-duplicate removal"""
+
+    FINDINGS = [
+        {'title': 'AI agent orchestration', 'summary': 'Autonomous LLM agents with workflow handoffs'},
+        {'title': 'Orchestrating AI agents', 'summary': 'Autonomous LLM agent workflow handoffs'},
+        {'title': 'Cooking pasta', 'summary': 'Boil water and add salt'},
+        {'title': 'ai agent orchestration ', 'summary': 'A different summary about quality gates'},
+    ]
+
+    def test_keyword_scores(self):
+        """Test that keyword relevance counts whole words, not substrings"""
+        matrix = FindingMatrix(self.FINDINGS + [{'title': 'Maintaining railways', 'summary': ''}])
+
+        scores = matrix.keyword_scores()
+
+        self.assertEqual(scores[0], 1.0)
+        self.assertEqual(scores[2], 0.0)
+        # 'ai' inside 'maintaining' or 'railways' does not count
+        self.assertEqual(scores[4], 0.0)
+
+    def test_rows_are_normalized(self):
+        """Test that every non-empty row has unit length, so dot products are cosines"""
+        matrix = FindingMatrix(self.FINDINGS)
+        for row in range(len(matrix)):
+            self.assertAlmostEqual(sum(weight * weight for _, weight in matrix.row(row)), 1.0)
+
+    def test_query_scores(self):
+        """Test that findings closer to the query score higher"""
+        scores = FindingMatrix(self.FINDINGS).query_scores("agent orchestration workflow")
+        self.assertGreater(scores[0], scores[2])
+        self.assertEqual(scores[2], 0.0)
+        self.assertEqual(FindingMatrix(self.FINDINGS).query_scores("unknown words"), [0.0] * 4)
+
+    def test_remove_near_duplicates(self):
+        """Test that rewordings and repeated titles are dropped, keeping the first occurrence"""
+        matrix = FindingMatrix(self.FINDINGS)
+        self.assertEqual(matrix.near_duplicates(), [1])
+
+        unique = remove_near_duplicates(self.FINDINGS)
+
+        self.assertEqual([f['title'] for f in unique], ['AI agent orchestration', 'Cooking pasta'])
+        self.assertEqual(remove_near_duplicates(self.FINDINGS, threshold=1.01), [
+            self.FINDINGS[0], self.FINDINGS[1], self.FINDINGS[2]
+        ])
+        self.assertEqual(remove_near_duplicates([]), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared research cache stores.
+"""
+
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from research import (
+    FileResearchCache,
+    ResearchCache,
+    SqliteResearchCache,
+    WebSearchResearcher,
+    open_research_cache,
+)
+
+
+class TestResearchCache(unittest.TestCase):
+    """Test the shared research cache stores"""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cache_dir = Path(self._tmp.name)
+
+    def stores(self, **kwargs):
+        files = FileResearchCache(self.cache_dir / "files", **kwargs)
+        sqlite = SqliteResearchCache(self.cache_dir / "cache.sqlite3", **kwargs)
+        self.addCleanup(sqlite.close)
+        return [files, sqlite]
+
+    def test_round_trip_by_namespace(self):
+        """Test that values are stored per namespace and key"""
+        for store in self.stores():
+            with self.subTest(store=type(store).__name__):
+                store.put('web', 'query', [{'title': 'Finding'}])
+                self.assertEqual(store.get('web', 'query'), [{'title': 'Finding'}])
+                self.assertIsNone(store.get('papers', 'query'))
+                self.assertIsNone(store.get('web', 'other'))
+
+    def test_per_source_ttl(self):
+        """Test that entries expire after their source's TTL only"""
+        for store in self.stores(ttls={'web': 60, 'papers': 3600}):
+            with self.subTest(store=type(store).__name__):
+                store.put('web', 'query', 1)
+                store.put('papers', 'query', 2)
+                with patch('research.cache.time.time', return_value=time.time() + 120):
+                    self.assertIsNone(store.get('web', 'query'))
+                    self.assertEqual(store.get('papers', 'query'), 2)
+
+    def test_evicts_least_recently_used(self):
+        """Test that the store stays under max_bytes by evicting least recently used entries"""
+        value = 'x' * 400
+        for store in self.stores(max_bytes=2000):
+            with self.subTest(store=type(store).__name__):
+                clock = time.time()
+                for n in range(4):
+                    with patch('research.cache.time.time', return_value=clock + n):
+                        store.put('web', f'q{n}', value)
+                # Touch the oldest entry so the second oldest is evicted instead
+                with patch('research.cache.time.time', return_value=clock + 4):
+                    self.assertEqual(store.get('web', 'q0'), value)
+                with patch('research.cache.time.time', return_value=clock + 5):
+                    store.put('web', 'q4', value)
+
+                self.assertIsNone(store.get('web', 'q1'))
+                for key in ('q0', 'q2', 'q3', 'q4'):
+                    self.assertEqual(store.get('web', key), value)
+
+    def test_sqlite_keeps_running_size_total(self):
+        """Test that the SQLite store tracks its size without summing the table on each write"""
+        store = SqliteResearchCache(self.cache_dir / "cache.sqlite3", max_bytes=2000)
+        self.addCleanup(store.close)
+        statements = []
+        store._db.set_trace_callback(statements.append)
+        for n in range(10):
+            store.put('web', f'q{n % 6}', 'x' * (300 + n))
+
+        self.assertFalse([s for s in statements if 'SUM(' in s])
+        total = store._db.execute("SELECT size FROM totals").fetchone()[0]
+        self.assertEqual(total, store._db.execute("SELECT SUM(size) FROM entries").fetchone()[0])
+        self.assertLessEqual(total, 2000)
+
+    def test_store_must_implement_get_and_put(self):
+        """Test that a store class missing get() or put() cannot be instantiated"""
+        class GetOnly(ResearchCache):
+            def get(self, namespace, key):
+                return None
+
+        with self.assertRaises(TypeError):
+            GetOnly()
+
+    def test_sqlite_is_a_single_file(self):
+        """Test that the SQLite store keeps every entry in one database file"""
+        store = open_research_cache(str(self.cache_dir), 'sqlite')
+        self.addCleanup(store.close)
+        for n in range(20):
+            store.put('web', f'q{n}', n)
+        self.assertEqual(sorted(p.name for p in self.cache_dir.iterdir() if p.suffix == '.sqlite3'),
+                         ['research-cache.sqlite3'])
+        self.assertEqual(store.get('web', 'q7'), 7)
+
+    def test_off_disables_caching(self):
+        """Test that the 'off' backend opens no store"""
+        self.assertIsNone(open_research_cache(str(self.cache_dir), 'off'))
+        with self.assertRaises(ValueError):
+            open_research_cache(str(self.cache_dir), 'redis')
+
+    def test_researcher_reuses_cached_results(self):
+        """Test that a researcher answers repeated queries from the shared cache"""
+        store = FileResearchCache(self.cache_dir)
+        first = WebSearchResearcher(enabled=True, cache=store)
+        findings = first.search_best_practices()
+
+        second = WebSearchResearcher(enabled=True, cache=store)
+        with patch.object(second, '_perform_search', side_effect=AssertionError("not cached")):
+            self.assertEqual(second.search_best_practices(), findings)
+        self.assertTrue(list((self.cache_dir / "web").glob("*.json")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Tests for the concurrent research runner and researcher plugins.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from research import (
+    ResearchContext,
+    ResearcherPlugin,
+    ResearchTask,
+    discover_plugins,
+    run_research,
+    select_plugins,
+    stream_research,
+)
+
+
+class TestRunResearch(unittest.TestCase):
+    """Test concurrent execution of research sources"""
+
+    def test_no_tasks_returns_empty(self):
+        """Test that running no tasks returns no results"""
+        self.assertEqual(run_research([]), [])
+
+    def test_results_keep_task_order(self):
+        """Test that results come back in task order regardless of finish order"""
+        def source(name, delay):
+            def run():
+                time.sleep(delay)
+                return [{'title': name}]
+            return run
+
+        results = run_research([
+            ResearchTask("slow", source("slow", 0.2)),
+            ResearchTask("fast", source("fast", 0.0)),
+        ])
+
+        self.assertEqual([r.name for r in results], ["slow", "fast"])
+        self.assertEqual(results[0].findings, [{'title': 'slow'}])
+        self.assertTrue(all(r.ok for r in results))
+
+    def test_sources_run_concurrently(self):
+        """Test that the phase takes as long as the slowest source, not the sum"""
+        barrier = threading.Barrier(3, timeout=2)
+
+        def run():
+            # Only passes if all three sources are running at once
+            barrier.wait()
+            return []
+
+        results = run_research([ResearchTask(f"s{i}", run) for i in range(3)])
+
+        self.assertTrue(all(r.ok for r in results), [r.error for r in results])
+
+    def test_source_timeout(self):
+        """Test that a slow source times out without holding up the others"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        started = time.monotonic()
+        results = run_research([
+            ResearchTask("hung", lambda: release.wait(5) and []),
+            ResearchTask("quick", lambda: [{'title': 'ok'}]),
+        ], source_timeout=0.2)
+        elapsed = time.monotonic() - started
+
+        self.assertTrue(results[0].timed_out)
+        self.assertEqual(results[0].findings, [])
+        self.assertIn("timed out", results[0].error)
+        self.assertTrue(results[1].ok)
+        self.assertEqual(len(results[1].findings), 1)
+        self.assertLess(elapsed, 2)
+
+    def test_task_timeout_overrides_default(self):
+        """Test that a per-task timeout takes precedence over the runner default"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        results = run_research(
+            [ResearchTask("hung", lambda: release.wait(5) and [], timeout=0.1)],
+            source_timeout=None
+        )
+
+        self.assertTrue(results[0].timed_out)
+
+    def test_global_deadline(self):
+        """Test that the global deadline stops sources still running"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        started = time.monotonic()
+        results = run_research([
+            ResearchTask("hung", lambda: release.wait(5) and []),
+        ], source_timeout=10, deadline=0.2)
+
+        self.assertTrue(results[0].timed_out)
+        self.assertIn("deadline", results[0].error)
+        self.assertLess(time.monotonic() - started, 2)
+
+    def test_source_error_is_isolated(self):
+        """Test that a failing source reports its error and others still succeed"""
+        def broken():
+            raise RuntimeError("network down")
+
+        results = run_research([
+            ResearchTask("broken", broken),
+            ResearchTask("fine", lambda: [{'title': 'ok'}]),
+        ])
+
+        self.assertFalse(results[0].ok)
+        self.assertEqual(results[0].error, "network down")
+        self.assertFalse(results[0].timed_out)
+        self.assertTrue(results[1].ok)
+
+
+class SleepyPlugin(ResearcherPlugin):
+    """Plugin making blocking calls that each take a while"""
+
+    def __init__(self, name, calls=1, delay=0.0, max_concurrency=1, timeout=None):
+        self.name = name
+        self.calls = calls
+        self.delay = delay
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def call(self, index):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return {'title': f"{self.name} {index}"}
+
+    async def run(self, context):
+        return await asyncio.gather(*(context.run_blocking(self.call, i) for i in range(self.calls)))
+
+
+class TestResearcherPlugins(unittest.TestCase):
+    """Test researcher plugins, their limits, discovery and streamed results"""
+
+    def test_plugins_and_tasks_run_together(self):
+        """Test that async plugins and blocking tasks run in one phase, in task order"""
+        results = run_research([SleepyPlugin("plugin", calls=2), ResearchTask("task", lambda: [{'title': 'ok'}])])
+
+        self.assertEqual([r.name for r in results], ["plugin", "task"])
+        self.assertEqual(results[0].findings, [{'title': 'plugin 0'}, {'title': 'plugin 1'}])
+        self.assertTrue(all(r.ok for r in results))
+
+    def test_concurrency_limit_per_plugin(self):
+        """Test that a plugin never has more blocking calls in flight than its limit"""
+        narrow = SleepyPlugin("narrow", calls=6, delay=0.02, max_concurrency=2)
+        wide = SleepyPlugin("wide", calls=6, delay=0.02, max_concurrency=6)
+
+        run_research([narrow, wide])
+
+        self.assertEqual(narrow.peak, 2)
+        self.assertEqual(wide.peak, 6)
+
+    def test_plugin_timeout_overrides_default(self):
+        """Test that a plugin's own timeout takes precedence over the runner default"""
+        results = run_research([SleepyPlugin("slow", delay=0.5, timeout=0.1)], source_timeout=None)
+        self.assertTrue(results[0].timed_out)
+
+    def test_results_stream_in_completion_order(self):
+        """Test that each result is yielded as soon as its source finishes"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        received = []
+
+        for result in stream_research([
+            ResearchTask("slow", lambda: release.wait(5) and [{'title': 'slow'}]),
+            ResearchTask("fast", lambda: [{'title': 'fast'}]),
+        ]):
+            received.append(result.name)
+            # The slow source is still running when the fast one is handed over
+            release.set()
+
+        self.assertEqual(received, ["fast", "slow"])
+
+    def test_context_is_shared(self):
+        """Test that plugins receive the shared context, bound to their own limits"""
+        seen = {}
+
+        class Probe(ResearcherPlugin):
+            name = 'probe'
+            max_concurrency = 3
+
+            async def run(self, context):
+                seen['context'] = context
+                return []
+
+        context = ResearchContext(repository='o/r', options={'flag': True})
+        run_research([Probe()], context=context)
+
+        self.assertEqual(seen['context'].repository, 'o/r')
+        self.assertEqual(seen['context'].options, {'flag': True})
+        self.assertEqual(seen['context'].max_concurrency, 3)
+
+    def test_plugin_must_implement_run(self):
+        """Test that a plugin class without run() cannot be instantiated"""
+        class Incomplete(ResearcherPlugin):
+            name = 'incomplete'
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_discover_plugins_from_entry_points(self):
+        """Test that entry point plugins are loaded, and broken or clashing ones skipped"""
+        class EntryPoint:
+            def __init__(self, name, target):
+                self.name = name
+                self.target = target
+
+            def load(self):
+                if isinstance(self.target, Exception):
+                    raise self.target
+                return self.target
+
+        class Extra(ResearcherPlugin):
+            name = 'extra'
+
+            async def run(self, context):
+                return [{'title': 'extra'}]
+
+        class Clash(Extra):
+            name = 'web'
+
+        entry_points = [
+            EntryPoint('extra', Extra),
+            EntryPoint('broken', ImportError("missing dependency")),
+            EntryPoint('clash', Clash),
+            EntryPoint('not-a-plugin', object()),
+        ]
+        with patch('research.plugins.entry_points', return_value=entry_points):
+            plugins = discover_plugins([SleepyPlugin('web')])
+            selected = select_plugins(['extra', 'unknown'], ResearchContext())
+
+        self.assertEqual(list(plugins), ['web', 'extra'])
+        self.assertIsInstance(plugins['web'], SleepyPlugin)
+        self.assertEqual([p.name for p in selected], ['extra'])
+
+    def test_select_plugins_skips_unavailable(self):
+        """Test that built-in plugins that cannot run with the context are skipped"""
+        with patch('research.plugins.entry_points', return_value=[]):
+            selected = select_plugins(['github', 'web'], ResearchContext(github_token=None))
+            with_token = select_plugins(['github'], ResearchContext(github_token='t', repository='o/r'))
+
+        self.assertEqual([p.name for p in selected], ['web'])
+        self.assertEqual([p.name for p in with_token], ['github'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for recording research HTTP traffic to cassettes and replaying it.
+"""
+
+import json
+import sys
+import tempfile
+import unittest
+import urllib.error
+from datetime import datetime, timezone
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from research import (
+    FileResearchCache,
+    FrameworkAnalysisResearcher,
+    GitHubAnalysisResearcher,
+    GitHubClient,
+    RecordingTransport,
+    ReplayTransport,
+)
+from research.http_pool import ConnectionPool
+from research.transport import Transport
+from tests.github_fake import start_fake_github
+
+
+class TestTransport(unittest.TestCase):
+    """Test recording research HTTP traffic to cassettes and replaying it offline"""
+
+    def setUp(self):
+        self.server, self.api_url = start_fake_github(self)
+        self.server.items = {'issues': [{'number': n} for n in range(250, 0, -1)]}
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.cassette = Path(self._tmp.name) / "github.json"
+
+    def record(self, run):
+        transport = RecordingTransport(self.cassette, ConnectionPool())
+        result = run(transport)
+        transport.close()
+        return result
+
+    def test_replay_matches_recording_offline(self):
+        """Test that a replayed run returns the recorded data without touching the network"""
+        recorded = self.record(
+            lambda transport: GitHubClient("secret-token", api_url=self.api_url, transport=transport)
+            .paginate("repos/o/r/issues")
+        )
+        self.server.requests.clear()
+
+        replay = ReplayTransport(self.cassette)
+        replayed = GitHubClient(None, api_url=self.api_url, transport=replay).paginate("repos/o/r/issues")
+
+        self.assertEqual(replayed, recorded)
+        self.assertEqual(self.server.requests, [])
+        self.assertEqual(replay.stats['requests'], 3)
+        self.assertGreater(replay.stats['recorded_seconds'], 0)
+        # Request headers, and with them the token, stay out of the cassette
+        self.assertNotIn("secret-token", self.cassette.read_text())
+
+    def test_conditional_requests_replay_not_modified(self):
+        """Test that revalidating a cached response against the cassette yields 304"""
+        self.record(
+            lambda transport: GitHubClient("token", api_url=self.api_url, transport=transport)
+            .paginate("repos/o/r/issues")
+        )
+        cache = FileResearchCache(Path(self._tmp.name) / "cache")
+        replay = ReplayTransport(self.cassette)
+
+        first = GitHubClient(None, api_url=self.api_url, cache=cache, transport=replay).paginate("repos/o/r/issues")
+        client = GitHubClient(None, api_url=self.api_url, cache=cache, transport=replay)
+
+        self.assertEqual(client.paginate("repos/o/r/issues"), first)
+        self.assertEqual(client.stats['not_modified'], 3)
+
+    def test_transport_must_implement_request(self):
+        """Test that a transport class without request() cannot be instantiated"""
+        class Incomplete(Transport):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_errors_are_replayed(self):
+        """Test that recorded HTTP errors replay as errors and unrecorded requests fail like a network outage"""
+        frameworks = Path(self._tmp.name) / "frameworks.yml"
+        frameworks.write_text("- {owner: org, repo: known}\n- {owner: org, repo: gone}\n")
+        self.server.repos_rest = {'org/known': {'description': 'Agent toolkit', 'topics': []}}
+
+        def analyze(transport):
+            researcher = FrameworkAnalysisResearcher(frameworks_file=str(frameworks), transport=transport)
+            with patch.dict('os.environ', {'GITHUB_API_URL': self.api_url}, clear=False):
+                return researcher.analyze_frameworks()
+
+        recorded = self.record(analyze)
+        replay = ReplayTransport(self.cassette)
+
+        self.assertEqual(analyze(replay), recorded)
+        self.assertEqual([f['framework'] for f in recorded if f['framework'] != 'comparative'], ['known'])
+        with self.assertRaises(urllib.error.URLError):
+            replay.request('GET', f"{self.api_url}/repos/org/other")
+        self.assertEqual(replay.stats['missing'], 1)
+
+    def test_researcher_replays_without_token(self):
+        """Test that GitHub pattern analysis runs from a cassette without credentials"""
+        now = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        self.server.items = {'pulls': [{'number': n, 'state': 'closed', 'merged_at': None, 'updated_at': now}
+                                       for n in range(10)]}
+
+        def analyze(token, transport):
+            return GitHubAnalysisResearcher(
+                "o", "r", token, api_url=self.api_url, cache_dir=None, transport=transport
+            ).analyze_patterns()
+
+        recorded = self.record(lambda transport: analyze("token", transport))
+
+        self.assertEqual(analyze(None, ReplayTransport(self.cassette)), recorded)
+        self.assertEqual(recorded[0]['metrics']['merge_rate'], 0)
+
+    def test_invalid_cassette(self):
+        """Test that unreadable or foreign files are rejected"""
+        self.cassette.write_text(json.dumps({'interactions': []}))
+        with self.assertRaises(ValueError):
+            ReplayTransport(self.cassette)
+        with self.assertRaises(ValueError):
+            ReplayTransport(Path(self._tmp.name) / "missing.json")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,10 +5,15 @@ This module validates the self-improvement analyzer including external research
 """
 
 import json
+import os
+import tempfile
 import unittest
 import sys
+from datetime import datetime, timezone
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
+
+import yaml
 
 # Add tools directory to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
@@ -18,11 +23,14 @@ from self_improvement_analyzer import (
     RetrospectiveAnalyzer,
     ImprovementProposer,
 )
+from analysis import AnalysisState
+from analysis import loader as analysis_loader
 from research import (
     WebSearchResearcher,
     GitHubAnalysisResearcher,
     PaperResearcher,
     FrameworkAnalysisResearcher,
+    GitHubClient,
 )
 
 
@@ -50,6 +58,94 @@ class TestFeedbackAnalyzer(unittest.TestCase):
             filename = item.get('_filename', '')
             self.assertNotIn('TEMPLATE', filename)
 
+    def test_minhash_similarity_clusters_duplicates(self):
+        """Test that the minhash engine collapses near-identical feedback"""
+        analyzer = FeedbackAnalyzer(self.feedback_dir, similarity='minhash', similarity_threshold=0.6)
+        text = "the validator rejects valid status json files when the project name has dashes"
+        analyzer.feedback_items = [
+            {'_filename': f'{i}.yaml', 'category': 'tool_limitation', 'title': 'Validator bug',
+             'description': text + (' again' if i % 2 else '')}
+            for i in range(4)
+        ] + [{'_filename': 'other.yaml', 'category': 'tool_limitation', 'title': 'Docs', 'description': 'unrelated'}]
+        groups = analyzer.analyze_patterns()['related_groups']
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(groups[0]['count'], 4)
+        self.assertEqual(groups[0]['title'], 'Validator bug')
+
+    def test_state_only_reads_new_feedback(self):
+        """Test that with persisted state a day's run reads only new files, restoring the rest"""
+        with tempfile.TemporaryDirectory() as tmp:
+            feedback_dir = Path(tmp) / "feedback"
+            feedback_dir.mkdir()
+            cache_dir = Path(tmp) / "cache"
+            for day in range(1, 5):
+                (feedback_dir / f"2026-01-0{day}-item.yaml").write_text(yaml.safe_dump({
+                    'category': 'tool_limitation', 'severity': 'high', 'title': f'Validator bug {day}',
+                    'description': 'validation failed', 'proposed_solution': f'Fix {day}',
+                }))
+
+            def run(since_day):
+                state = AnalysisState(cache_dir / "state.json", {})
+                analyzer = FeedbackAnalyzer(feedback_dir, cache_dir=cache_dir)
+                analyzer.load_feedback(datetime(2026, 1, since_day, tzinfo=timezone.utc), state)
+                analysis = analyzer.analyze_patterns(state)
+                state.save()
+                return analyzer, analysis
+
+            run(1)
+            (feedback_dir / "2026-01-05-item.yaml").write_text(yaml.safe_dump({
+                'category': 'tool_limitation', 'title': 'Validator bug 5', 'description': 'validation failed'
+            }))
+            with patch('analysis.loader.FeedbackParseCache.get', side_effect=AssertionError("read")), \
+                    patch('analysis.loader.parse_feedback_file', wraps=analysis_loader.parse_feedback_file) as parse:
+                analyzer, analysis = run(2)
+
+            parse.assert_called_once()
+            self.assertEqual(analyzer.last_delta, {'added': 1, 'changed': 0, 'removed': 1})
+            self.assertEqual([item['_filename'][:10] for item in analyzer.feedback_items],
+                             ['2026-01-02', '2026-01-03', '2026-01-04', '2026-01-05'])
+            self.assertEqual(analysis['related_groups'][0]['count'], 4)
+            self.assertEqual(analyzer.get_top_issues(1)[0]['proposed_solution'], 'Fix 2')
+
+    def test_new_mtimes_keep_the_append_only_path(self):
+        """Test that files only touched since the last run (as on a fresh checkout) count as unchanged"""
+        with tempfile.TemporaryDirectory() as tmp:
+            feedback_dir = Path(tmp) / "feedback"
+            feedback_dir.mkdir()
+            cache_dir = Path(tmp) / "cache"
+
+            def write(day):
+                (feedback_dir / f"2026-01-0{day}-item.yaml").write_text(yaml.safe_dump({
+                    'category': 'tool_limitation', 'title': f'Validator bug {day}', 'description': 'validation failed'
+                }))
+
+            def run():
+                state = AnalysisState(cache_dir / "state.json", {})
+                analyzer = FeedbackAnalyzer(feedback_dir, cache_dir=cache_dir)
+                analyzer.load_feedback(None, state)
+                analysis = analyzer.analyze_patterns(state)
+                state.save()
+                return analyzer, analysis
+
+            for day in range(1, 4):
+                write(day)
+            run()
+            for path in feedback_dir.iterdir():
+                os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10**9))
+            write(4)
+            with patch('analysis.incremental.AnalysisState._regroup', side_effect=AssertionError("regrouped")), \
+                    patch('analysis.loader.parse_feedback_file', wraps=analysis_loader.parse_feedback_file) as parse:
+                analyzer, analysis = run()
+
+            parse.assert_called_once()
+            self.assertEqual(analyzer.last_delta, {'added': 1, 'changed': 0, 'removed': 0})
+            self.assertEqual(analysis['related_groups'][0]['count'], 4)
+
+    def test_unknown_similarity_engine_rejected(self):
+        """Test that an unknown similarity engine raises ValueError"""
+        with self.assertRaises(ValueError):
+            FeedbackAnalyzer(self.feedback_dir, similarity='fuzzy')
+
 
 class TestRetrospectiveAnalyzer(unittest.TestCase):
     """Test suite for RetrospectiveAnalyzer"""
@@ -74,6 +170,24 @@ class TestRetrospectiveAnalyzer(unittest.TestCase):
         self.assertIsInstance(retros, list)
 
 
+    def test_state_ignores_new_mtimes(self):
+        """Test that retrospectives only touched since the last run are not re-read"""
+        with tempfile.TemporaryDirectory() as tmp:
+            docs_dir = Path(tmp)
+            retro = docs_dir / "milestone-1-retrospective.md"
+            retro.write_text("# Retrospective\n\nTesting was slow.\n")
+            state_path = docs_dir / "state.json"
+            state = AnalysisState(state_path, {})
+            RetrospectiveAnalyzer(docs_dir).load_retrospectives(state)
+            state.save()
+
+            os.utime(retro, ns=(retro.stat().st_atime_ns, retro.stat().st_mtime_ns + 10**9))
+            analyzer = RetrospectiveAnalyzer(docs_dir)
+            with patch.object(analyzer, '_load_retrospective', side_effect=AssertionError("read")):
+                retros = analyzer.load_retrospectives(AnalysisState(state_path, {}))
+            self.assertEqual([entry['_filename'] for entry in retros], [retro.name])
+
+
 class TestImprovementProposer(unittest.TestCase):
     """Test suite for ImprovementProposer"""
 
@@ -152,6 +266,20 @@ class TestImprovementProposer(unittest.TestCase):
         external_proposals = [p for p in proposals if p.get('source') == 'external']
         self.assertEqual(len(external_proposals), 0)
 
+    def test_research_findings_combined_in_source_order(self):
+        """Test that findings streamed in completion order are combined in source order"""
+        proposer = ImprovementProposer(research_sources=['web', 'papers'])
+
+        # Papers finish first
+        proposer.add_research_findings('papers', [{'title': 'Paper', 'summary': 'Planning with tools'}])
+        proposer.add_research_findings('web', [
+            {'title': 'Web', 'summary': 'Agent handoffs'},
+            {'title': 'paper ', 'summary': 'Same title as the paper'},
+        ])
+
+        titles = [f['title'] for f in proposer.external_findings()]
+        self.assertEqual(titles, ['Web', 'paper '])
+
 
 class TestWebSearchResearcher(unittest.TestCase):
     """Test suite for WebSearchResearcher"""
@@ -266,19 +394,15 @@ class TestFrameworkAnalysisResearcher(unittest.TestCase):
         findings = researcher.analyze_frameworks()
         self.assertEqual(len(findings), 0)
     
-    @patch('urllib.request.urlopen')
-    def test_framework_analysis_with_token(self, mock_urlopen):
+    @patch.object(GitHubClient, 'get')
+    def test_framework_analysis_with_token(self, mock_get):
         """Test framework analysis with GitHub token"""
         # Mock API response
-        mock_response = MagicMock()
-        mock_response.read.return_value = json.dumps({
+        mock_get.return_value = ({
             'description': 'An autonomous AI agent platform',
             'topics': ['ai', 'agent', 'automation'],
             'stargazers_count': 1000
-        }).encode()
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_response
+        }, {})
         
         researcher = FrameworkAnalysisResearcher(enabled=True, github_token="test_token")
         findings = researcher.analyze_frameworks()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for configured, concurrent web searches.
+"""
+
+import json
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "tools"))
+
+from research import TokenBucket, WebSearchResearcher
+from research.web_researcher import load_queries
+
+
+class TestWebResearch(unittest.TestCase):
+    """Test configured, concurrent web searches"""
+
+    def test_searches_run_concurrently_in_query_order(self):
+        """Test that configured queries are searched in parallel and combined in query order"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            queries_file = Path(tmp_dir) / "queries.yml"
+            queries_file.write_text("queries:\n  - agent slow {year}\n  - agent fast\n  - agent medium\n")
+            researcher = WebSearchResearcher(
+                enabled=True, cache_dir=None, queries_file=str(queries_file),
+                rate_limiter=TokenBucket(rate=100, burst=3)
+            )
+
+        def search(query):
+            time.sleep(0.2 if 'slow' in query else 0.1 if 'medium' in query else 0)
+            return [{'title': f"AI agent workflow: {query}", 'summary': 'autonomous llm orchestration'}]
+
+        with patch.object(researcher, '_perform_search', side_effect=search):
+            started = time.monotonic()
+            findings = researcher.search_best_practices()
+            elapsed = time.monotonic() - started
+
+        year = datetime.now().year
+        self.assertEqual([f['title'] for f in findings], [
+            f"AI agent workflow: agent slow {year}", "AI agent workflow: agent fast", "AI agent workflow: agent medium"
+        ])
+        self.assertLess(elapsed, 0.3)
+
+    def test_load_queries(self):
+        """Test that query files must hold a list of non-empty strings"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "queries.json"
+            path.write_text(json.dumps(["one", " two "]))
+            self.assertEqual(load_queries(path), ["one", "two"])
+            path.write_text(json.dumps(["one", 2]))
+            with self.assertRaises(ValueError):
+                load_queries(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
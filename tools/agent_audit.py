@@ -7,19 +7,47 @@ that labeled agents are actually using their specific prompts.
 
 from __future__ import annotations
 
+import hashlib
 import json
 import re
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from agent_checklists import generate_agent_checklist, generate_all_checklists
+from checklist_scoring import ChecklistScorer, load_export
+from quality_bar_audit import (
+    SKIP_EXTENSIONS,
+    QualityBarResult,
+    check_quality_bar,
+    check_quality_bar_compliance,
+)
 
-# File extensions to skip for quality bar size checking (documentation and config files)
-SKIP_EXTENSIONS = {'.md', '.json', '.yaml', '.yml', '.txt'}
 
+# Directory (relative to repo root) where validation results are persisted between runs
+AUDIT_CACHE_DIR = ".audit_cache"
 
+# Validation error for a PR without a body to look for signatures in
+EMPTY_PR_BODY_ERROR = "PR body is empty - cannot verify agent signature"
+
+# In-process cache of spec reference results, keyed by tree fingerprint
+_spec_reference_cache: Dict[str, tuple[bool, List[str]]] = {}
+
+
+@dataclass(frozen=True)
 class AgentSignature:
-    """Represents an agent signature in a PR description."""
+    """Represents an agent signature in a PR description.
+    
+    Instances are immutable, so parsed signatures can be shared safely.
+    """
+    
+    role: str
+    version: str
+    timestamp: str
+    # Character offset of the signature comment in the scanned text, if parsed
+    offset: Optional[int] = None
     
     # Expected format: <!-- AGENT_SIGNATURE: role=role:swe, version=1.0, timestamp=2026-01-15T06:00:00Z -->
     SIGNATURE_PATTERN = re.compile(
@@ -30,22 +58,24 @@ class AgentSignature:
         r'-->'
     )
     
-    def __init__(self, role: str, version: str, timestamp: str):
-        self.role = role
-        self.version = version
-        self.timestamp = timestamp
-    
     @classmethod
     def from_text(cls, text: str) -> Optional['AgentSignature']:
-        """Extract agent signature from text (e.g., PR description)."""
-        match = cls.SIGNATURE_PATTERN.search(text)
-        if match:
-            return cls(
-                role=match.group(1),
-                version=match.group(2),
-                timestamp=match.group(3)
-            )
-        return None
+        """Extract the first agent signature from text (e.g., PR description)."""
+        signatures = cls.find_all(text)
+        return signatures[0] if signatures else None
+    
+    @classmethod
+    def find_all(cls, text: str) -> List['AgentSignature']:
+        """Extract every agent signature from text in a single pass.
+        
+        PRs produced by several co-agents carry one signature per agent.
+        Results are cached per text, so validators that inspect the same
+        PR body repeatedly only parse it once. The signatures are frozen,
+        so sharing them between callers is safe.
+        """
+        if not text:
+            return []
+        return list(_scan_signatures(text))
     
     @classmethod
     def create(cls, role: str, version: str = "1.0") -> 'AgentSignature':
@@ -80,6 +110,20 @@ class AgentSignature:
         return errors
 
 
+@lru_cache(maxsize=256)
+def _scan_signatures(text: str) -> tuple[AgentSignature, ...]:
+    """Scan text once for all signature comments, in order of appearance."""
+    return tuple(
+        AgentSignature(
+            role=match.group(1),
+            version=match.group(2),
+            timestamp=match.group(3),
+            offset=match.start()
+        )
+        for match in AgentSignature.SIGNATURE_PATTERN.finditer(text)
+    )
+
+
 class AuditLog:
     """Manages the agent audit log."""
     
@@ -159,131 +203,52 @@ def validate_pr_signature(pr_body: str) -> tuple[bool, List[str]]:
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    errors = []
-    
     if not pr_body:
-        errors.append("PR body is empty - cannot verify agent signature")
-        return False, errors
+        return False, [EMPTY_PR_BODY_ERROR]
+    
+    errors = validate_signatures(AgentSignature.find_all(pr_body))
+    return len(errors) == 0, errors
+
+
+def validate_signatures(signatures: List[AgentSignature]) -> List[str]:
+    """
+    Validate signatures already extracted from a PR body.
     
-    signature = AgentSignature.from_text(pr_body)
+    Every signature must be valid; when several co-agents signed the PR,
+    errors are prefixed with the signature they belong to.
     
-    if not signature:
-        errors.append(
+    Returns:
+        List of errors (empty if valid)
+    """
+    if not signatures:
+        return [
             "No agent signature found in PR description. "
             "Agent should include signature comment in format: "
             "<!-- AGENT_SIGNATURE: role=role:swe, version=1.0, timestamp=2026-01-15T06:00:00Z -->"
-        )
-        return False, errors
+        ]
     
-    # Validate the signature itself
-    sig_errors = signature.validate()
-    if sig_errors:
+    errors = []
+    for index, signature in enumerate(signatures, 1):
+        sig_errors = signature.validate()
+        if len(signatures) > 1:
+            sig_errors = [f"Signature {index} ({signature.role}): {e}" for e in sig_errors]
         errors.extend(sig_errors)
-        return False, errors
     
-    return True, []
+    return errors
 
 
-def generate_agent_checklist(agent_role: str) -> str:
-    """
-    Generate a checklist of agent responsibilities based on role.
-    
-    This helps verify that the agent is following its prompt.
-    """
-    role_checklists = {
-        "role:spec": """## Agent Checklist (Spec Agent)
-- [ ] Checked project status.json before starting
-- [ ] Defined clear project goals
-- [ ] Listed scope and non-goals
-- [ ] Created acceptance criteria
-- [ ] Documented key decisions and tradeoffs
-- [ ] Created/updated spec.md
-- [ ] Created/updated acceptance-tests.md""",
-        
-        "role:architect": """## Agent Checklist (Architect Agent)
-- [ ] Checked project status.json before starting
-- [ ] Read and understood spec.md
-- [ ] Designed system architecture
-- [ ] Identified components and interfaces
-- [ ] Documented tradeoffs and decisions
-- [ ] Created implementation plan with milestones
-- [ ] Created/updated architecture.md
-- [ ] Created/updated plan.md
-- [ ] Created/updated tasks.md""",
-        
-        "role:swe": """## Agent Checklist (SWE Agent)
-- [ ] Checked project status.json before starting
-- [ ] Read architecture and plan
-- [ ] Implemented features with tests
-- [ ] Ran linting and fixed all issues
-- [ ] Achieved >80% code coverage
-- [ ] Manually verified functionality
-- [ ] Kept files under quality bar limits
-- [ ] Updated documentation as needed""",
-        
-        "role:testing": """## Agent Checklist (Testing Agent)
-- [ ] Checked project status.json before starting
-- [ ] Reviewed existing test coverage
-- [ ] Created comprehensive test plan
-- [ ] Added unit tests
-- [ ] Added integration tests
-- [ ] Added edge case tests
-- [ ] Verified all tests pass
-- [ ] Updated test-plan.md""",
-        
-        "role:security": """## Agent Checklist (Security Agent)
-- [ ] Checked project status.json before starting
-- [ ] Reviewed architecture for security issues
-- [ ] Checked for common vulnerabilities
-- [ ] Validated input handling
-- [ ] Verified secrets management
-- [ ] Documented security considerations
-- [ ] Added security tests if applicable
-- [ ] Updated security notes in architecture.md""",
-        
-        "role:deployment": """## Agent Checklist (Deployment Agent)
-- [ ] Checked project status.json before starting
-- [ ] Created deployment strategy
-- [ ] Documented operational procedures
-- [ ] Estimated costs and resources
-- [ ] Created monitoring plan
-- [ ] Documented rollback procedures
-- [ ] Created/updated runbook.md
-- [ ] Created/updated cost-plan.md""",
-        
-        "role:debugging": """## Agent Checklist (Debugging Agent)
-- [ ] Checked project status.json before starting
-- [ ] Reproduced the bug
-- [ ] Identified root cause
-- [ ] Created fix with explanation
-- [ ] Added regression test
-- [ ] Verified fix resolves issue
-- [ ] Checked for similar issues
-- [ ] Updated documentation if needed""",
-        
-        "role:triage": """## Agent Checklist (Triage Agent)
-- [ ] Reviewed PRs for completeness and quality
-- [ ] Checked CI status and resolved failures
-- [ ] Verified tests and documentation
-- [ ] Approved quality PRs with detailed feedback
-- [ ] Merged approved PRs with appropriate strategy
-- [ ] Created follow-up issues for gaps identified
-- [ ] Restarted stalled agents when needed
-- [ ] Maintained visibility into PR pipeline health"""
-    }
-    
-    return role_checklists.get(
-        agent_role,
-        f"## Agent Checklist ({agent_role})\n- [ ] Checked project status.json before starting\n- [ ] Completed assigned work"
-    )
-
-
-def check_spec_references(repo_root: Path = None) -> tuple[bool, List[str]]:
+def check_spec_references(repo_root: Path = None, use_cache: bool = True) -> tuple[bool, List[str]]:
     """
     Check if all agent prompts reference their specification files.
     
+    Results are cached under a content hash of the `role.*.md` prompt files
+    and the `specs/kerrigan/agents` listing, both in-process and on disk in
+    `AUDIT_CACHE_DIR`, so repeated checks against an unchanged tree skip
+    re-reading the prompts.
+    
     Args:
         repo_root: Path to repository root (defaults to current directory)
+        use_cache: Whether to reuse a previously computed result
     
     Returns:
         Tuple of (all_valid, list_of_issues)
@@ -291,17 +256,95 @@ def check_spec_references(repo_root: Path = None) -> tuple[bool, List[str]]:
     if repo_root is None:
         repo_root = Path.cwd()
     
-    issues = []
     agents_dir = repo_root / ".github" / "agents"
     specs_dir = repo_root / "specs" / "kerrigan" / "agents"
     
     if not agents_dir.exists():
-        issues.append(f"Agent prompts directory not found: {agents_dir}")
-        return False, issues
+        return False, [f"Agent prompts directory not found: {agents_dir}"]
     
     if not specs_dir.exists():
-        issues.append(f"Agent specs directory not found: {specs_dir}")
-        return False, issues
+        return False, [f"Agent specs directory not found: {specs_dir}"]
+    
+    if not use_cache:
+        return _check_spec_references_uncached(repo_root)
+    
+    fingerprint = _spec_references_fingerprint(repo_root, agents_dir, specs_dir)
+    
+    cached = _spec_reference_cache.get(fingerprint)
+    if cached is None:
+        cached = _load_cached_spec_references(repo_root, fingerprint)
+    if cached is None:
+        cached = _check_spec_references_uncached(repo_root)
+        _save_cached_spec_references(repo_root, fingerprint, cached)
+    
+    _spec_reference_cache[fingerprint] = cached
+    is_valid, issues = cached
+    return is_valid, list(issues)
+
+
+@lru_cache(maxsize=None)
+def _checker_digest() -> str:
+    """Hash of this module, so a changed checker never reuses old results."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _spec_references_fingerprint(repo_root: Path, agents_dir: Path, specs_dir: Path) -> str:
+    """Hash the checker, role prompt contents and spec file listing that the check depends on."""
+    digest = hashlib.sha256()
+    digest.update(_checker_digest().encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(str(repo_root.resolve()).encode("utf-8"))
+    digest.update(b"\0")
+    
+    for role_path in sorted(agents_dir.glob("role.*.md")):
+        digest.update(role_path.name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(role_path.read_bytes())
+        digest.update(b"\0")
+    
+    for spec_path in sorted(specs_dir.rglob("*")):
+        digest.update(spec_path.relative_to(specs_dir).as_posix().encode("utf-8"))
+        digest.update(b"\n")
+    
+    return digest.hexdigest()
+
+
+def _spec_references_cache_path(repo_root: Path) -> Path:
+    return repo_root / AUDIT_CACHE_DIR / "spec-references.json"
+
+
+def _load_cached_spec_references(repo_root: Path, fingerprint: str) -> Optional[tuple[bool, List[str]]]:
+    """Load a persisted result if it was computed for the same fingerprint."""
+    cache_path = _spec_references_cache_path(repo_root)
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, IOError):
+        return None
+    
+    if not isinstance(data, dict) or data.get('fingerprint') != fingerprint:
+        return None
+    return bool(data.get('valid')), list(data.get('issues', []))
+
+
+def _save_cached_spec_references(repo_root: Path, fingerprint: str, result: tuple[bool, List[str]]) -> None:
+    """Persist a result so later runs against the same tree can reuse it."""
+    cache_path = _spec_references_cache_path(repo_root)
+    is_valid, issues = result
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({'fingerprint': fingerprint, 'valid': is_valid, 'issues': issues}, f, indent=2)
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write spec reference cache: {e}")
+
+
+def _check_spec_references_uncached(repo_root: Path) -> tuple[bool, List[str]]:
+    """Read every mapped role prompt and verify its spec references."""
+    issues = []
+    agents_dir = repo_root / ".github" / "agents"
     
     # Map of agent role files to their spec directories
     agent_specs = {
@@ -377,98 +420,24 @@ def validate_spec_compliance(agent_role: str, pr_body: str = None, repo_root: Pa
     if not valid_refs:
         issues.extend(ref_issues)
     
-    # If PR body is provided, validate signature
+    # If PR body is provided, validate signatures (parsed once for all checks)
     if pr_body:
-        sig_valid, sig_errors = validate_pr_signature(pr_body)
-        if not sig_valid:
+        signatures = AgentSignature.find_all(pr_body)
+        sig_errors = validate_signatures(signatures)
+        if sig_errors:
             issues.extend(sig_errors)
         else:
-            # Check if signature role matches expected role
-            sig = AgentSignature.from_text(pr_body)
-            if sig and sig.role != agent_role:
-                issues.append(
-                    f"Signature role '{sig.role}' does not match expected role '{agent_role}'"
-                )
-    
-    return len(issues) == 0, issues
-
-
-def check_quality_bar_compliance(
-    agent_role: str,
-    artifact_paths: List[Path],
-    repo_root: Path = None
-) -> tuple[bool, List[str]]:
-    """
-    Check if agent output meets quality bar standards.
-    
-    This performs basic checks based on the agent's quality bar specification:
-    - File size limits (no files >800 lines without justification)
-    - Required sections present in artifacts
-    - File structure compliance
-    
-    Args:
-        agent_role: Role identifier (e.g., "role:swe", "role:architect")
-        artifact_paths: List of file paths to check
-        repo_root: Path to repository root (defaults to current directory)
-    
-    Returns:
-        Tuple of (meets_standards, list_of_issues)
-    """
-    if repo_root is None:
-        repo_root = Path.cwd()
-    
-    issues = []
-    
-    # Check file size limits (common across all agents)
-    for artifact_path in artifact_paths:
-        if not artifact_path.exists():
-            issues.append(f"Artifact not found: {artifact_path}")
-            continue
-        
-        # Skip non-source files
-        if artifact_path.suffix in SKIP_EXTENSIONS:
-            continue
-        
-        # Count lines in source files
-        try:
-            with open(artifact_path, 'r', encoding='utf-8', errors='ignore') as f:
-                line_count = sum(1 for _ in f)
-            
-            if line_count > 800:
-                issues.append(
-                    f"File {artifact_path} has {line_count} lines (exceeds 800 line quality bar limit)"
-                )
-            elif line_count > 400:
-                # Add warning to issues with special prefix for warnings
-                issues.append(
-                    f"WARNING: File {artifact_path} has {line_count} lines (approaching 800 line limit)"
-                )
-        except Exception as e:
-            issues.append(f"Could not read file {artifact_path}: {e}")
-    
-    # Role-specific quality checks
-    if agent_role in ["role:architect", "role:spec"]:
-        # Check for required documentation sections
-        for artifact_path in artifact_paths:
-            if artifact_path.name in ["spec.md", "architecture.md"]:
-                try:
-                    content = artifact_path.read_text(encoding='utf-8', errors='ignore')
-                    
-                    # Check for required sections based on artifact type
-                    if artifact_path.name == "spec.md":
-                        required_sections = ["## Goal", "## Scope", "## Non-goals", "## Acceptance criteria"]
-                    elif artifact_path.name == "architecture.md":
-                        required_sections = ["## Overview", "## Components & interfaces", "## Tradeoffs", "## Security & privacy notes"]
-                    else:
-                        continue
-                    
-                    for section in required_sections:
-                        if section not in content:
-                            issues.append(
-                                f"Required section '{section}' missing in {artifact_path}"
-                            )
-                except Exception as e:
-                    issues.append(f"Could not validate {artifact_path}: {e}")
+            # Check if any signature role matches expected role
+            roles = [sig.role for sig in signatures]
+            if agent_role not in roles:
+                if len(roles) == 1:
+                    issues.append(
+                        f"Signature role '{roles[0]}' does not match expected role '{agent_role}'"
+                    )
+                else:
+                    issues.append(
+                        f"Signature roles ({', '.join(roles)}) do not match expected role '{agent_role}'"
+                    )
     
     return len(issues) == 0, issues
 
@@ -481,7 +450,9 @@ if __name__ == "__main__":
         print("\nCommands:")
         print("  validate-pr <pr_body_file>           - Validate PR has proper agent signature")
         print("  create-signature <role>              - Create a new agent signature")
-        print("  generate-checklist <role>            - Generate agent responsibility checklist")
+        print("  generate-checklist <role|--all>      - Generate agent responsibility checklist(s)")
+        print("  score-checklist <role> <pr_body>     - Score checklist completion in a PR body")
+        print("  score-checklists <export.json>       - Score checklist completion for all PRs in an export")
         print("  check-spec-references [repo_root]    - Check if agent prompts reference their specs")
         print("  validate-compliance <role> [pr_body] - Validate agent spec compliance")
         print("  check-quality-bar <role> <files...>  - Check quality bar compliance for artifacts")
@@ -503,11 +474,12 @@ if __name__ == "__main__":
         is_valid, errors = validate_pr_signature(pr_body)
         
         if is_valid:
-            print("✅ Agent signature is valid")
-            sig = AgentSignature.from_text(pr_body)
-            print(f"   Role: {sig.role}")
-            print(f"   Version: {sig.version}")
-            print(f"   Timestamp: {sig.timestamp}")
+            signatures = AgentSignature.find_all(pr_body)
+            print(f"✅ Agent signature is valid ({len(signatures)} found)")
+            for sig in signatures:
+                print(f"   Role: {sig.role}")
+                print(f"   Version: {sig.version}")
+                print(f"   Timestamp: {sig.timestamp}")
             sys.exit(0)
         else:
             print("❌ Agent signature validation failed:")
@@ -529,8 +501,48 @@ if __name__ == "__main__":
             print("Error: Missing role argument")
             sys.exit(1)
         
+        if sys.argv[2] == "--all":
+            print(json.dumps(generate_all_checklists(), indent=2))
+        else:
+            role = sys.argv[2]
+            print(generate_agent_checklist(role))
+    
+    elif command == "score-checklist":
+        if len(sys.argv) < 4:
+            print("Error: Missing role and/or PR body file arguments")
+            sys.exit(1)
+        
         role = sys.argv[2]
-        print(generate_agent_checklist(role))
+        pr_body_file = Path(sys.argv[3])
+        if not pr_body_file.exists():
+            print(f"Error: File not found: {pr_body_file}")
+            sys.exit(1)
+        
+        result = ChecklistScorer().score(role, pr_body_file.read_text(encoding="utf-8"))
+        if result is None:
+            print(f"Error: No checklist defined for {role}")
+            sys.exit(1)
+        
+        print(f"Checklist completion for {role}: {len(result.checked)}/{result.total} ({result.score:.0%})")
+        for item in result.unchecked:
+            print(f"   ☐ {item}")
+        for item in result.missing:
+            print(f"   ✗ {item} (not listed)")
+    
+    elif command == "score-checklists":
+        if len(sys.argv) < 3:
+            print("Error: Missing export file argument")
+            sys.exit(1)
+        
+        export_file = Path(sys.argv[2])
+        try:
+            with open(export_file, "r", encoding="utf-8") as f:
+                records = load_export(json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            print(f"Error: Could not load export: {e}")
+            sys.exit(1)
+        
+        print(json.dumps(ChecklistScorer().score_export(records), indent=2))
     
     elif command == "check-spec-references":
         repo_root = Path(sys.argv[2]) if len(sys.argv) > 2 else Path.cwd()
@@ -584,22 +596,18 @@ if __name__ == "__main__":
         artifact_paths = [Path(p) for p in sys.argv[3:]]
         
         print(f"Checking quality bar compliance for {role}...")
-        meets_standards, issues = check_quality_bar_compliance(role, artifact_paths)
-        
-        # Separate warnings from errors
-        warnings = [i for i in issues if i.startswith("WARNING:")]
-        errors = [i for i in issues if not i.startswith("WARNING:")]
+        result = check_quality_bar(role, artifact_paths)
         
         # Display warnings
-        for warning in warnings:
-            print(f"⚠️  {warning.removeprefix('WARNING: ')}")
+        for warning in result.warnings:
+            print(f"⚠️  {warning}")
         
-        if len(errors) == 0:
+        if result.meets_standards:
             print(f"✅ All artifacts meet quality bar standards for {role}")
             sys.exit(0)
         else:
             print(f"❌ Quality bar validation failed for {role}:")
-            for error in errors:
+            for error in result.errors:
                 print(f"   - {error}")
             sys.exit(1)
     
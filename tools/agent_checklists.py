@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""Agent responsibility checklists.
+
+Checklists are derived from the "Definition of Done" section of each
+agent's `specs/kerrigan/agents/<role>/quality-bar.md`, so they stay in sync
+with the specifications. The built-in checklists below cover the standard
+roles and are used when a role's quality bar is missing or yields no items.
+"""
+
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Heading that introduces the checklist items in each quality-bar.md
+DONE_SECTION_HEADING = "## Definition of Done"
+
+# Checklist items: "- [ ] text" / "- [x] text" or "1. ✅ text"
+CHECKLIST_ITEM_PATTERN = re.compile(r'^\s*(?:[-*]\s+\[[ xX]\]|\d+\.\s+✅)\s+(.+?)\s*$')
+
+# Title line: "# Quality Bar: SWE Agent"
+TITLE_PATTERN = re.compile(r'^#\s+Quality Bar:\s*(.+?)\s*$', re.MULTILINE)
+
+# Built-in checklists (label, items) for the standard roles: the fallback when
+# a role's quality-bar.md is missing or has no Definition of Done items
+DEFAULT_CHECKLISTS: Dict[str, Tuple[str, List[str]]] = {
+    "role:spec": ("Spec Agent", [
+        "Checked project status.json before starting",
+        "Defined clear project goals",
+        "Listed scope and non-goals",
+        "Created acceptance criteria",
+        "Documented key decisions and tradeoffs",
+        "Created/updated spec.md",
+        "Created/updated acceptance-tests.md",
+    ]),
+    "role:architect": ("Architect Agent", [
+        "Checked project status.json before starting",
+        "Read and understood spec.md",
+        "Designed system architecture",
+        "Identified components and interfaces",
+        "Documented tradeoffs and decisions",
+        "Created implementation plan with milestones",
+        "Created/updated architecture.md",
+        "Created/updated plan.md",
+        "Created/updated tasks.md",
+    ]),
+    "role:swe": ("SWE Agent", [
+        "Checked project status.json before starting",
+        "Read architecture and plan",
+        "Implemented features with tests",
+        "Ran linting and fixed all issues",
+        "Achieved >80% code coverage",
+        "Manually verified functionality",
+        "Kept files under quality bar limits",
+        "Updated documentation as needed",
+    ]),
+    "role:testing": ("Testing Agent", [
+        "Checked project status.json before starting",
+        "Reviewed existing test coverage",
+        "Created comprehensive test plan",
+        "Added unit tests",
+        "Added integration tests",
+        "Added edge case tests",
+        "Verified all tests pass",
+        "Updated test-plan.md",
+    ]),
+    "role:security": ("Security Agent", [
+        "Checked project status.json before starting",
+        "Reviewed architecture for security issues",
+        "Checked for common vulnerabilities",
+        "Validated input handling",
+        "Verified secrets management",
+        "Documented security considerations",
+        "Added security tests if applicable",
+        "Updated security notes in architecture.md",
+    ]),
+    "role:deployment": ("Deployment Agent", [
+        "Checked project status.json before starting",
+        "Created deployment strategy",
+        "Documented operational procedures",
+        "Estimated costs and resources",
+        "Created monitoring plan",
+        "Documented rollback procedures",
+        "Created/updated runbook.md",
+        "Created/updated cost-plan.md",
+    ]),
+    "role:debugging": ("Debugging Agent", [
+        "Checked project status.json before starting",
+        "Reproduced the bug",
+        "Identified root cause",
+        "Created fix with explanation",
+        "Added regression test",
+        "Verified fix resolves issue",
+        "Checked for similar issues",
+        "Updated documentation if needed",
+    ]),
+    "role:triage": ("Triage Agent", [
+        "Reviewed PRs for completeness and quality",
+        "Checked CI status and resolved failures",
+        "Verified tests and documentation",
+        "Approved quality PRs with detailed feedback",
+        "Merged approved PRs with appropriate strategy",
+        "Created follow-up issues for gaps identified",
+        "Restarted stalled agents when needed",
+        "Maintained visibility into PR pipeline health",
+    ]),
+}
+
+
+def parse_quality_bar(content: str) -> Optional[Tuple[Optional[str], List[str]]]:
+    """Extract the title label and Definition of Done items from a quality bar.
+
+    Args:
+        content: Markdown content of a quality-bar.md file
+
+    Returns:
+        Tuple of (label, items), or None if the document has no items
+    """
+    title_match = TITLE_PATTERN.search(content)
+    label = title_match.group(1) if title_match else None
+
+    items = []
+    in_section = False
+    for line in content.splitlines():
+        if line.startswith("#"):
+            if in_section:
+                break
+            in_section = line.strip() == DONE_SECTION_HEADING
+            continue
+        if in_section:
+            item_match = CHECKLIST_ITEM_PATTERN.match(line)
+            if item_match:
+                items.append(item_match.group(1))
+
+    if not items:
+        return None
+    return label, items
+
+
+def render_checklist(label: str, items: Iterable[str]) -> str:
+    """Render checklist items as an unchecked markdown checklist."""
+    lines = [f"## Agent Checklist ({label})"]
+    lines.extend(f"- [ ] {item}" for item in items)
+    return "\n".join(lines)
+
+
+class ChecklistRegistry:
+    """Role checklists loaded from agent quality bars, cached by file mtime."""
+
+    def __init__(self, specs_dir: Path):
+        """Initialize the registry.
+
+        Args:
+            specs_dir: Directory containing one subdirectory per agent spec
+        """
+        self.specs_dir = specs_dir
+        # role -> (mtime_ns, (label, items)) for spec-derived checklists;
+        # None records a quality bar that could not be parsed at that mtime
+        self._entries: Dict[str, Tuple[int, Optional[Tuple[str, List[str]]]]] = {}
+
+    def roles(self) -> List[str]:
+        """List every role with a checklist (spec-derived or built-in)."""
+        roles = set(DEFAULT_CHECKLISTS)
+        if self.specs_dir.is_dir():
+            roles.update(
+                f"role:{path.parent.name}"
+                for path in self.specs_dir.glob("*/quality-bar.md")
+            )
+        return sorted(roles)
+
+    def get(self, agent_role: str) -> Optional[Tuple[str, List[str]]]:
+        """Get the (label, items) checklist for a role, or None if unknown."""
+        entry = self._load(agent_role)
+        if entry:
+            return entry
+        return DEFAULT_CHECKLISTS.get(agent_role)
+
+    def render(self, agent_role: str) -> str:
+        """Render the markdown checklist for a role."""
+        checklist = self.get(agent_role)
+        if checklist is None:
+            return (
+                f"## Agent Checklist ({agent_role})\n"
+                "- [ ] Checked project status.json before starting\n"
+                "- [ ] Completed assigned work"
+            )
+        return render_checklist(*checklist)
+
+    def render_all(self, roles: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """Render checklists for many roles in one call.
+
+        Args:
+            roles: Roles to render (defaults to every known role)
+
+        Returns:
+            Mapping of role to rendered markdown checklist
+        """
+        if roles is None:
+            roles = self.roles()
+        return {role: self.render(role) for role in roles}
+
+    def _load(self, agent_role: str) -> Optional[Tuple[str, List[str]]]:
+        """Load a spec-derived checklist, re-parsing only if the file changed."""
+        if not agent_role.startswith("role:"):
+            return None
+
+        spec_name = agent_role[len("role:"):]
+        if not spec_name or "/" in spec_name or "\\" in spec_name or spec_name.startswith("."):
+            return None
+
+        quality_bar = self.specs_dir / spec_name / "quality-bar.md"
+        try:
+            mtime = quality_bar.stat().st_mtime_ns
+        except OSError:
+            self._entries.pop(agent_role, None)
+            return None
+
+        cached = self._entries.get(agent_role)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            parsed = parse_quality_bar(quality_bar.read_text(encoding="utf-8"))
+        except (IOError, UnicodeDecodeError):
+            parsed = None
+        if parsed is not None:
+            label, items = parsed
+            if not label:
+                default = DEFAULT_CHECKLISTS.get(agent_role)
+                label = default[0] if default else f"{spec_name.title()} Agent"
+            parsed = (label, items)
+        self._entries[agent_role] = (mtime, parsed)
+        return parsed
+
+
+_registries: Dict[Path, ChecklistRegistry] = {}
+
+
+def get_registry(repo_root: Optional[Path] = None) -> ChecklistRegistry:
+    """Get the shared checklist registry for a repository.
+
+    Args:
+        repo_root: Path to repository root (defaults to this repository)
+    """
+    if repo_root is None:
+        repo_root = ROOT
+    specs_dir = (repo_root / "specs" / "kerrigan" / "agents").resolve()
+    registry = _registries.get(specs_dir)
+    if registry is None:
+        registry = ChecklistRegistry(specs_dir)
+        _registries[specs_dir] = registry
+    return registry
+
+
+def generate_agent_checklist(agent_role: str, repo_root: Optional[Path] = None) -> str:
+    """
+    Generate a checklist of agent responsibilities based on role.
+
+    This helps verify that the agent is following its prompt.
+    """
+    return get_registry(repo_root).render(agent_role)
+
+
+def generate_all_checklists(repo_root: Optional[Path] = None) -> Dict[str, str]:
+    """Generate checklists for every known role in one call."""
+    return get_registry(repo_root).render_all()
@@ -0,0 +1,51 @@
+"""Analysis modules for the self-improvement system.
+
+This package contains the scalable building blocks used by
+self_improvement_analyzer.py to process large feedback histories.
+"""
+
+from .grouping import FeedbackFeatures, group_related_feedback
+from .incremental import STATE_FILENAME, AnalysisState
+from .keywords import PATTERN_KEYWORDS, KeywordMatcher, pattern_keyword_matcher
+from .loader import FeedbackParseCache, file_digest, iter_feedback_files, load_feedback_files, timestamp_in_window
+from .markdown import MarkdownSections
+from .metrics import PhaseTimer, metrics_format, write_metrics_file
+from .priority import DEFAULT_PRIORITY_WEIGHTS, PriorityScorer, load_priority_weights
+from .records import FeedbackDocuments, FeedbackRecord, features_of, record_features, record_shingles
+from .report import generate_report, iter_report_lines, write_report, write_report_file
+from .similarity import MinHashLSH, MinHasher, cluster_near_duplicates, shingle_hashes
+
+__all__ = [
+    'PATTERN_KEYWORDS',
+    'FeedbackFeatures',
+    'group_related_feedback',
+    'MinHasher',
+    'MinHashLSH',
+    'cluster_near_duplicates',
+    'shingle_hashes',
+    'FeedbackParseCache',
+    'file_digest',
+    'load_feedback_files',
+    'iter_feedback_files',
+    'timestamp_in_window',
+    'generate_report',
+    'iter_report_lines',
+    'write_report',
+    'write_report_file',
+    'AnalysisState',
+    'STATE_FILENAME',
+    'DEFAULT_PRIORITY_WEIGHTS',
+    'PriorityScorer',
+    'load_priority_weights',
+    'KeywordMatcher',
+    'pattern_keyword_matcher',
+    'MarkdownSections',
+    'FeedbackRecord',
+    'FeedbackDocuments',
+    'features_of',
+    'record_features',
+    'record_shingles',
+    'PhaseTimer',
+    'metrics_format',
+    'write_metrics_file',
+]
@@ -0,0 +1,112 @@
+"""Related-feedback grouping.
+
+This module groups feedback items that share a category and either a
+related file or a pattern keyword. Per-item features are computed once and
+candidates are found through an inverted index, so grouping scales with
+the number of (item, key) memberships instead of the number of item pairs.
+"""
+
+from typing import Any, Dict, FrozenSet, Hashable, List, Sequence, Set, Tuple
+
+from .keywords import PATTERN_KEYWORDS, KeywordMatcher, pattern_keyword_matcher
+
+
+class FeedbackFeatures:
+    """Precomputed relatedness features for one feedback item."""
+
+    __slots__ = ('category', 'files', 'keywords')
+
+    def __init__(self, item: Dict[str, Any], keywords: Sequence[str] = PATTERN_KEYWORDS):
+        """Extract features from a feedback item.
+
+        Args:
+            item: Parsed feedback document
+            keywords: Keywords whose presence relates two items
+        """
+        self.category = item.get('category')
+        self.files: FrozenSet[Any] = frozenset(item.get('related_files') or [])
+        text = f"{item.get('title', '')} {item.get('description', '')}".lower()
+        matcher = pattern_keyword_matcher() if keywords is PATTERN_KEYWORDS else KeywordMatcher(keywords)
+        self.keywords: FrozenSet[str] = matcher.present(text)
+
+    @classmethod
+    def from_keys(cls, category: Any, keys: Sequence[Sequence[Hashable]]) -> 'FeedbackFeatures':
+        """Features rebuilt from stored index_keys(), without the feedback text."""
+        features = cls.__new__(cls)
+        features.category = category
+        features.files = frozenset(key[2] for key in keys if key[0] == 'file')
+        features.keywords = frozenset(key[2] for key in keys if key[0] == 'keyword')
+        return features
+
+    def index_keys(self) -> List[Tuple[Hashable, ...]]:
+        """Inverted-index keys; two items are related iff they share a key."""
+        keys: List[Tuple[Hashable, ...]] = [('file', self.category, f) for f in self.files]
+        keys.extend(('keyword', self.category, k) for k in self.keywords)
+        return keys
+
+    def is_related(self, other: 'FeedbackFeatures') -> bool:
+        """Check if two items are related (same category plus shared file or keyword)."""
+        if self.category != other.category:
+            return False
+        return bool(self.files & other.files) or bool(self.keywords & other.keywords)
+
+
+def group_related_feedback(
+    items: Sequence[Dict[str, Any]],
+    features: Sequence[FeedbackFeatures] = None
+) -> List[Dict[str, Any]]:
+    """Find groups of related feedback items.
+
+    Each item, in order, claims every later unclaimed item directly related
+    to it. Claimed and visited items are removed from the index, so every
+    index membership is touched a bounded number of times.
+
+    Args:
+        items: Feedback items (must have `_filename`)
+        features: Precomputed features for `items` (computed if omitted)
+
+    Returns:
+        List of groups with count, category and member filenames
+    """
+    if features is None:
+        features = [FeedbackFeatures(item) for item in items]
+
+    index: Dict[Tuple[Hashable, ...], Set[int]] = {}
+    item_keys: List[List[Tuple[Hashable, ...]]] = []
+    for i, feature in enumerate(features):
+        keys = feature.index_keys()
+        item_keys.append(keys)
+        for key in keys:
+            index.setdefault(key, set()).add(i)
+
+    def remove(i: int) -> None:
+        for key in item_keys[i]:
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.discard(i)
+
+    groups = []
+    processed = [False] * len(features)
+
+    for i in range(len(features)):
+        if processed[i]:
+            continue
+        # Later items can no longer be grouped with i, whatever happens below
+        remove(i)
+
+        related: Set[int] = set()
+        for key in item_keys[i]:
+            related.update(index.get(key, ()))
+
+        if related:
+            members = sorted(related)
+            for j in members:
+                processed[j] = True
+                remove(j)
+            groups.append({
+                'count': len(members) + 1,
+                'category': items[i].get('category', 'unknown'),
+                'items': [items[i]['_filename']] + [items[j]['_filename'] for j in members]
+            })
+
+    return groups
@@ -0,0 +1,356 @@
+"""Persisted state for incremental self-improvement analysis.
+
+The state records, for every feedback file in the analysis window, a
+compact summary (the record's compact fields, relatedness keys, a text
+hash and a content hash of the file), the aggregate counters, the
+related-feedback groups and, for every retrospective, its keyword counts.
+Each run diffs the current files against the state and only ingests what
+was added, edited, removed or aged out of the window since the last run.
+Unchanged files are not read at all: their records are restored from the
+summaries (`restore_records()`).
+
+Counters are always updated incrementally. Keyword groups are updated in
+place for the daily case, where the window moves forward by a day:
+
+- Files leaving the window are dropped from their groups. Only a removed
+  group leader with remaining members changes how other files group; its
+  category alone is then regrouped from the stored keys
+- New files that sort after all others are appended to the groups
+
+Edits and out-of-order insertions regroup the window from the stored
+keys, because the greedy grouping depends on item order. No path reads
+feedback files again. MinHash clusters are recomputed from the full
+records.
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .grouping import FeedbackFeatures, group_related_feedback
+from .loader import timestamp_in_window
+from .records import (
+    FeedbackDocuments,
+    FeedbackRecord,
+    compact_fields,
+    features_of,
+    fingerprint_of,
+    record_features,
+    record_shingles,
+)
+from .similarity import cluster_near_duplicates
+
+# Bump when the persisted layout changes
+STATE_VERSION = 3
+
+# State file name inside the analysis cache directory
+STATE_FILENAME = "analysis-state.json"
+
+# Aggregate counters: (name, feedback field, default value)
+COUNTER_FIELDS = (
+    ('by_category', 'category', 'unknown'),
+    ('by_severity', 'severity', 'unknown'),
+    ('by_agent', 'agent_role', 'unknown'),
+    ('by_status', 'status', 'new'),
+)
+
+
+def _feedback_record(item: Dict[str, Any], features: FeedbackFeatures, fingerprint: str) -> Dict[str, Any]:
+    """Compact per-file summary kept in the state."""
+    return {
+        'fingerprint': fingerprint,
+        'fields': compact_fields(item),
+        'keys': [list(key) for key in features.index_keys()],
+        'text': fingerprint_of(item),
+    }
+
+
+def _field(record: Dict[str, Any], field: str, default: Any) -> Any:
+    return record['fields'].get(field, default)
+
+
+class AnalysisState:
+    """Aggregates carried over between analysis runs."""
+
+    def __init__(self, path: Optional[Path], params: Dict[str, Any], full_rebuild: bool = False):
+        """Load persisted state, starting fresh if it is missing or stale.
+
+        Args:
+            path: State file (None keeps the state in memory only)
+            params: Analysis parameters; a change forces a rebuild
+            full_rebuild: Ignore any persisted state
+        """
+        self.path = path
+        self.params = params
+        self.feedback: Dict[str, Dict[str, Any]] = {}
+        self.counters: Dict[str, List[List[Any]]] = {name: [] for name, _, _ in COUNTER_FIELDS}
+        self.groups: List[Dict[str, Any]] = []
+        self.retrospectives: Dict[str, Dict[str, Any]] = {}
+        self.last_run: Optional[str] = None
+        self.rebuilt = True
+        if path is not None and not full_rebuild:
+            self._load()
+
+    def known_fingerprints(self) -> Dict[str, str]:
+        """Content hash per feedback file in the state."""
+        return {name: record['fingerprint'] for name, record in self.feedback.items()}
+
+    def restore_records(
+        self,
+        fingerprints: Dict[str, str],
+        since_date: Optional[datetime],
+        documents: FeedbackDocuments
+    ) -> List[FeedbackRecord]:
+        """Records of stored files that are unchanged and still in the window.
+
+        Args:
+            fingerprints: Content hash per file currently in the window
+            since_date: Start of the window (for the `timestamp` field)
+            documents: Reader for fields the records do not keep
+
+        Returns:
+            Restored records, in filename order
+        """
+        return [
+            FeedbackRecord.restore(name, record['fields'], record['keys'], record['text'], documents)
+            for name, record in sorted(self.feedback.items())
+            if fingerprints.get(name) == record['fingerprint']
+            and timestamp_in_window(record['fields'].get('timestamp'), since_date)
+        ]
+
+    def ingest_feedback(
+        self,
+        items: List[Dict[str, Any]],
+        fingerprints: Dict[str, str],
+        similarity: str = 'keyword',
+        similarity_threshold: float = 0.8
+    ) -> Dict[str, int]:
+        """Bring the state up to date with the current analysis window.
+
+        Args:
+            items: Feedback items in the window, in filename order
+            fingerprints: Content hash per `_filename`
+            similarity: Grouping engine ('keyword' or 'minhash')
+            similarity_threshold: Jaccard threshold for 'minhash'
+
+        Returns:
+            Counts of added, changed and removed files
+        """
+        current = {item['_filename']: item for item in items}
+        removed = [name for name in self.feedback if name not in current]
+        changed = [
+            name for name in current
+            if name in self.feedback
+            and self.feedback[name]['fingerprint'] != fingerprints.get(name, '')
+        ]
+        added = [name for name in current if name not in self.feedback]
+        kept = [name for name in self.feedback if name not in removed]
+        appended_only = not added or not kept or min(added) > max(kept)
+
+        delta = {'added': len(added), 'changed': len(changed), 'removed': len(removed)}
+        counters = {name: _to_counter(pairs) for name, pairs in self.counters.items()}
+        for name in removed + changed:
+            self._count(counters, self.feedback.pop(name), -1)
+        for name in changed + added:
+            record = _feedback_record(current[name], features_of(current[name]), fingerprints.get(name, ''))
+            self.feedback[name] = record
+            self._count(counters, record, 1)
+        self.counters = {name: [[k, v] for k, v in counter.items() if v] for name, counter in counters.items()}
+
+        if similarity == 'minhash':
+            self.groups = cluster_near_duplicates(
+                items, threshold=similarity_threshold, hashed_shingles=record_shingles(items)
+            )
+        elif self.rebuilt:
+            self.groups = group_related_feedback(items, record_features(items))
+        elif changed or not appended_only:
+            self._regroup()
+        else:
+            regrouped = self._remove_from_groups(removed)
+            added = [name for name in added if self._category(name) not in regrouped]
+            if added:
+                self._append_to_groups(sorted(added))
+
+        return delta
+
+    def ingest_retrospectives(
+        self,
+        fingerprints: Dict[str, str],
+        keyword_counts
+    ) -> Dict[str, int]:
+        """Update per-retrospective keyword counts.
+
+        Args:
+            fingerprints: Content hash per retrospective filename
+            keyword_counts: Callable returning keyword counts for a filename,
+                only called for new or edited files
+
+        Returns:
+            Summed keyword counts across all retrospectives
+        """
+        for name in [name for name in self.retrospectives if name not in fingerprints]:
+            del self.retrospectives[name]
+        for name, fingerprint in sorted(fingerprints.items()):
+            entry = self.retrospectives.get(name)
+            if entry is None or entry['fingerprint'] != fingerprint:
+                counts = keyword_counts(name)
+                if counts is None:
+                    continue
+                self.retrospectives[name] = {'fingerprint': fingerprint, 'keyword_counts': counts}
+
+        totals: Dict[str, int] = {}
+        for entry in self.retrospectives.values():
+            for keyword, count in entry['keyword_counts'].items():
+                totals[keyword] = totals.get(keyword, 0) + count
+        return totals
+
+    def feedback_analysis(self) -> Dict[str, Any]:
+        """Feedback analysis in the shape of FeedbackAnalyzer.analyze_patterns()."""
+        if not self.feedback:
+            return {}
+        counters = {name: dict((key, count) for key, count in pairs) for name, pairs in self.counters.items()}
+        severities = counters['by_severity']
+        statuses = counters['by_status']
+        return {
+            'total_feedback': len(self.feedback),
+            'by_category': counters['by_category'],
+            'by_severity': severities,
+            'by_agent': counters['by_agent'],
+            'by_status': statuses,
+            'related_groups': self.groups,
+            'high_severity_count': severities.get('high', 0),
+            'unaddressed_count': statuses.get('new', 0) + statuses.get('reviewed', 0),
+        }
+
+    def save(self) -> None:
+        """Persist the state atomically."""
+        if self.path is None:
+            return
+        self.last_run = datetime.now(timezone.utc).isoformat()
+        data = {
+            'version': STATE_VERSION,
+            'params': self.params,
+            'last_run': self.last_run,
+            'feedback': self.feedback,
+            'counters': self.counters,
+            'groups': self.groups,
+            'retrospectives': self.retrospectives,
+        }
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, default=str)
+            tmp_path.replace(self.path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Warning: Could not write analysis state: {e}")
+
+    def _remove_from_groups(self, removed: Iterable[str]) -> set:
+        """Drop removed files from the groups, as a full regroup would.
+
+        A removed member, or a whole removed group, leaves every other file
+        where it was. A removed leader whose members remain frees them to
+        group with other files, so its category is regrouped from the stored
+        keys (files of different categories never group together).
+
+        Returns:
+            Categories regrouped, including any files already added to them
+        """
+        removed = set(removed)
+        groups = []
+        regroup = set()
+        for group in self.groups:
+            remaining = [name for name in group['items'] if name not in removed]
+            if group['items'][0] in removed and remaining:
+                regroup.add(self._category(remaining[0]))
+            elif len(remaining) > 1:
+                groups.append(dict(group, count=len(remaining), items=remaining))
+        self.groups = groups
+        if regroup:
+            self._regroup(regroup)
+        return regroup
+
+    def _regroup(self, categories: Optional[set] = None) -> None:
+        """Regroup the window, or some categories of it, from the stored keys.
+
+        Args:
+            categories: Categories to regroup (None for all)
+        """
+        names = sorted(name for name in self.feedback if categories is None or self._category(name) in categories)
+        groups = group_related_feedback(
+            [{'_filename': name, 'category': _field(self.feedback[name], 'category', 'unknown')} for name in names],
+            [FeedbackFeatures.from_keys(self._category(name), self.feedback[name]['keys']) for name in names]
+        )
+        if categories is not None:
+            groups += [group for group in self.groups if self._category(group['items'][0]) not in categories]
+        # Groups are reported in leader order, as a full regroup would
+        self.groups = sorted(groups, key=lambda group: group['items'][0])
+
+    def _category(self, name: str) -> Any:
+        return _field(self.feedback[name], 'category', None)
+
+    def _append_to_groups(self, added: Iterable[str]) -> None:
+        """Extend the greedy grouping with files that sort after all others.
+
+        A new file joins the earliest earlier file that still leads a group
+        or stands alone and shares a key with it, which is exactly where a
+        full regroup would put it.
+        """
+        added = list(added)
+        # Only files ingested on earlier runs seed the index
+        skip = {name for group in self.groups for name in group['items'][1:]}.union(added)
+        groups_by_leader = {group['items'][0]: group for group in self.groups}
+        index: Dict[Tuple[Any, ...], List[str]] = {}
+        for name in sorted(self.feedback):
+            if name not in skip:
+                for key in self.feedback[name]['keys']:
+                    index.setdefault(tuple(key), []).append(name)
+
+        for name in added:
+            keys = [tuple(key) for key in self.feedback[name]['keys']]
+            candidates = [index[key][0] for key in keys if index.get(key)]
+            if candidates:
+                leader = min(candidates)
+                group = groups_by_leader.get(leader)
+                if group is None:
+                    group = {'count': 1, 'category': _field(self.feedback[leader], 'category', 'unknown'),
+                             'items': [leader]}
+                    groups_by_leader[leader] = group
+                    self.groups.append(group)
+                group['items'].append(name)
+                group['count'] = len(group['items'])
+                continue
+            # Unclaimed: may lead a group for later files
+            for key in keys:
+                index.setdefault(key, []).append(name)
+
+        # Groups are reported in leader order, as a full regroup would
+        self.groups.sort(key=lambda group: group['items'][0])
+
+    @staticmethod
+    def _count(counters: Dict[str, Dict[Any, int]], record: Dict[str, Any], delta: int) -> None:
+        for name, field, default in COUNTER_FIELDS:
+            counter = counters[name]
+            value = _field(record, field, default)
+            counter[value] = counter.get(value, 0) + delta
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, IOError):
+            return
+        if not isinstance(data, dict) or data.get('version') != STATE_VERSION or data.get('params') != self.params:
+            return
+        self.feedback = data.get('feedback', {})
+        self.counters = data.get('counters', self.counters)
+        self.groups = data.get('groups', [])
+        self.retrospectives = data.get('retrospectives', {})
+        self.last_run = data.get('last_run')
+        self.rebuilt = False
+
+
+def _to_counter(pairs: List[List[Any]]) -> Dict[Any, int]:
+    """Counter pairs are stored as lists so non-string values survive JSON."""
+    return {key: count for key, count in pairs}
@@ -0,0 +1,119 @@
+"""Shared keyword lists for pattern detection.
+
+This module defines the keywords used to relate feedback items and to
+detect recurring themes in retrospectives, and a multi-keyword matcher
+that counts all of them in a single pass over the text.
+"""
+
+from collections import deque
+from typing import Dict, FrozenSet, List, Optional, Sequence
+
+# Common keywords for pattern detection across feedback and retrospectives
+PATTERN_KEYWORDS = [
+    'documentation', 'testing', 'validation', 'agent prompt',
+    'workflow', 'automation', 'quality', 'handoff', 'artifact'
+]
+
+
+# Below this many keywords, one C-level str.count per keyword beats walking
+# the automaton character by character in Python
+AUTOMATON_MIN_KEYWORDS = 256
+
+
+class KeywordMatcher:
+    """Counts many keywords in one pass with an Aho-Corasick automaton.
+
+    Counts follow `str.count` semantics: occurrences of the same keyword
+    never overlap, while different keywords may overlap each other. Small
+    keyword sets are counted with `str.count` instead, which is faster in
+    CPython and gives identical results.
+    """
+
+    def __init__(self, keywords: Sequence[str], use_automaton: Optional[bool] = None):
+        """Build the matcher.
+
+        Args:
+            keywords: Keywords to match (case-sensitive; lowercase the text
+                and keywords for case-insensitive matching)
+            use_automaton: Force (True) or disable (False) the automaton;
+                by default it is used for AUTOMATON_MIN_KEYWORDS or more
+        """
+        self.keywords = list(dict.fromkeys(k for k in keywords if k))
+        if use_automaton is None:
+            use_automaton = len(self.keywords) >= AUTOMATON_MIN_KEYWORDS
+        self.use_automaton = use_automaton
+        if use_automaton:
+            self._build()
+
+    def _build(self) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        # Keyword indices that end at each state (own and via failure links)
+        self._output: List[List[int]] = [[]]
+
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(index)
+
+        # Breadth-first failure links
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def count(self, text: str) -> Dict[str, int]:
+        """Count non-overlapping occurrences of every keyword in `text`.
+
+        Returns:
+            Mapping of keyword to count, for keywords that occur
+        """
+        if not self.use_automaton:
+            counts = ((keyword, text.count(keyword)) for keyword in self.keywords)
+            return {keyword: count for keyword, count in counts if count}
+
+        lengths = [len(keyword) for keyword in self.keywords]
+        counts = [0] * len(self.keywords)
+        next_free = [0] * len(self.keywords)
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in output[state]:
+                start = position - lengths[index] + 1
+                if start >= next_free[index]:
+                    counts[index] += 1
+                    next_free[index] = position + 1
+        return {keyword: count for keyword, count in zip(self.keywords, counts) if count}
+
+    def present(self, text: str) -> FrozenSet[str]:
+        """Keywords that occur at least once in `text`."""
+        return frozenset(self.count(text))
+
+
+_default_matcher: Optional[KeywordMatcher] = None
+
+
+def pattern_keyword_matcher() -> KeywordMatcher:
+    """Shared matcher for PATTERN_KEYWORDS."""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = KeywordMatcher(PATTERN_KEYWORDS)
+    return _default_matcher
@@ -0,0 +1,332 @@
+"""Cached, parallel loading of feedback YAML files.
+
+Parsed feedback is kept in a SQLite parse cache keyed on file name and a
+hash of the file's content, so a daily run only parses files that were
+added or edited. Mtime and size are only a fast pre-check: a fresh
+checkout, which gives every file a new mtime, costs a hash per file rather
+than a parse.
+Uncached files are parsed with libyaml's CSafeLoader when available, in
+a process pool once there are enough of them to pay for the workers.
+Files whose name starts with a date older than the analysis window are
+skipped without being opened.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import yaml
+
+# libyaml's loader is several times faster than the pure-Python one
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Feedback files are named YYYY-MM-DD-<slug>.yaml
+FILENAME_DATE_PATTERN = re.compile(r'^(\d{4})-(\d{2})-(\d{2})')
+
+# Below this many uncached files a process pool costs more than it saves
+PARALLEL_THRESHOLD = 16
+
+# Bump when the cached representation changes
+CACHE_VERSION = 3
+
+# Marker text that identifies the feedback template
+TEMPLATE_MARKER = 'Copy this template'
+
+
+def filename_date(filename: str) -> Optional[date]:
+    """Date encoded in a feedback filename prefix, or None."""
+    match = FILENAME_DATE_PATTERN.match(filename)
+    if not match:
+        return None
+    try:
+        return date(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+    except ValueError:
+        return None
+
+
+def timestamp_in_window(timestamp: Any, since_date: Optional[datetime]) -> bool:
+    """Whether a feedback `timestamp` field falls in the window.
+
+    Missing or unparseable timestamps count as in the window.
+    """
+    if since_date is None or timestamp is None:
+        return True
+    try:
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00')) >= since_date
+    except (ValueError, AttributeError):
+        return True
+
+
+def file_digest(path: Path) -> str:
+    """Hash of a file's content (128-bit BLAKE2b, hex)."""
+    with open(path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def parse_feedback_file(path: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Parse one feedback file.
+
+    Module-level so it can run in a worker process.
+
+    Returns:
+        Tuple of (data, error); data is None for templates and empty files
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        if TEMPLATE_MARKER in content:
+            return None, None
+        data = yaml.load(content, Loader=YAML_LOADER)
+    except (yaml.YAMLError, IOError) as e:
+        return None, str(e)
+    return (data if isinstance(data, dict) and data else None), None
+
+
+def _encode(value: Any) -> Any:
+    """JSON-encode the datetime/date values YAML can produce."""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode(obj: Dict[str, Any]) -> Any:
+    if len(obj) == 1:
+        if '__datetime__' in obj:
+            return datetime.fromisoformat(obj['__datetime__'])
+        if '__date__' in obj:
+            return date.fromisoformat(obj['__date__'])
+    return obj
+
+
+class FeedbackParseCache:
+    """Parsed feedback files persisted in SQLite, validated by content hash.
+
+    Each file is one row, read only when it is asked for, so memory does
+    not grow with the number of cached files. An entry is fresh while the
+    file's mtime and size match; otherwise digest() hashes the file and
+    re-stamps the entry if the content is unchanged.
+    """
+
+    def __init__(self, cache_path: Optional[Path]):
+        """Open the cache.
+
+        Args:
+            cache_path: SQLite file backing the cache (None keeps it in memory)
+        """
+        self.cache_path = cache_path
+        self._db = None
+        if cache_path is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = self._open(str(cache_path))
+            except (OSError, sqlite3.Error) as e:
+                print(f"Warning: Could not open feedback parse cache: {e}")
+        if self._db is None:
+            self._db = self._open(':memory:')
+        # (mtime_ns, size, digest) per cached file; documents stay on disk until read
+        self._stats: Dict[str, Tuple[int, int, str]] = {
+            name: (mtime_ns, size, digest)
+            for name, mtime_ns, size, digest in self._db.execute("SELECT name, mtime_ns, size, digest FROM entries")
+        }
+
+    @staticmethod
+    def _open(path: str) -> sqlite3.Connection:
+        db = sqlite3.connect(path)
+        if db.execute("PRAGMA user_version").fetchone()[0] != CACHE_VERSION:
+            db.executescript(f"""
+                DROP TABLE IF EXISTS entries;
+                CREATE TABLE entries (
+                    name TEXT PRIMARY KEY, mtime_ns INTEGER NOT NULL, size INTEGER NOT NULL,
+                    digest TEXT NOT NULL, data TEXT
+                ) WITHOUT ROWID;
+                PRAGMA user_version = {CACHE_VERSION};
+            """)
+        return db
+
+    def fresh(self, name: str, stat) -> bool:
+        """Whether the cached entry for a file matches its mtime and size."""
+        cached = self._stats.get(name)
+        return cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size)
+
+    def digest(self, name: str, path: Path, stat) -> str:
+        """Content hash of a file, read from disk only if its mtime or size changed.
+
+        A file whose content still matches its entry is re-stamped with the
+        new mtime and size, so it is fresh again.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        cached = self._stats.get(name)
+        if self.fresh(name, stat):
+            return cached[2]
+        digest = file_digest(path)
+        if cached is not None and cached[2] == digest:
+            self._db.execute(
+                "UPDATE entries SET mtime_ns = ?, size = ? WHERE name = ?", (stat.st_mtime_ns, stat.st_size, name)
+            )
+            self._stats[name] = (stat.st_mtime_ns, stat.st_size, digest)
+        return digest
+
+    def get(self, name: str, stat) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Look up a file; returns (hit, data) where data may be None."""
+        if not self.fresh(name, stat):
+            return False, None
+        row = self._db.execute("SELECT data FROM entries WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            return False, None
+        return True, (json.loads(row[0], object_hook=_decode) if row[0] is not None else None)
+
+    def put(self, name: str, stat, digest: str, data: Optional[Dict[str, Any]]) -> None:
+        try:
+            encoded = json.dumps(data, default=_encode) if data is not None else None
+        except (TypeError, ValueError) as e:
+            print(f"Warning: Could not cache {name}: {e}")
+            return
+        self._db.execute(
+            "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+            (name, stat.st_mtime_ns, stat.st_size, digest, encoded)
+        )
+        self._stats[name] = (stat.st_mtime_ns, stat.st_size, digest)
+
+    def prune(self, names) -> None:
+        """Drop entries for files that no longer exist."""
+        stale = set(self._stats) - set(names)
+        self._db.executemany("DELETE FROM entries WHERE name = ?", [(name,) for name in stale])
+        for name in stale:
+            del self._stats[name]
+
+    def save(self) -> None:
+        """Commit pending changes."""
+        try:
+            self._db.commit()
+        except sqlite3.Error as e:
+            print(f"Warning: Could not write feedback parse cache: {e}")
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def parse_cache_path(cache_dir: Path, feedback_dir: Path) -> Path:
+    """Cache file for a feedback directory (one per resolved directory)."""
+    digest = hashlib.sha256(str(feedback_dir.resolve()).encode('utf-8')).hexdigest()[:12]
+    return cache_dir / f"feedback-parse-{digest}.sqlite3"
+
+
+def iter_feedback_files(
+    feedback_dir: Path,
+    since_date: Optional[datetime] = None,
+    cache_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    fingerprints: Optional[Dict[str, str]] = None,
+    known: Optional[Dict[str, str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """Stream feedback documents from a directory.
+
+    Only new and edited files are parsed up front; cached documents are
+    read from the parse cache one at a time as the caller advances, so a
+    caller that keeps a compact form of each document never holds the
+    whole window in memory. Files the caller already knows (same content
+    hash) are not parsed or read from the cache.
+
+    Args:
+        feedback_dir: Directory containing feedback YAML files
+        since_date: Skip files dated (by filename prefix) before this day
+        cache_dir: Directory for the parse cache (None disables persistence)
+        max_workers: Process pool size for uncached files
+        fingerprints: If given, filled with the content hash of each file in
+            the window, including known ones
+        known: Content hash per file the caller already has; unchanged
+            ones are skipped
+
+    Yields:
+        Feedback documents in filename order, each with `_filename` set;
+        the `timestamp` filter is left to the caller
+    """
+    cache = FeedbackParseCache(parse_cache_path(cache_dir, feedback_dir) if cache_dir else None)
+    try:
+        since_day = since_date.astimezone(timezone.utc).date() if since_date else None
+
+        paths = sorted(feedback_dir.glob("*.yaml"))
+        if cache_dir:
+            cache.prune(path.name for path in paths)
+
+        stats: Dict[str, Any] = {}
+        pending: List[Tuple[Path, Any, str]] = []
+        for path in paths:
+            # Skip template file
+            if 'TEMPLATE' in path.name:
+                continue
+            if since_day:
+                file_day = filename_date(path.name)
+                if file_day and file_day < since_day:
+                    continue
+            try:
+                stat = path.stat()
+                digest = cache.digest(path.name, path, stat)
+            except OSError as e:
+                print(f"Warning: Could not load {path.name}: {e}")
+                continue
+            if fingerprints is not None:
+                fingerprints[path.name] = digest
+            if known and known.get(path.name) == digest:
+                continue
+            stats[path.name] = stat
+            if not cache.fresh(path.name, stat):
+                pending.append((path, stat, digest))
+
+        parsed: Dict[str, Optional[Dict[str, Any]]] = {}
+        for (path, stat, digest), (data, error) in zip(pending, _parse_all([p for p, _, _ in pending], max_workers)):
+            if error:
+                print(f"Warning: Could not load {path.name}: {error}")
+                del stats[path.name]
+                continue
+            cache.put(path.name, stat, digest, data)
+            parsed[path.name] = data
+        cache.save()
+
+        for name, stat in stats.items():
+            data = parsed.pop(name) if name in parsed else cache.get(name, stat)[1]
+            if data:
+                item = dict(data)
+                item['_filename'] = name
+                yield item
+    finally:
+        cache.close()
+
+
+def load_feedback_files(
+    feedback_dir: Path,
+    since_date: Optional[datetime] = None,
+    cache_dir: Optional[Path] = None,
+    max_workers: Optional[int] = None,
+    fingerprints: Optional[Dict[str, str]] = None
+) -> List[Dict[str, Any]]:
+    """Load feedback documents from a directory.
+
+    Same arguments as iter_feedback_files().
+
+    Returns:
+        Feedback documents in filename order, each with `_filename` set
+    """
+    return list(iter_feedback_files(feedback_dir, since_date, cache_dir, max_workers, fingerprints))
+
+
+def _parse_all(paths: List[Path], max_workers: Optional[int]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """Parse files, in a process pool when there are enough of them."""
+    names = [str(path) for path in paths]
+    if len(names) >= PARALLEL_THRESHOLD:
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(parse_feedback_file, names, chunksize=8))
+        except (BrokenProcessPool, OSError, NotImplementedError) as e:
+            print(f"Warning: Parallel feedback loading unavailable, loading sequentially: {e}")
+    return [parse_feedback_file(name) for name in names]
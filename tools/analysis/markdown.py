@@ -0,0 +1,52 @@
+"""Markdown section extraction.
+
+A document is split into (heading, body) sections in one linear scan, and
+every later lookup is served from that map instead of re-running a
+backtracking regex over the whole document per heading.
+"""
+
+import re
+from typing import List, Tuple
+
+# "## Heading", "### Heading" ... (level-1 headings do not start a section)
+SECTION_HEADING_PATTERN = re.compile(r'##+ ')
+
+
+class MarkdownSections:
+    """Heading to body map for one markdown document."""
+
+    def __init__(self, content: str):
+        """Split a document into sections.
+
+        A section runs from its heading line to the next `##`-or-deeper
+        heading or the end of the document.
+
+        Args:
+            content: Markdown text
+        """
+        self.sections: List[Tuple[str, str]] = []
+        lines = content.split('\n')
+        heading = None
+        start = 0
+        for index, line in enumerate(lines):
+            if not SECTION_HEADING_PATTERN.match(line):
+                continue
+            if heading is not None:
+                self.sections.append((heading, '\n'.join(lines[start:index])))
+            # A heading on the last line (no newline after it) has no body
+            heading = line[line.index(' ') + 1:] if index < len(lines) - 1 else None
+            start = index + 1
+        if heading is not None:
+            self.sections.append((heading, '\n'.join(lines[start:])))
+        self._folded = [(title.casefold(), body) for title, body in self.sections]
+
+    def get(self, heading: str) -> str:
+        """Body of the first section whose heading starts with `heading`.
+
+        Matching is case-insensitive; returns "" if there is no such section.
+        """
+        prefix = heading.casefold()
+        for title, body in self._folded:
+            if title.startswith(prefix):
+                return body.strip()
+        return ""
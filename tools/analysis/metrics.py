@@ -0,0 +1,158 @@
+"""Run metrics and phase timings for the self-improvement analysis.
+
+The analyzer times each phase of a run and writes the counts and timings
+to a small metrics file, separate from the full results JSON, so CI steps
+and monitoring can read run cost and trends cheaply. The format follows
+the file suffix: JSON (`.json`), Prometheus text exposition (`.prom`) or
+OpenMetrics (`.om`).
+"""
+
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Bump when the JSON layout changes
+METRICS_VERSION = 1
+
+# Prefix for exported metric names
+METRIC_PREFIX = "kerrigan_self_improvement"
+
+# Metrics file format by suffix
+METRICS_FORMATS = {
+    '.json': 'json',
+    '.prom': 'prometheus',
+    '.om': 'openmetrics',
+}
+
+# Help text for the exported run counters
+METRIC_HELP = {
+    'feedback_processed': "Feedback items analyzed",
+    'patterns_found': "Retrospective patterns and related feedback groups found",
+    'proposals_generated': "Improvement proposals generated",
+    'high_priority_count': "High-priority improvement proposals",
+    'external_findings_count': "Findings from external research",
+}
+
+
+class PhaseTimer:
+    """Wall-clock timings for the phases of a run."""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.timings: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time a block, adding to any earlier time for the same phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+
+    @property
+    def total(self) -> float:
+        """Seconds since the timer was created."""
+        return time.perf_counter() - self.started
+
+
+def metrics_format(path: Path) -> str:
+    """Metrics format for a file, from its suffix."""
+    fmt = METRICS_FORMATS.get(path.suffix.lower())
+    if fmt is None:
+        suffixes = ', '.join(sorted(METRICS_FORMATS))
+        raise ValueError(f"Unknown metrics file type '{path.suffix}' (expected one of {suffixes})")
+    return fmt
+
+
+def render_metrics_json(metrics: Dict[str, Any], timings: Dict[str, float], total: float) -> str:
+    return json.dumps({
+        'version': METRICS_VERSION,
+        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'metrics': metrics,
+        'phase_seconds': {name: round(seconds, 6) for name, seconds in timings.items()},
+        'total_seconds': round(total, 6),
+    }, indent=2) + "\n"
+
+
+def render_metrics_text(
+    metrics: Dict[str, Any],
+    timings: Dict[str, float],
+    total: float,
+    openmetrics: bool = False
+) -> str:
+    """Render metrics in Prometheus text exposition or OpenMetrics format.
+
+    Args:
+        metrics: Run counters (numeric values only are exported)
+        timings: Seconds per phase
+        total: Seconds for the whole run
+        openmetrics: Emit OpenMetrics (adds units and the `# EOF` marker)
+
+    Returns:
+        Exposition text
+    """
+    lines: List[str] = []
+
+    def family(name: str, help_text: str, unit: Optional[str] = None) -> str:
+        full_name = f"{METRIC_PREFIX}_{name}"
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} gauge")
+        if openmetrics and unit:
+            lines.append(f"# UNIT {full_name} {unit}")
+        return full_name
+
+    for key, value in metrics.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        name = family(key, METRIC_HELP.get(key, key.replace('_', ' ').capitalize()))
+        lines.append(f"{name} {value}")
+
+    if timings:
+        name = family("phase_duration_seconds", "Wall-clock time per analysis phase", "seconds")
+        for phase, seconds in timings.items():
+            lines.append(f'{name}{{phase="{_escape_label(phase)}"}} {seconds:.6f}')
+
+    name = family("run_duration_seconds", "Wall-clock time of the whole analysis run", "seconds")
+    lines.append(f"{name} {total:.6f}")
+
+    name = family("last_run_timestamp_seconds", "Unix time the analysis run finished", "seconds")
+    lines.append(f"{name} {time.time():.3f}")
+
+    if openmetrics:
+        lines.append("# EOF")
+    return "\n".join(lines) + "\n"
+
+
+def write_metrics_file(path: Path, metrics: Dict[str, Any], timings: Dict[str, float], total: float) -> Path:
+    """Write metrics atomically in the format implied by the file suffix.
+
+    Args:
+        path: Destination file (.json, .prom or .om)
+        metrics: Run counters
+        timings: Seconds per phase
+        total: Seconds for the whole run
+
+    Returns:
+        The path written
+    """
+    fmt = metrics_format(path)
+    if fmt == 'json':
+        content = render_metrics_json(metrics, timings, total)
+    else:
+        content = render_metrics_text(metrics, timings, total, openmetrics=(fmt == 'openmetrics'))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(content)
+    # Scrapers never see a partially written file
+    tmp_path.replace(path)
+    return path
+
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
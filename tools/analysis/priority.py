@@ -0,0 +1,112 @@
+"""Feedback prioritization.
+
+Each feedback item is scored once from a weight table over its severity,
+status and category. The result is cached by the scorer (on the record's
+`priority` slot for FeedbackRecords, in a side table for plain documents,
+which are never modified) so the analyzer's counters, top-issue selection
+and proposal generation all read the same normalized fields instead of
+re-deriving them.
+"""
+
+import heapq
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import yaml
+
+from .records import FeedbackRecord
+
+# Points added for each field value; unlisted values score 0
+DEFAULT_PRIORITY_WEIGHTS: Dict[str, Dict[str, int]] = {
+    'severity': {'high': 10, 'medium': 5},
+    # Unaddressed feedback is higher priority
+    'status': {'new': 8, 'reviewed': 5},
+    # Some categories are more critical
+    'category': {'tool_limitation': 3, 'artifact_conflict': 3, 'prompt_clarity': 2},
+}
+
+# Statuses that still need action
+UNADDRESSED_STATUSES = ('new', 'reviewed')
+
+
+class PriorityInfo:
+    """Normalized fields and score for one feedback item."""
+
+    __slots__ = ('severity', 'status', 'category', 'agent_role', 'score', 'weights_key')
+
+    def __init__(self, item: Dict[str, Any], weights: Dict[str, Dict[str, int]], weights_key: tuple):
+        self.severity = item.get('severity', 'unknown')
+        self.status = item.get('status', 'new')
+        self.category = item.get('category', 'unknown')
+        self.agent_role = item.get('agent_role', 'unknown')
+        self.weights_key = weights_key
+        self.score = (
+            weights.get('severity', {}).get(self.severity, 0)
+            + weights.get('status', {}).get(self.status, 0)
+            + weights.get('category', {}).get(self.category, 0)
+        )
+
+    @property
+    def unaddressed(self) -> bool:
+        return self.status in UNADDRESSED_STATUSES
+
+
+def load_priority_weights(path: Path) -> Dict[str, Dict[str, int]]:
+    """Load a weight table from YAML or JSON, merged over the defaults.
+
+    Args:
+        path: File mapping field name to {value: points}
+
+    Returns:
+        Complete weight table
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        overrides = yaml.safe_load(f) or {}
+    if not isinstance(overrides, dict):
+        raise ValueError(f"Priority weights in {path} must be a mapping")
+
+    weights = {field: dict(values) for field, values in DEFAULT_PRIORITY_WEIGHTS.items()}
+    for field, values in overrides.items():
+        if not isinstance(values, dict):
+            raise ValueError(f"Priority weights for '{field}' must be a mapping")
+        weights.setdefault(field, {}).update({str(k): int(v) for k, v in values.items()})
+    return weights
+
+
+class PriorityScorer:
+    """Scores feedback items, caching the result per item."""
+
+    def __init__(self, weights: Optional[Dict[str, Dict[str, int]]] = None):
+        """Initialize the scorer.
+
+        Args:
+            weights: Weight table (defaults to DEFAULT_PRIORITY_WEIGHTS)
+        """
+        self.weights = weights if weights is not None else DEFAULT_PRIORITY_WEIGHTS
+        # Cached scores are only reused by a scorer with the same table
+        self._key = tuple(sorted(
+            (field, tuple(sorted(values.items()))) for field, values in self.weights.items()
+        ))
+        # Info for plain documents by id(); the item is kept so its id stays unique
+        self._scored: Dict[int, Tuple[Dict[str, Any], PriorityInfo]] = {}
+
+    def info(self, item: Dict[str, Any]) -> PriorityInfo:
+        """Get the (cached) priority info for an item."""
+        if isinstance(item, FeedbackRecord):
+            cached = item.priority
+            if cached is None or cached.weights_key != self._key:
+                cached = PriorityInfo(item, self.weights, self._key)
+                item.priority = cached
+            return cached
+        entry = self._scored.get(id(item))
+        if entry is None:
+            entry = (item, PriorityInfo(item, self.weights, self._key))
+            self._scored[id(item)] = entry
+        return entry[1]
+
+    def score(self, item: Dict[str, Any]) -> int:
+        return self.info(item).score
+
+    def top(self, items: Iterable[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+        """Highest-scoring items, ties kept in input order."""
+        return heapq.nlargest(limit, items, key=self.score)
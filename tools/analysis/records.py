@@ -0,0 +1,227 @@
+"""Compact in-memory feedback records.
+
+Aggregation only needs a handful of short fields per feedback item, but a
+parsed document also carries multi-paragraph descriptions, proposed
+solutions and so on. A FeedbackRecord keeps the counter fields (interned,
+so repeated values share one string), the title, the precomputed
+relatedness features, optionally the hashed shingles used by near-duplicate
+clustering, and a hashed fingerprint of the text. Everything the grouping
+engines need is computed from the parsed document while it is in hand.
+
+Any other field is read back on access, from the parse cache when the file
+is unchanged and from the file otherwise. In practice that only happens
+for the few items that end up in top issues or proposals.
+"""
+
+import hashlib
+import sys
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .grouping import FeedbackFeatures
+from .loader import FeedbackParseCache, parse_cache_path, parse_feedback_file
+from .similarity import DEFAULT_SHINGLE_SIZE, feedback_text, shingle_hashes
+
+# Fields kept on every record
+COMPACT_FIELDS = ('_filename', 'category', 'severity', 'agent_role', 'status', 'title', 'timestamp')
+
+# Full documents kept around after a lazy read (e.g. title then description)
+DEFAULT_DOCUMENT_CAPACITY = 32
+
+_MISSING = object()
+
+
+def text_fingerprint(item: Dict[str, Any]) -> str:
+    """Hash of the feedback text (title and description)."""
+    text = f"{item.get('title', '')}\0{item.get('description', '')}"
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _compact(value: Any) -> Any:
+    return sys.intern(value) if type(value) is str else value
+
+
+class FeedbackDocuments:
+    """Reads full feedback documents on demand, keeping the most recent few."""
+
+    def __init__(
+        self,
+        feedback_dir: Path,
+        capacity: int = DEFAULT_DOCUMENT_CAPACITY,
+        cache_dir: Optional[Path] = None
+    ):
+        """Initialize the reader.
+
+        Args:
+            feedback_dir: Directory containing the feedback files
+            capacity: Number of parsed documents to keep
+            cache_dir: Directory of the feedback parse cache to read
+                unchanged files from (None always parses the file)
+        """
+        self.feedback_dir = feedback_dir
+        self.capacity = capacity
+        self.cache_dir = cache_dir
+        # Files parsed from disk (parse cache hits are not counted)
+        self.reads = 0
+        self._recent: 'OrderedDict[str, Dict[str, Any]]' = OrderedDict()
+        self._cache: Optional[FeedbackParseCache] = None
+
+    def load(self, filename: str) -> Dict[str, Any]:
+        """Parsed document for a feedback file ({} if it can no longer be read)."""
+        data = self._recent.get(filename)
+        if data is not None:
+            self._recent.move_to_end(filename)
+            return data
+
+        data = self._cached(filename)
+        if data is None:
+            self.reads += 1
+            data, error = parse_feedback_file(str(self.feedback_dir / filename))
+            if error:
+                print(f"Warning: Could not reload {filename}: {error}")
+        data = data or {}
+        self._recent[filename] = data
+        if len(self._recent) > self.capacity:
+            self._recent.popitem(last=False)
+        return data
+
+    def close(self) -> None:
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
+
+    def _cached(self, filename: str) -> Optional[Dict[str, Any]]:
+        """Parsed document from the parse cache, if the file is unchanged."""
+        if self.cache_dir is None:
+            return None
+        if self._cache is None:
+            self._cache = FeedbackParseCache(parse_cache_path(self.cache_dir, self.feedback_dir))
+        path = self.feedback_dir / filename
+        try:
+            stat = path.stat()
+            # Re-stamps the entry if only the mtime changed
+            self._cache.digest(filename, path, stat)
+        except OSError:
+            return None
+        hit, data = self._cache.get(filename, stat)
+        return data if hit else None
+
+
+class FeedbackRecord:
+    """Compact stand-in for a parsed feedback document.
+
+    Supports the read-only mapping access the analyzer uses (`get`, `[]`,
+    `in`); fields outside COMPACT_FIELDS come from the feedback file.
+    """
+
+    __slots__ = COMPACT_FIELDS + ('features', 'shingles', 'fingerprint', 'priority', '_documents')
+
+    def __init__(self, item: Dict[str, Any], documents: FeedbackDocuments, keep_shingles: bool = False):
+        """Build a record from a parsed document.
+
+        Args:
+            item: Parsed feedback document (must have `_filename`)
+            documents: Reader used for fields that are not kept
+            keep_shingles: Also keep the hashed text shingles, for
+                near-duplicate clustering
+        """
+        for field in COMPACT_FIELDS:
+            setattr(self, field, _compact(item.get(field, _MISSING)))
+        self.features = FeedbackFeatures(item)
+        self.shingles: Optional['array[int]'] = shingle_hashes(feedback_text(item)) if keep_shingles else None
+        self.fingerprint = text_fingerprint(item)
+        # PriorityInfo, cached here by the PriorityScorer
+        self.priority = None
+        self._documents = documents
+
+    @classmethod
+    def restore(
+        cls,
+        filename: str,
+        fields: Dict[str, Any],
+        keys: Sequence[Sequence[Any]],
+        fingerprint: str,
+        documents: FeedbackDocuments
+    ) -> 'FeedbackRecord':
+        """Rebuild a record from a stored summary, without reading the file.
+
+        Args:
+            filename: Feedback file name
+            fields: compact_fields() of the document
+            keys: Relatedness index keys (FeedbackFeatures.index_keys())
+            fingerprint: text_fingerprint() of the document
+            documents: Reader used for fields that are not kept
+        """
+        record = cls.__new__(cls)
+        record._filename = _compact(filename)
+        for field in COMPACT_FIELDS[1:]:
+            setattr(record, field, _compact(fields.get(field, _MISSING)))
+        record.features = FeedbackFeatures.from_keys(fields.get('category'), keys)
+        record.shingles = None
+        record.fingerprint = fingerprint
+        record.priority = None
+        record._documents = documents
+        return record
+
+    def document(self) -> Dict[str, Any]:
+        """Full feedback document, read from disk."""
+        data = self._documents.load(self._filename)
+        if data and text_fingerprint(data) != self.fingerprint:
+            print(f"Warning: {self._filename} changed during analysis")
+        return data
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in COMPACT_FIELDS:
+            value = getattr(self, key)
+            return default if value is _MISSING else value
+        return self.document().get(key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+
+def compact_fields(item: Any) -> Dict[str, Any]:
+    """Compact fields (besides `_filename`) of a record or a plain document.
+
+    Values JSON cannot hold (e.g. timestamps YAML parsed as datetimes) are
+    left out, so the result can be persisted as is.
+    """
+    return {
+        field: item.get(field) for field in COMPACT_FIELDS[1:]
+        if field in item and isinstance(item.get(field), (str, int, float, bool, type(None)))
+    }
+
+
+def fingerprint_of(item: Any) -> str:
+    """text_fingerprint() of a record or a plain document."""
+    return item.fingerprint if isinstance(item, FeedbackRecord) else text_fingerprint(item)
+
+
+def features_of(item: Any) -> FeedbackFeatures:
+    """Relatedness features of a record or a plain feedback document."""
+    return item.features if isinstance(item, FeedbackRecord) else FeedbackFeatures(item)
+
+
+def record_features(items: Sequence[Any]) -> List[FeedbackFeatures]:
+    """Relatedness features for each of `items`."""
+    return [features_of(item) for item in items]
+
+
+def shingles_of(item: Any) -> 'array[int]':
+    """Hashed shingles (default size) of a record or a plain feedback document."""
+    if isinstance(item, FeedbackRecord) and item.shingles is not None:
+        return item.shingles
+    return shingle_hashes(feedback_text(item), DEFAULT_SHINGLE_SIZE)
+
+
+def record_shingles(items: Sequence[Any]) -> List['array[int]']:
+    """Hashed shingles for each of `items`."""
+    return [shingles_of(item) for item in items]
@@ -0,0 +1,213 @@
+"""Markdown report generation for the self-improvement analysis.
+
+The report is produced as a stream of lines so it can be written straight
+to a file without materialising the whole document.
+"""
+
+import io
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, TextIO
+
+
+def iter_report_lines(
+    feedback_analysis: Dict[str, Any],
+    retro_patterns: List[str],
+    proposals: List[Dict[str, Any]],
+    external_findings: Optional[List[Dict[str, Any]]] = None
+) -> Iterator[str]:
+    """Yield the markdown report line by line, section by section."""
+    yield from [
+        "# Kerrigan Self-Improvement Analysis Report",
+        f"\n**Generated**: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}",
+        "\n---\n",
+        "## Executive Summary\n",
+        f"- **Total feedback items analyzed**: {feedback_analysis.get('total_feedback', 0)}",
+        f"- **High-severity issues**: {feedback_analysis.get('high_severity_count', 0)}",
+        f"- **Unaddressed items**: {feedback_analysis.get('unaddressed_count', 0)}",
+        f"- **Improvement proposals generated**: {len(proposals)}",
+        f"- **Retrospective patterns identified**: {len(retro_patterns)}",
+    ]
+    
+    # Add external research summary if available
+    if external_findings:
+        yield f"- **External research findings**: {len(external_findings)}"
+    
+    yield from [
+        "\n---\n",
+        "## Internal Analysis\n",
+        "### Feedback Analysis\n"
+    ]
+    
+    if feedback_analysis.get('by_category'):
+        yield "#### Feedback by Category\n"
+        for category, count in sorted(
+            feedback_analysis['by_category'].items(), 
+            key=lambda x: x[1], 
+            reverse=True
+        ):
+            yield f"- **{category}**: {count}"
+        yield ""
+    
+    if feedback_analysis.get('by_severity'):
+        yield "#### Feedback by Severity\n"
+        for severity, count in sorted(
+            feedback_analysis['by_severity'].items(),
+            key=lambda x: {'high': 3, 'medium': 2, 'low': 1}.get(x[0], 0),
+            reverse=True
+        ):
+            yield f"- **{severity}**: {count}"
+        yield ""
+    
+    if feedback_analysis.get('related_groups'):
+        yield "#### Related Feedback Groups\n"
+        for group in feedback_analysis['related_groups']:
+            line = f"- **{group['category']}**: {group['count']} related items"
+            if group.get('title'):
+                line += f" (e.g. \"{group['title']}\")"
+            yield line
+        yield ""
+    
+    if retro_patterns:
+        yield "### Retrospective Patterns\n"
+        for pattern in retro_patterns:
+            yield f"- {pattern}"
+        yield ""
+    
+    # Add external research section
+    if external_findings:
+        yield from [
+            "---\n",
+            "## External Research Findings\n",
+            "\n*These findings are from external sources and require human review before implementation.*\n"
+        ]
+        
+        # Group findings by type
+        findings_by_type = {}
+        for finding in external_findings:
+            finding_type = finding.get('type', 'unknown')
+            if finding_type not in findings_by_type:
+                findings_by_type[finding_type] = []
+            findings_by_type[finding_type].append(finding)
+        
+        # Report each type
+        for finding_type, findings in findings_by_type.items():
+            yield f"\n### {finding_type.replace('_', ' ').title()}\n"
+            for finding in findings:
+                yield from [
+                    f"- **{finding.get('title', 'Untitled')}**",
+                    f"  - Summary: {finding.get('summary', 'N/A')}",
+                    f"  - Relevance: {finding.get('relevance', 0):.2f}",
+                    f"  - Potential application: {finding.get('potential_application', 'N/A')}",
+                    f"  - Evidence: {finding.get('evidence', 'N/A')}",
+                    ""
+                ]
+    
+    yield "---\n"
+    yield "## Improvement Proposals\n"
+    yield f"\n{len(proposals)} proposals generated for human review:\n"
+    
+    # Separate internal and external proposals (without copying the list)
+    if any(p.get('source') != 'external' for p in proposals):
+        yield "\n### Internal Analysis Proposals\n"
+        internal_proposals = (p for p in proposals if p.get('source') != 'external')
+        for i, proposal in enumerate(internal_proposals, 1):
+            yield from [
+                f"\n#### Proposal {i}: {proposal['title']}\n",
+                f"**Type**: {proposal['type']}  ",
+                f"**Priority**: {proposal['priority']}  ",
+                f"**Category**: {proposal['category']}  ",
+                f"\n**Description**: {proposal['description']}\n",
+                f"\n**Evidence**: {proposal['evidence']}\n",
+                f"\n**Proposed Solution**: {proposal['proposed_solution']}\n",
+                f"\n**Suggested Labels**: {', '.join(proposal['labels'])}\n"
+            ]
+    
+    if any(p.get('source') == 'external' for p in proposals):
+        yield from [
+            "\n### External Research Proposals\n",
+            "\n⚠️ **Human Review Required**: These proposals are based on external research and must be reviewed before implementation.\n"
+        ]
+        external_proposals = (p for p in proposals if p.get('source') == 'external')
+        for i, proposal in enumerate(external_proposals, 1):
+            yield from [
+                f"\n#### External Proposal {i}: {proposal['title']}\n",
+                f"**Type**: {proposal['type']}  ",
+                f"**Priority**: {proposal['priority']}  ",
+                f"**Relevance Score**: {proposal.get('relevance_score', 0):.2f}  ",
+                f"**Research Type**: {proposal.get('research_type', 'unknown')}  ",
+                f"\n**Description**: {proposal['description']}\n",
+                f"\n**Evidence**: {proposal['evidence']}\n",
+                f"\n**Proposed Solution**: {proposal['proposed_solution']}\n",
+                f"\n**Suggested Labels**: {', '.join(proposal['labels'])}\n"
+            ]
+    
+    yield from [
+        "\n---\n",
+        "## Next Steps\n",
+        "\n1. Review each proposal for relevance and priority",
+        "2. **For external research proposals**: Verify findings with original sources",
+        "3. Create GitHub issues for approved proposals",
+        "4. Assign proposals to appropriate team members or agents",
+        "5. Track implementation progress",
+        "6. Update feedback status as items are addressed\n"
+    ]
+
+
+def write_report(
+    out: TextIO,
+    feedback_analysis: Dict[str, Any],
+    retro_patterns: List[str],
+    proposals: List[Dict[str, Any]],
+    external_findings: Optional[List[Dict[str, Any]]] = None
+) -> None:
+    """Stream the markdown report to a file handle.
+
+    The report is never held in memory as a whole, so it scales to tens of
+    thousands of proposals and findings.
+    """
+    separator = ""
+    for line in iter_report_lines(feedback_analysis, retro_patterns, proposals, external_findings):
+        out.write(separator)
+        out.write(line)
+        separator = "\n"
+
+
+def write_report_file(
+    output_file: Path,
+    feedback_analysis: Dict[str, Any],
+    retro_patterns: List[str],
+    proposals: List[Dict[str, Any]],
+    external_findings: Optional[List[Dict[str, Any]]] = None
+) -> Path:
+    """Stream the markdown report to `output_file` and return its path."""
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        write_report(f, feedback_analysis, retro_patterns, proposals, external_findings)
+    print(f"Report written to: {output_file}")
+    return output_file
+
+
+def generate_report(
+    feedback_analysis: Dict[str, Any],
+    retro_patterns: List[str],
+    proposals: List[Dict[str, Any]],
+    external_findings: Optional[List[Dict[str, Any]]] = None,
+    output_file: Optional[Path] = None
+) -> str:
+    """Generate a markdown report of the analysis and proposals.
+
+    Builds the whole report in memory; prefer write_report_file() for
+    large analyses.
+    """
+    buffer = io.StringIO()
+    write_report(buffer, feedback_analysis, retro_patterns, proposals, external_findings)
+    report = buffer.getvalue()
+    
+    if output_file:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(report)
+        print(f"Report written to: {output_file}")
+    
+    return report
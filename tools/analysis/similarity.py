@@ -0,0 +1,274 @@
+"""Near-duplicate feedback clustering with MinHash and LSH.
+
+Feedback text (title and description) is split into word shingles and
+summarised by a MinHash signature. Signatures are split into bands and
+hashed into LSH buckets, so only items that collide in at least one band
+are compared. Links are confirmed with the exact Jaccard similarity of
+their shingle sets, which keeps the threshold precise. Within a bucket
+each item is compared with the members of every other cluster found so
+far, stopping at the first one it is similar to, so chained links (A~B,
+B~C) still join A and C while a bucket of k near-identical items costs k
+comparisons rather than k² pairs.
+
+Shingles are compared by their 32-bit hashes, so callers can precompute
+them (`shingle_hashes()`) and keep a few bytes per shingle instead of the
+text they came from.
+"""
+
+import hashlib
+import re
+from array import array
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence, Tuple
+
+# Default Jaccard similarity above which two items are near-duplicates
+DEFAULT_THRESHOLD = 0.8
+
+# Default signature length; longer signatures give more accurate LSH recall
+DEFAULT_NUM_PERM = 128
+
+# Words per shingle
+DEFAULT_SHINGLE_SIZE = 3
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def feedback_text(item: Dict[str, Any]) -> str:
+    """Text used to compare feedback items."""
+    return f"{item.get('title', '')} {item.get('description', '')}"
+
+
+def shingles(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> FrozenSet[str]:
+    """Split text into overlapping word shingles.
+
+    Texts shorter than `size` words yield a single shingle of the whole text.
+
+    Args:
+        text: Text to shingle
+        size: Number of words per shingle
+
+    Returns:
+        Set of shingles (empty if the text has no words)
+    """
+    tokens = _TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) <= size:
+        return frozenset([' '.join(tokens)]) if tokens else frozenset()
+    return frozenset(' '.join(tokens[i:i + size]) for i in range(len(tokens) - size + 1))
+
+
+def jaccard(a: FrozenSet, b: FrozenSet) -> float:
+    """Exact Jaccard similarity of two sets."""
+    if not a and not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+@lru_cache(maxsize=65536)
+def _stable_hash(value: str) -> int:
+    """32-bit hash that is stable across processes (unlike hash())."""
+    return int.from_bytes(hashlib.blake2b(value.encode('utf-8'), digest_size=4).digest(), 'little')
+
+
+def shingle_hashes(text: str, size: int = DEFAULT_SHINGLE_SIZE) -> 'array[int]':
+    """Sorted 32-bit hashes of the shingles of a text, packed 4 bytes each."""
+    return array('I', sorted({_stable_hash(s) for s in shingles(text, size)}))
+
+
+class MinHasher:
+    """Computes MinHash signatures with a fixed family of hash permutations."""
+
+    def __init__(self, num_perm: int = DEFAULT_NUM_PERM, seed: int = 1):
+        """Initialize the permutation family.
+
+        Args:
+            num_perm: Number of permutations (signature length)
+            seed: Seed for the permutation coefficients
+        """
+        if num_perm < 1:
+            raise ValueError("num_perm must be positive")
+        self.num_perm = num_perm
+        # Deterministic coefficients so signatures are reproducible run to run
+        self._perms: List[Tuple[int, int]] = []
+        for i in range(num_perm):
+            digest = hashlib.blake2b(f"{seed}:{i}".encode('utf-8'), digest_size=16).digest()
+            a = int.from_bytes(digest[:8], 'little') % (_MERSENNE_PRIME - 1) + 1
+            b = int.from_bytes(digest[8:], 'little') % _MERSENNE_PRIME
+            self._perms.append((a, b))
+
+    def signature(self, shingle_set: Iterable[str]) -> Tuple[int, ...]:
+        """Compute the MinHash signature of a set of shingles."""
+        return self.hashed_signature([_stable_hash(s) for s in shingle_set])
+
+    def hashed_signature(self, hashes: Sequence[int]) -> Tuple[int, ...]:
+        """Compute the MinHash signature of already hashed shingles."""
+        if not hashes:
+            return (_MAX_HASH,) * self.num_perm
+        prime = _MERSENNE_PRIME
+        return tuple(
+            min([(a * h + b) % prime for h in hashes]) & _MAX_HASH
+            for a, b in self._perms
+        )
+
+
+@lru_cache(maxsize=64)
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Choose (bands, rows) minimising false positives plus false negatives.
+
+    Two items with Jaccard similarity s become candidates with probability
+    1 - (1 - s^rows)^bands; the best split puts the steep part of that
+    curve at `threshold`.
+
+    Args:
+        threshold: Target Jaccard similarity (0.0 - 1.0)
+        num_perm: Signature length
+
+    Returns:
+        Tuple of (bands, rows) with bands * rows <= num_perm
+    """
+    def probability(s: float, bands: int, rows: int) -> float:
+        return 1.0 - (1.0 - s ** rows) ** bands
+
+    def integrate(f, lower: float, upper: float, steps: int = 50) -> float:
+        width = (upper - lower) / steps
+        return sum(f(lower + (i + 0.5) * width) for i in range(steps)) * width
+
+    best: Optional[Tuple[float, int, int]] = None
+    for bands in range(1, num_perm + 1):
+        for rows in range(1, num_perm // bands + 1):
+            false_positive = integrate(lambda s: probability(s, bands, rows), 0.0, threshold)
+            false_negative = integrate(lambda s: 1.0 - probability(s, bands, rows), threshold, 1.0)
+            error = false_positive + false_negative
+            if best is None or error < best[0]:
+                best = (error, bands, rows)
+    return best[1], best[2]
+
+
+class MinHashLSH:
+    """Banded LSH index over MinHash signatures."""
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = DEFAULT_NUM_PERM):
+        """Initialize an empty index.
+
+        Args:
+            threshold: Jaccard similarity the band layout is tuned for
+            num_perm: Signature length of inserted signatures
+        """
+        if not 0.0 < threshold <= 1.0:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = lsh_params(threshold, num_perm)
+        self._buckets: List[Dict[Tuple[int, ...], List[int]]] = [{} for _ in range(self.bands)]
+
+    def insert(self, key: int, signature: Sequence[int]) -> None:
+        """Add a signature to every band bucket."""
+        for band, buckets in enumerate(self._buckets):
+            start = band * self.rows
+            buckets.setdefault(tuple(signature[start:start + self.rows]), []).append(key)
+
+    def candidate_buckets(self) -> List[Tuple[int, ...]]:
+        """Distinct buckets holding more than one key, in first-seen order.
+
+        Near-duplicates usually share most bands, so the same bucket recurs
+        in many bands; it is returned once.
+        """
+        seen = set()
+        candidates = []
+        for buckets in self._buckets:
+            for keys in buckets.values():
+                bucket = tuple(keys)
+                if len(bucket) > 1 and bucket not in seen:
+                    seen.add(bucket)
+                    candidates.append(bucket)
+        return candidates
+
+
+def cluster_near_duplicates(
+    items: Sequence[Dict[str, Any]],
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = DEFAULT_NUM_PERM,
+    shingle_size: int = DEFAULT_SHINGLE_SIZE,
+    hashed_shingles: Optional[Sequence[Sequence[int]]] = None
+) -> List[Dict[str, Any]]:
+    """Cluster feedback items whose text is nearly identical.
+
+    Items are linked when their shingle sets have Jaccard similarity of at
+    least `threshold`; clusters are the connected components of those links.
+
+    Args:
+        items: Feedback items (must have `_filename`)
+        threshold: Minimum Jaccard similarity between linked items
+        num_perm: MinHash signature length
+        shingle_size: Words per shingle
+        hashed_shingles: Precomputed shingle_hashes() for `items` (computed
+            from their title and description if omitted)
+
+    Returns:
+        Clusters with count, category, a representative title and member
+        filenames, largest first (ties by first member position)
+    """
+    if hashed_shingles is None:
+        hashed_shingles = [shingle_hashes(feedback_text(item), shingle_size) for item in items]
+    shingle_sets = [frozenset(hashes) for hashes in hashed_shingles]
+    parent = list(range(len(items)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(a: int, b: int) -> None:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    # Exact duplicates are common in feedback: link them directly and only
+    # hash and index one representative per distinct shingle set
+    representatives: Dict[FrozenSet[int], int] = {}
+    for i, shingle_set in enumerate(shingle_sets):
+        if not shingle_set:
+            continue
+        first = representatives.setdefault(shingle_set, i)
+        if first != i:
+            union(first, i)
+
+    hasher = MinHasher(num_perm)
+    index = MinHashLSH(threshold, num_perm)
+    for shingle_set, i in representatives.items():
+        index.insert(i, hasher.hashed_signature(list(shingle_set)))
+
+    for bucket in index.candidate_buckets():
+        # Members seen so far in this bucket, by cluster root. An item is
+        # linked to a cluster by its first similar member, and every cluster
+        # it links to merges with its own
+        groups: Dict[int, List[int]] = {}
+        for i in bucket:
+            merged = [i]
+            for root in list(groups):
+                if find(root) == find(i) or any(
+                    jaccard(shingle_sets[i], shingle_sets[j]) >= threshold for j in groups[root]
+                ):
+                    union(root, i)
+                    merged.extend(groups.pop(root))
+            groups[find(i)] = merged
+
+    members: Dict[int, List[int]] = {}
+    for i in range(len(items)):
+        members.setdefault(find(i), []).append(i)
+
+    clusters = []
+    for root, indices in members.items():
+        if len(indices) < 2:
+            continue
+        first = items[indices[0]]
+        clusters.append({
+            'count': len(indices),
+            'category': first.get('category', 'unknown'),
+            'title': first.get('title', ''),
+            'items': [items[i]['_filename'] for i in indices],
+        })
+    clusters.sort(key=lambda c: -c['count'])
+    return clusters
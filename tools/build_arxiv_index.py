@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""Build or update the local arXiv index used by offline paper research.
+
+Reads arXiv metadata dumps, either the JSON Lines snapshot
+(`arxiv-metadata-oai-snapshot.json`) or Parquet with the same columns,
+and indexes papers in the selected categories. Re-running it with the same
+dumps only indexes new or revised papers.
+
+Usage:
+    python tools/build_arxiv_index.py arxiv-metadata-oai-snapshot.json
+    python tools/build_arxiv_index.py dump.parquet --categories cs.AI cs.CL --rebuild
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from research.arxiv_index import DEFAULT_CATEGORIES, DEFAULT_INDEX_PATH, build_index
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or update the local arXiv index")
+    parser.add_argument("dumps", nargs="+", help="arXiv metadata dumps (.json/.jsonl or .parquet)")
+    parser.add_argument(
+        "--index",
+        default=DEFAULT_INDEX_PATH,
+        help=f"Index file to build or update (default: {DEFAULT_INDEX_PATH})"
+    )
+    parser.add_argument(
+        "--categories",
+        nargs="*",
+        default=list(DEFAULT_CATEGORIES),
+        help=f"arXiv categories to index; none for all (default: {' '.join(DEFAULT_CATEGORIES)})"
+    )
+    parser.add_argument(
+        "--rebuild",
+        action="store_true",
+        help="Discard the existing index instead of updating it"
+    )
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    try:
+        stats = build_index(Path(args.index), [Path(dump) for dump in args.dumps], args.categories, args.rebuild)
+    except (OSError, ValueError) as e:
+        print(f"Error building arXiv index: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Indexed {args.index} in {time.monotonic() - started:.1f}s: "
+          f"{stats['added']} added, {stats['updated']} updated, {stats['unchanged']} unchanged, "
+          f"{stats['filtered']} outside the categories ({stats['read']} read)")
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""Checklist completion scoring for agent PRs.
+
+Matches the `- [x]` / `- [ ]` items in a PR body against the role's
+checklist (see agent_checklists.py) and reports how many required items
+the agent actually ticked. Matching is fuzzy (token-set similarity) but
+deterministic: ties are always broken by item order.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from agent_checklists import get_registry
+from text_tokens import tokenize as tokenize_words
+
+
+# Checkbox lines in a PR body: "- [x] text", "* [ ] text"
+PR_CHECKBOX_PATTERN = re.compile(r'^[ \t]*[-*+][ \t]+\[([ xX])\][ \t]+(.+?)[ \t]*$', re.MULTILINE)
+
+# Minimum token-set (Jaccard) similarity for a PR item to count as a checklist item
+MATCH_THRESHOLD = 0.5
+
+
+@dataclass
+class ChecklistScore:
+    """Completion of one PR against its role's checklist."""
+    agent_role: str
+    total: int
+    checked: List[str] = field(default_factory=list)
+    unchecked: List[str] = field(default_factory=list)
+    missing: List[str] = field(default_factory=list)
+    pr_number: Optional[int] = None
+
+    @property
+    def score(self) -> float:
+        """Fraction of checklist items ticked (0.0 - 1.0)."""
+        return len(self.checked) / self.total if self.total else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'pr_number': self.pr_number,
+            'agent_role': self.agent_role,
+            'score': round(self.score, 4),
+            'total': self.total,
+            'checked': self.checked,
+            'unchecked': self.unchecked,
+            'missing': self.missing,
+        }
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """Normalize text to a set of significant lowercase tokens."""
+    return frozenset(tokenize_words(text))
+
+
+def parse_checkboxes(pr_body: str) -> List[Tuple[bool, str]]:
+    """Extract (is_checked, text) for every checkbox item in a PR body."""
+    return [
+        (mark != ' ', text)
+        for mark, text in PR_CHECKBOX_PATTERN.findall(pr_body or '')
+    ]
+
+
+class ChecklistMatcher:
+    """Precomputed token sets for one role's checklist."""
+
+    def __init__(self, agent_role: str, items: List[str]):
+        self.agent_role = agent_role
+        self.items = items
+        self._item_tokens = [tokenize(item) for item in items]
+        self._exact = {' '.join(sorted(tokens)): index for index, tokens in enumerate(self._item_tokens)}
+        # token -> checklist item indices, so each PR item is only compared with candidates
+        self._index: Dict[str, List[int]] = {}
+        for index, tokens in enumerate(self._item_tokens):
+            for token in tokens:
+                self._index.setdefault(token, []).append(index)
+
+    def score(self, pr_body: str, pr_number: Optional[int] = None) -> ChecklistScore:
+        """Score a PR body against this checklist."""
+        boxes = parse_checkboxes(pr_body)
+        candidates: List[Tuple[float, int, int]] = []
+
+        for box_index, (_, text) in enumerate(boxes):
+            tokens = tokenize(text)
+            if not tokens:
+                continue
+            exact = self._exact.get(' '.join(sorted(tokens)))
+            if exact is not None:
+                candidates.append((1.0, exact, box_index))
+                continue
+            seen = set()
+            for token in tokens:
+                for item_index in self._index.get(token, ()):
+                    if item_index in seen:
+                        continue
+                    seen.add(item_index)
+                    item_tokens = self._item_tokens[item_index]
+                    similarity = len(tokens & item_tokens) / len(tokens | item_tokens)
+                    if similarity >= MATCH_THRESHOLD:
+                        candidates.append((similarity, item_index, box_index))
+
+        # Greedy one-to-one assignment, best matches first, ties by position
+        candidates.sort(key=lambda c: (-c[0], c[1], c[2]))
+        matched_items: Dict[int, int] = {}
+        used_boxes = set()
+        for _, item_index, box_index in candidates:
+            if item_index in matched_items or box_index in used_boxes:
+                continue
+            matched_items[item_index] = box_index
+            used_boxes.add(box_index)
+
+        result = ChecklistScore(agent_role=self.agent_role, total=len(self.items), pr_number=pr_number)
+        for item_index, item in enumerate(self.items):
+            box_index = matched_items.get(item_index)
+            if box_index is None:
+                result.missing.append(item)
+            elif boxes[box_index][0]:
+                result.checked.append(item)
+            else:
+                result.unchecked.append(item)
+        return result
+
+
+class ChecklistScorer:
+    """Scores PR bodies, reusing one matcher per role across many PRs."""
+
+    def __init__(self, repo_root: Optional[Path] = None):
+        self.registry = get_registry(repo_root)
+        self._matchers: Dict[str, Tuple[Tuple[str, ...], ChecklistMatcher]] = {}
+
+    def matcher(self, agent_role: str) -> Optional[ChecklistMatcher]:
+        """Get the matcher for a role, rebuilding it if the checklist changed."""
+        checklist = self.registry.get(agent_role)
+        if checklist is None:
+            return None
+        items = tuple(checklist[1])
+        cached = self._matchers.get(agent_role)
+        if cached is None or cached[0] != items:
+            cached = (items, ChecklistMatcher(agent_role, list(items)))
+            self._matchers[agent_role] = cached
+        return cached[1]
+
+    def score(self, agent_role: str, pr_body: str, pr_number: Optional[int] = None) -> Optional[ChecklistScore]:
+        """Score one PR body; returns None if the role has no checklist."""
+        matcher = self.matcher(agent_role)
+        if matcher is None:
+            return None
+        return matcher.score(pr_body, pr_number)
+
+    def score_export(self, records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Score every PR in an audit export in one pass.
+
+        Records may be PR objects (e.g. `gh pr list --json number,body,labels`)
+        or audit log entries with the body in `metadata.pr_body`.
+
+        Returns:
+            Dict with per-PR `scores`, per-role `by_role` summaries and
+            the number of `skipped` records (no body or no checklist)
+        """
+        scores = []
+        skipped = 0
+        by_role: Dict[str, Dict[str, float]] = {}
+
+        for record in records:
+            body = record.get('body')
+            if body is None:
+                body = (record.get('metadata') or {}).get('pr_body')
+            role = _record_role(record, body)
+            result = self.score(role, body, _record_number(record)) if role and body else None
+            if result is None:
+                skipped += 1
+                continue
+
+            scores.append(result.to_dict())
+            summary = by_role.setdefault(role, {'prs': 0, 'score_sum': 0.0, 'fully_complete': 0})
+            summary['prs'] += 1
+            summary['score_sum'] += result.score
+            if result.total and len(result.checked) == result.total:
+                summary['fully_complete'] += 1
+
+        return {
+            'scores': scores,
+            'by_role': {
+                role: {
+                    'prs': int(summary['prs']),
+                    'average_score': round(summary['score_sum'] / summary['prs'], 4),
+                    'fully_complete': int(summary['fully_complete']),
+                }
+                for role, summary in sorted(by_role.items())
+            },
+            'skipped': skipped,
+        }
+
+
+def _record_role(record: Dict[str, Any], body: Optional[str]) -> Optional[str]:
+    """Determine the agent role for an export record."""
+    role = record.get('agent_role')
+    if role:
+        return role
+    for label in record.get('labels') or []:
+        name = label.get('name', '') if isinstance(label, dict) else str(label)
+        if name.startswith('role:'):
+            return name
+    # Imported here: agent_audit imports this module for its CLI
+    from agent_audit import AgentSignature
+
+    signature = AgentSignature.from_text(body or '')
+    return signature.role.strip() if signature else None
+
+
+def _record_number(record: Dict[str, Any]) -> Optional[int]:
+    number = record.get('number', record.get('pr_number'))
+    return number if isinstance(number, int) else None
+
+
+def load_export(data: Any) -> List[Dict[str, Any]]:
+    """Normalize a loaded export (list of PRs or audit log with `entries`)."""
+    if isinstance(data, dict):
+        data = data.get('entries', data.get('pull_requests', []))
+    if not isinstance(data, list):
+        return []
+    return [record for record in data if isinstance(record, dict)]
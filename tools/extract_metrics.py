@@ -1,12 +1,25 @@
 #!/usr/bin/env python3
-"""Extract metrics from analysis results JSON for GitHub Actions output."""
+"""Extract metrics from the analysis metrics file for GitHub Actions output.
+
+Reads the small metrics file written by `self_improvement_analyzer.py
+--metrics-output analysis-metrics.json`. Falls back to the `metrics`
+section of the full `analysis-results.json` for runs without one.
+"""
 
 import json
 import sys
+from pathlib import Path
+
+METRICS_FILE = 'analysis-metrics.json'
+RESULTS_FILE = 'analysis-results.json'
 
 if __name__ == "__main__":
+    path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path(METRICS_FILE)
+    if not path.exists() and len(sys.argv) == 1:
+        path = Path(RESULTS_FILE)
+
     try:
-        with open('analysis-results.json', 'r') as f:
+        with open(path, 'r') as f:
             data = json.load(f)
         
         metrics = data['metrics']
@@ -17,6 +30,8 @@ if __name__ == "__main__":
         print(f"proposals_count={metrics['proposals_generated']}")
         print(f"high_priority={metrics['high_priority_count']}")
         print(f"external_findings={metrics.get('external_findings_count', 0)}")
+        if 'total_seconds' in data:
+            print(f"run_seconds={data['total_seconds']:.1f}")
         
     except (FileNotFoundError, KeyError, json.JSONDecodeError) as e:
         print(f"Error extracting metrics: {e}", file=sys.stderr)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""Quality bar compliance checks for agent artifacts.
+
+Artifacts are checked concurrently (the work is dominated by file reads),
+and results are returned in input order so output stays deterministic.
+"""
+
+from __future__ import annotations
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+# File extensions to skip for quality bar size checking (documentation and config files)
+SKIP_EXTENSIONS = {'.md', '.json', '.yaml', '.yml', '.txt'}
+
+WARN_LINES = 400
+FAIL_LINES = 800
+
+# Required sections for documentation artifacts (checked for architect/spec roles)
+REQUIRED_SECTIONS: Dict[str, List[str]] = {
+    "spec.md": ["## Goal", "## Scope", "## Non-goals", "## Acceptance criteria"],
+    "architecture.md": ["## Overview", "## Components & interfaces", "## Tradeoffs", "## Security & privacy notes"],
+}
+
+SECTION_CHECK_ROLES = {"role:architect", "role:spec"}
+
+# Below this many artifacts a thread pool costs more than it saves
+PARALLEL_THRESHOLD = 8
+
+
+@dataclass
+class QualityBarResult:
+    """Outcome of a quality bar check, with errors and warnings kept apart."""
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    # Errors and "WARNING:"-prefixed warnings together, in the order found
+    issues: List[str] = field(default_factory=list)
+
+    @property
+    def meets_standards(self) -> bool:
+        """True when there are no errors (warnings do not fail the check)."""
+        return not self.errors
+
+    def error(self, message: str) -> None:
+        self.errors.append(message)
+        self.issues.append(message)
+
+    def warning(self, message: str) -> None:
+        self.warnings.append(message)
+        self.issues.append(f"WARNING: {message}")
+
+    def extend(self, other: 'QualityBarResult') -> None:
+        self.errors.extend(other.errors)
+        self.warnings.extend(other.warnings)
+        self.issues.extend(other.issues)
+
+
+def count_lines(path: Path) -> int:
+    """Count lines the way text-mode iteration would, reading bytes once."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if b'\r' in data:
+        # Universal newlines treat lone CR as a line break as well
+        return sum(1 for _ in io.StringIO(data.decode('utf-8', errors='ignore'), newline=None))
+    return data.count(b'\n') + (1 if data and not data.endswith(b'\n') else 0)
+
+
+def missing_sections(path: Path, required_sections: List[str]) -> List[str]:
+    """Stream a document and return required sections it lacks.
+
+    Stops reading as soon as every section has been seen.
+    """
+    remaining = list(required_sections)
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            remaining = [section for section in remaining if section not in line]
+            if not remaining:
+                break
+    return remaining
+
+
+def _check_artifact(artifact_path: Path, check_sections: bool) -> Tuple[QualityBarResult, QualityBarResult]:
+    """Run size and section checks for one artifact.
+
+    Returns:
+        Tuple of (size check result, section check result)
+    """
+    size_result = QualityBarResult()
+    section_result = QualityBarResult()
+
+    try:
+        size = artifact_path.stat().st_size
+    except FileNotFoundError:
+        size_result.error(f"Artifact not found: {artifact_path}")
+        return size_result, section_result
+    except OSError as e:
+        size_result.error(f"Could not read file {artifact_path}: {e}")
+        return size_result, section_result
+
+    # Skip non-source files; a file of N bytes has at most N lines
+    if artifact_path.suffix not in SKIP_EXTENSIONS and size > WARN_LINES:
+        try:
+            line_count = count_lines(artifact_path)
+            if line_count > FAIL_LINES:
+                size_result.error(
+                    f"File {artifact_path} has {line_count} lines (exceeds {FAIL_LINES} line quality bar limit)"
+                )
+            elif line_count > WARN_LINES:
+                size_result.warning(
+                    f"File {artifact_path} has {line_count} lines (approaching {FAIL_LINES} line limit)"
+                )
+        except Exception as e:
+            size_result.error(f"Could not read file {artifact_path}: {e}")
+
+    required_sections = REQUIRED_SECTIONS.get(artifact_path.name)
+    if check_sections and required_sections:
+        try:
+            for section in missing_sections(artifact_path, required_sections):
+                section_result.error(f"Required section '{section}' missing in {artifact_path}")
+        except Exception as e:
+            section_result.error(f"Could not validate {artifact_path}: {e}")
+
+    return size_result, section_result
+
+
+def check_quality_bar(
+    agent_role: str,
+    artifact_paths: List[Path],
+    repo_root: Path = None,
+    max_workers: Optional[int] = None
+) -> QualityBarResult:
+    """
+    Check if agent output meets quality bar standards.
+
+    This performs basic checks based on the agent's quality bar specification:
+    - File size limits (no files >800 lines without justification)
+    - Required sections present in artifacts
+
+    Args:
+        agent_role: Role identifier (e.g., "role:swe", "role:architect")
+        artifact_paths: List of file paths to check
+        repo_root: Path to repository root (defaults to current directory)
+        max_workers: Thread pool size (defaults to ThreadPoolExecutor's default)
+
+    Returns:
+        QualityBarResult with the size issues of every artifact in input
+        order, followed by their missing sections
+    """
+    check_sections = agent_role in SECTION_CHECK_ROLES
+    result = QualityBarResult()
+
+    if len(artifact_paths) < PARALLEL_THRESHOLD:
+        per_artifact = [_check_artifact(path, check_sections) for path in artifact_paths]
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            per_artifact = list(executor.map(
+                lambda path: _check_artifact(path, check_sections), artifact_paths
+            ))
+
+    for size_result, _ in per_artifact:
+        result.extend(size_result)
+    for _, section_result in per_artifact:
+        result.extend(section_result)
+    return result
+
+
+def check_quality_bar_compliance(
+    agent_role: str,
+    artifact_paths: List[Path],
+    repo_root: Path = None
+) -> Tuple[bool, List[str]]:
+    """
+    Check quality bar compliance, returning a flat list of issues.
+
+    Warnings are included with a "WARNING:" prefix, interleaved with errors
+    in the order they were found (file sizes for every artifact, then
+    missing sections); prefer check_quality_bar() for separate error and
+    warning lists.
+
+    Returns:
+        Tuple of (meets_standards, list_of_issues)
+    """
+    result = check_quality_bar(agent_role, artifact_paths, repo_root)
+    return len(result.issues) == 0, list(result.issues)
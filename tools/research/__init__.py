@@ -4,11 +4,41 @@ This package contains modular research components for gathering external
 insights about AI agent best practices.
 """
 
+from .arxiv_index import ArxivIndex, build_index
 from .base import BaseResearcher
+from .cache import (
+    CACHE_BACKENDS,
+    DEFAULT_TTLS,
+    FileResearchCache,
+    ResearchCache,
+    SqliteResearchCache,
+    open_research_cache,
+)
+from .github_client import GitHubClient, GraphQLError, RateLimitError
 from .github_researcher import GitHubAnalysisResearcher
+from .github_store import GitHubStore
 from .web_researcher import WebSearchResearcher
 from .paper_researcher import PaperResearcher
 from .framework_researcher import FrameworkAnalysisResearcher
+from .plugins import ENTRY_POINT_GROUP, ResearchContext, ResearcherPlugin, discover_plugins
+from .runner import (
+    DEFAULT_DEADLINE,
+    DEFAULT_SOURCE_TIMEOUT,
+    ResearchResult,
+    ResearchTask,
+    run_research,
+    stream_research,
+)
+from .rate_limit import TokenBucket
+from .relevance import FindingMatrix, remove_near_duplicates
+from .tasks import (
+    BUILTIN_PLUGINS,
+    build_research_context,
+    open_research_transport,
+    run_plugins,
+    select_plugins,
+)
+from .transport import RecordingTransport, ReplayTransport, Transport
 
 __all__ = [
     'BaseResearcher',
@@ -16,4 +46,37 @@ __all__ = [
     'WebSearchResearcher',
     'PaperResearcher',
     'FrameworkAnalysisResearcher',
+    'ResearchTask',
+    'ResearchResult',
+    'run_research',
+    'stream_research',
+    'ResearchContext',
+    'ResearcherPlugin',
+    'discover_plugins',
+    'ENTRY_POINT_GROUP',
+    'BUILTIN_PLUGINS',
+    'build_research_context',
+    'select_plugins',
+    'run_plugins',
+    'open_research_transport',
+    'Transport',
+    'RecordingTransport',
+    'ReplayTransport',
+    'DEFAULT_SOURCE_TIMEOUT',
+    'DEFAULT_DEADLINE',
+    'GitHubClient',
+    'RateLimitError',
+    'GraphQLError',
+    'GitHubStore',
+    'ResearchCache',
+    'FileResearchCache',
+    'SqliteResearchCache',
+    'open_research_cache',
+    'CACHE_BACKENDS',
+    'DEFAULT_TTLS',
+    'TokenBucket',
+    'ArxivIndex',
+    'build_index',
+    'FindingMatrix',
+    'remove_near_duplicates',
 ]
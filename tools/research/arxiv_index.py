@@ -0,0 +1,324 @@
+"""Offline arXiv search over a local metadata dump.
+
+`build_index()` reads an arXiv metadata dump and writes an inverted index
+to a single SQLite file. The dump is either the JSON Lines snapshot (one
+paper per line with `id`, `title`, `abstract`, `categories` and
+`update_date`) or a Parquet file with the same columns. `ArxivIndex`
+ranks papers against a query with BM25, without network access.
+
+Updates are incremental:
+
+- Papers whose `update_date` has not changed are skipped
+- Revised papers have their postings replaced
+- For JSON Lines dumps, the byte offset reached is remembered, so a dump
+  that only had lines appended is read from where the last build stopped
+"""
+
+import json
+import math
+import os
+import sqlite3
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from text_tokens import tokenize
+
+# Default location, next to the research cache
+DEFAULT_INDEX_PATH = ".research_cache/arxiv-index.sqlite3"
+
+# Categories indexed by default (agents, multi-agent systems, software engineering)
+DEFAULT_CATEGORIES = ('cs.AI', 'cs.MA', 'cs.SE')
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Title terms count this many times (titles are short and on topic)
+TITLE_WEIGHT = 2
+
+# Papers written per transaction while building
+BATCH_SIZE = 1000
+
+
+def _paper_terms(title: str, abstract: str) -> Counter:
+    terms = Counter(tokenize(abstract))
+    for token in tokenize(title):
+        terms[token] += TITLE_WEIGHT
+    return terms
+
+
+def _read_jsonl(path: Path, offset: int) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """Yield (record, end offset) from a JSON Lines dump, starting at a byte offset."""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        position = offset
+        for line in f:
+            if not line.endswith(b'\n'):
+                # Partially written last line: pick it up on the next update
+                break
+            position += len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                print(f"   ⚠️  Skipping malformed line at byte {position - len(line)} of {path}")
+                continue
+            if isinstance(record, dict):
+                yield record, position
+
+
+def _read_parquet(path: Path) -> Iterator[Tuple[Dict[str, Any], int]]:
+    """Yield (record, 0) from a Parquet dump (requires pyarrow)."""
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError(f"Reading {path} requires pyarrow. Install with: pip install pyarrow")
+    parquet = pq.ParquetFile(str(path))
+    columns = [name for name in ('id', 'title', 'abstract', 'categories', 'update_date')
+               if name in parquet.schema_arrow.names]
+    for batch in parquet.iter_batches(columns=columns):
+        for record in batch.to_pylist():
+            yield record, 0
+
+
+def _matches(categories: str, wanted: Optional[frozenset]) -> bool:
+    return wanted is None or not wanted.isdisjoint(categories.split())
+
+
+class ArxivIndex:
+    """Inverted index of arXiv papers in a SQLite file."""
+
+    def __init__(self, path: Path):
+        """Open (or create) an index.
+
+        Args:
+            path: SQLite index file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        # The index can always be rebuilt from the dump, so favour write speed
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(f"PRAGMA cache_size=-{64 * 1024}")
+        with self._db:
+            self._db.executescript("""
+                CREATE TABLE IF NOT EXISTS papers (
+                    doc_id INTEGER PRIMARY KEY, arxiv_id TEXT UNIQUE NOT NULL,
+                    title TEXT NOT NULL, abstract TEXT NOT NULL, categories TEXT NOT NULL,
+                    updated TEXT NOT NULL, length INTEGER NOT NULL);
+                CREATE TABLE IF NOT EXISTS postings (
+                    term TEXT NOT NULL, doc_id INTEGER NOT NULL, tf INTEGER NOT NULL,
+                    PRIMARY KEY (term, doc_id)) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS sources (
+                    path TEXT PRIMARY KEY, size INTEGER NOT NULL, offset INTEGER NOT NULL);
+                CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            """)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> 'ArxivIndex':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    @property
+    def size(self) -> int:
+        """Number of indexed papers."""
+        return int(self._meta('documents') or 0)
+
+    def update(
+        self,
+        dumps: Sequence[Path],
+        categories: Optional[Sequence[str]] = DEFAULT_CATEGORIES,
+        rebuild: bool = False
+    ) -> Dict[str, int]:
+        """Add new and revised papers from metadata dumps.
+
+        Args:
+            dumps: JSON Lines (.json/.jsonl) or Parquet (.parquet) dumps
+            categories: arXiv categories to index (None for all)
+            rebuild: Drop the existing index first
+
+        Returns:
+            Counts of papers read, added, updated, unchanged and filtered out
+
+        Raises:
+            ValueError: If categories differ from the existing index's
+                (without rebuild), or a dump cannot be read
+        """
+        wanted = frozenset(categories) if categories else None
+        category_key = ' '.join(sorted(wanted)) if wanted else '*'
+        if rebuild:
+            with self._db:
+                for table in ('papers', 'postings', 'sources', 'meta'):
+                    self._db.execute(f"DELETE FROM {table}")
+        existing = self._meta('categories')
+        if existing is not None and existing != category_key:
+            raise ValueError(
+                f"Index {self.path} covers categories '{existing}'; rebuild it to index '{category_key}'"
+            )
+
+        stats = {'read': 0, 'added': 0, 'updated': 0, 'unchanged': 0, 'filtered': 0}
+        for dump in dumps:
+            dump = Path(dump)
+            size = dump.stat().st_size
+            key = str(dump.resolve())
+            if dump.suffix == '.parquet':
+                records: Iterable[Tuple[Dict[str, Any], int]] = _read_parquet(dump)
+                offset = 0
+            else:
+                row = self._db.execute("SELECT size, offset FROM sources WHERE path = ?", (key,)).fetchone()
+                # Resume appended dumps; a smaller file was replaced, so read it all
+                offset = row[1] if row and size >= row[1] else 0
+                records = _read_jsonl(dump, offset)
+
+            batch: List[Dict[str, Any]] = []
+            for record, position in records:
+                stats['read'] += 1
+                offset = position
+                if not _matches(str(record.get('categories') or ''), wanted):
+                    stats['filtered'] += 1
+                    continue
+                batch.append(record)
+                if len(batch) >= BATCH_SIZE:
+                    self._write(batch, stats)
+                    batch = []
+            self._write(batch, stats)
+            if dump.suffix != '.parquet':
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO sources (path, size, offset) VALUES (?, ?, ?)", (key, size, offset)
+                    )
+
+        with self._db:
+            documents, total_length = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length), 0) FROM papers"
+            ).fetchone()
+            self._set_meta('categories', category_key)
+            self._set_meta('documents', str(documents))
+            self._set_meta('total_length', str(total_length))
+        return stats
+
+    def _write(self, records: List[Dict[str, Any]], stats: Dict[str, int]) -> None:
+        """Insert or replace a batch of papers and their postings."""
+        postings: List[Tuple[str, int, int]] = []
+        with self._db:
+            for record in records:
+                arxiv_id = str(record.get('id') or '').strip()
+                if not arxiv_id:
+                    continue
+                title = ' '.join(str(record.get('title') or '').split())
+                abstract = ' '.join(str(record.get('abstract') or '').split())
+                updated = str(record.get('update_date') or '')
+
+                row = self._db.execute(
+                    "SELECT doc_id, title, abstract, updated FROM papers WHERE arxiv_id = ?", (arxiv_id,)
+                ).fetchone()
+                if row and row[3] == updated:
+                    stats['unchanged'] += 1
+                    continue
+
+                terms = _paper_terms(title, abstract)
+                values = (title, abstract, str(record.get('categories') or ''), updated, sum(terms.values()))
+                if row:
+                    doc_id = row[0]
+                    self._db.executemany(
+                        "DELETE FROM postings WHERE term = ? AND doc_id = ?",
+                        [(term, doc_id) for term in _paper_terms(row[1], row[2])]
+                    )
+                    self._db.execute(
+                        "UPDATE papers SET title = ?, abstract = ?, categories = ?, updated = ?, length = ? "
+                        "WHERE doc_id = ?", (*values, doc_id)
+                    )
+                    stats['updated'] += 1
+                else:
+                    doc_id = self._db.execute(
+                        "INSERT INTO papers (arxiv_id, title, abstract, categories, updated, length) "
+                        "VALUES (?, ?, ?, ?, ?, ?)", (arxiv_id, *values)
+                    ).lastrowid
+                    stats['added'] += 1
+                postings.extend((term, doc_id, tf) for term, tf in terms.items())
+            # Inserting in key order keeps B-tree writes sequential
+            postings.sort()
+            self._db.executemany("INSERT INTO postings (term, doc_id, tf) VALUES (?, ?, ?)", postings)
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """Rank papers against a query with BM25.
+
+        Args:
+            query: Free-text query
+            limit: Maximum results
+
+        Returns:
+            Papers (arxiv_id, title, abstract, categories, updated) with
+            their BM25 `score` and `coverage`, the share of query terms
+            they contain; best first
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        documents = self.size
+        if not terms or not documents:
+            return []
+        average_length = int(self._meta('total_length') or 0) / documents or 1
+
+        scores: Dict[int, float] = {}
+        matched: Counter = Counter()
+        for term in terms:
+            postings = self._db.execute(
+                "SELECT p.doc_id, p.tf, d.length FROM postings p JOIN papers d ON d.doc_id = p.doc_id "
+                "WHERE p.term = ?", (term,)
+            ).fetchall()
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1 + (documents - df + 0.5) / (df + 0.5))
+            for doc_id, tf, length in postings:
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * length / average_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+                matched[doc_id] += 1
+
+        best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        results = []
+        for doc_id, score in best:
+            arxiv_id, title, abstract, categories, updated = self._db.execute(
+                "SELECT arxiv_id, title, abstract, categories, updated FROM papers WHERE doc_id = ?", (doc_id,)
+            ).fetchone()
+            results.append({
+                'arxiv_id': arxiv_id,
+                'title': title,
+                'abstract': abstract,
+                'categories': categories,
+                'updated': updated,
+                'score': score,
+                'coverage': matched[doc_id] / len(terms),
+            })
+        return results
+
+
+def build_index(
+    index_path: Path,
+    dumps: Sequence[Path],
+    categories: Optional[Sequence[str]] = DEFAULT_CATEGORIES,
+    rebuild: bool = False
+) -> Dict[str, int]:
+    """Build or incrementally update an index file (see ArxivIndex.update)."""
+    with ArxivIndex(index_path) as index:
+        return index.update(dumps, categories, rebuild)
+
+
+def open_index(index_path: Optional[str]) -> Optional[ArxivIndex]:
+    """Open an existing index, or None if there is none at the path."""
+    if not index_path or not os.path.isfile(index_path):
+        return None
+    return ArxivIndex(Path(index_path))
@@ -3,19 +3,35 @@
 This module provides the base class for all external research components.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
+
+from .cache import ResearchCache
+from .rate_limit import TokenBucket
 
 
 class BaseResearcher:
     """Base class for all researcher modules."""
     
-    def __init__(self, enabled: bool = True):
+    # Cache namespace; also selects the cache TTL (see cache.DEFAULT_TTLS)
+    cache_namespace = 'research'
+    
+    def __init__(
+        self,
+        enabled: bool = True,
+        cache: Optional[ResearchCache] = None,
+        rate_limiter: Optional[TokenBucket] = None
+    ):
         """Initialize the researcher.
         
         Args:
             enabled: Whether this researcher is enabled
+            cache: Shared research cache (None disables caching)
+            rate_limiter: Token bucket shared with other researchers calling
+                the same services (None for no limit)
         """
         self.enabled = enabled
+        self.cache = cache
+        self.rate_limiter = rate_limiter
         self.findings: List[Dict[str, Any]] = []
     
     def is_enabled(self) -> bool:
@@ -25,3 +41,19 @@ class BaseResearcher:
     def get_findings(self) -> List[Dict[str, Any]]:
         """Get all findings from this researcher."""
         return self.findings
+    
+    def throttle(self) -> None:
+        """Wait until the shared rate limit allows another request."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+    
+    def cache_get(self, key: str) -> Optional[Any]:
+        """Cached value for a key, or None if missing, expired or uncached."""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.cache_namespace, key)
+    
+    def cache_put(self, key: str, value: Any) -> None:
+        """Cache a JSON-serializable value under this researcher's namespace."""
+        if self.cache is not None:
+            self.cache.put(self.cache_namespace, key, value)
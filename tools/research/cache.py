@@ -0,0 +1,296 @@
+"""Shared cache for research results.
+
+All researchers store results through one ResearchCache, namespaced by
+source ('web', 'github', 'frameworks', 'papers'). Each source has its own
+time-to-live, and the store is bounded in size: when it grows past
+`max_bytes`, the least recently used entries are evicted.
+
+Two stores are available:
+
+- FileResearchCache keeps one JSON file per entry under
+  `<cache_dir>/<source>/`, written atomically
+- SqliteResearchCache keeps every entry in a single SQLite database file,
+  so the cache directory does not accumulate thousands of files
+
+Both are safe to share between the threads of a research run.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Seconds a cached entry stays valid, per source
+DEFAULT_TTLS: Dict[str, float] = {
+    'web': 7 * 24 * 3600,
+    # Responses are revalidated with ETags, so they can be kept longer
+    'github': 30 * 24 * 3600,
+    'frameworks': 24 * 3600,
+    'papers': 7 * 24 * 3600,
+}
+
+# TTL for sources not listed in DEFAULT_TTLS
+DEFAULT_TTL = 24 * 3600
+
+# Upper bound on the total size of cached values
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+# Available stores (see --research-cache)
+CACHE_BACKENDS = ('files', 'sqlite', 'off')
+
+# Database file name for the SQLite store
+SQLITE_FILENAME = "research-cache.sqlite3"
+
+
+class ResearchCache(ABC):
+    """Interface of a research cache store."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, ttls: Optional[Dict[str, float]] = None):
+        """Initialize the store settings.
+
+        Args:
+            max_bytes: Size above which least recently used entries are evicted
+            ttls: Seconds entries stay valid, per source (merged over DEFAULT_TTLS)
+        """
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._lock = threading.RLock()
+
+    def ttl(self, namespace: str) -> float:
+        return self.ttls.get(namespace, DEFAULT_TTL)
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """Cached value, or None if missing or expired."""
+
+    @abstractmethod
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        """Store a JSON-serializable value, evicting old entries if needed."""
+
+    def close(self) -> None:
+        """Release any resources held by the store."""
+
+
+def _encode(value: Any) -> str:
+    return json.dumps(value, separators=(',', ':'))
+
+
+class FileResearchCache(ResearchCache):
+    """One JSON file per entry; file mtime records the last access."""
+
+    def __init__(self, cache_dir: Path, max_bytes: int = DEFAULT_MAX_BYTES, ttls: Optional[Dict[str, float]] = None):
+        """Initialize the store.
+
+        Args:
+            cache_dir: Root directory; entries go in one subdirectory per source
+            max_bytes: Size above which least recently used entries are evicted
+            ttls: Seconds entries stay valid, per source
+        """
+        super().__init__(max_bytes, ttls)
+        self.cache_dir = Path(cache_dir)
+        # Total size of entry files, measured on first write
+        self._size: Optional[int] = None
+
+    def _path(self, namespace: str, key: str) -> Path:
+        return self.cache_dir / namespace / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        now = time.time()
+        path = self._path(namespace, key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError, IOError):
+            return None
+        if not isinstance(entry, dict) or entry.get('key') != key:
+            return None
+        if now - entry.get('created', 0) > self.ttl(namespace):
+            self._remove(path)
+            return None
+        try:
+            # Mark as recently used
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        return entry.get('value')
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        now = time.time()
+        path = self._path(namespace, key)
+        content = _encode({'key': key, 'created': now, 'value': value})
+        with self._lock:
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                previous = path.stat().st_size if path.exists() else 0
+                tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    f.write(content)
+                os.utime(tmp_path, (now, now))
+                tmp_path.replace(path)
+            except (OSError, TypeError) as e:
+                print(f"      ⚠️  Failed to cache {namespace} result: {e}")
+                return
+            if self._size is None:
+                self._size = sum(size for _, size, _ in self._entries())
+            else:
+                self._size += len(content.encode('utf-8')) - previous
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """(mtime, size, path) of every entry file."""
+        entries = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        self._size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if self._size <= self.max_bytes:
+                break
+            self._remove(path)
+            self._size -= size
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+class SqliteResearchCache(ResearchCache):
+    """All entries in a single SQLite database file."""
+
+    def __init__(self, db_path: Path, max_bytes: int = DEFAULT_MAX_BYTES, ttls: Optional[Dict[str, float]] = None):
+        """Open (or create) the database.
+
+        Args:
+            db_path: SQLite database file
+            max_bytes: Size above which least recently used entries are evicted
+            ttls: Seconds entries stay valid, per source
+        """
+        super().__init__(max_bytes, ttls)
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.db_path), timeout=10, check_same_thread=False)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL,"
+                " size INTEGER NOT NULL, created REAL NOT NULL, accessed REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+            # Running total of entry sizes, kept in step with every write
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL)"
+            )
+            self._db.execute(
+                "INSERT OR IGNORE INTO totals (id, size) SELECT 0, COALESCE(SUM(size), 0) FROM entries"
+            )
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT value, created FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[1] > self.ttl(namespace):
+                self._delete(namespace, key)
+                return None
+            self._db.execute(
+                "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?", (now, namespace, key)
+            )
+        try:
+            return json.loads(row[0])
+        except json.JSONDecodeError:
+            return None
+
+    def put(self, namespace: str, key: str, value: Any) -> None:
+        try:
+            content = _encode(value)
+        except (TypeError, ValueError) as e:
+            print(f"      ⚠️  Failed to cache {namespace} result: {e}")
+            return
+        size = len(content.encode('utf-8'))
+        now = time.time()
+        with self._lock, self._db:
+            previous = self._db.execute(
+                "SELECT size FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+            ).fetchone()
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries (namespace, key, value, size, created, accessed)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (namespace, key, content, size, now, now)
+            )
+            total = self._add_size(size - (previous[0] if previous else 0))
+            if total <= self.max_bytes:
+                return
+            evict = []
+            freed = 0
+            for rowid, entry_size in self._db.execute("SELECT rowid, size FROM entries ORDER BY accessed"):
+                if total - freed <= self.max_bytes:
+                    break
+                evict.append((rowid,))
+                freed += entry_size
+            self._db.executemany("DELETE FROM entries WHERE rowid = ?", evict)
+            self._add_size(-freed)
+
+    def _add_size(self, delta: int) -> int:
+        """Adjust the running total (inside the caller's transaction) and return it."""
+        if delta:
+            self._db.execute("UPDATE totals SET size = size + ? WHERE id = 0", (delta,))
+        return self._db.execute("SELECT size FROM totals WHERE id = 0").fetchone()[0]
+
+    def _delete(self, namespace: str, key: str) -> None:
+        row = self._db.execute(
+            "SELECT size FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+        ).fetchone()
+        if row is not None:
+            self._db.execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key))
+            self._add_size(-row[0])
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+def open_research_cache(
+    cache_dir: Optional[str],
+    backend: str = 'files',
+    max_bytes: int = DEFAULT_MAX_BYTES,
+    ttls: Optional[Dict[str, float]] = None
+) -> Optional[ResearchCache]:
+    """Open the research cache store for a directory.
+
+    Args:
+        cache_dir: Cache directory (None disables caching)
+        backend: 'files', 'sqlite' or 'off'
+        max_bytes: Size above which least recently used entries are evicted
+        ttls: Seconds entries stay valid, per source
+
+    Returns:
+        The store, or None when caching is off
+    """
+    if backend not in CACHE_BACKENDS:
+        raise ValueError(f"Unknown research cache backend: {backend}")
+    if cache_dir is None or backend == 'off':
+        return None
+    if backend == 'sqlite':
+        return SqliteResearchCache(Path(cache_dir) / SQLITE_FILENAME, max_bytes, ttls)
+    return FileResearchCache(Path(cache_dir), max_bytes, ttls)
@@ -1,36 +1,149 @@
 """Agent framework analyzer.
 
 This module analyzes other agent frameworks for best practices.
+
+Repository metadata for all configured frameworks is fetched concurrently
+through one GitHub client, whose keep-alive connection pool lets the
+requests share a few persistent connections. Findings are reported in the
+configured framework order regardless of which request finishes first.
 """
 
-import json
+import os
 import urllib.error
-import urllib.request
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
 
 from .base import BaseResearcher
+from .cache import ResearchCache
+from .github_client import DEFAULT_API_URL, GitHubClient, RateLimitError
+from .github_graphql import fetch_repositories
+from .transport import Transport
+
+# Popular agent frameworks analyzed when no framework file is given
+DEFAULT_FRAMEWORKS: List[Dict[str, str]] = [
+    {'owner': 'Significant-Gravitas', 'repo': 'AutoGPT', 'name': 'AutoGPT'},
+    {'owner': 'joaomdmoura', 'repo': 'crewAI', 'name': 'CrewAI'},
+    {'owner': 'langchain-ai', 'repo': 'langgraph', 'name': 'LangGraph'},
+    {'owner': 'geekan', 'repo': 'MetaGPT', 'name': 'MetaGPT'},
+]
+
+# Repository requests in flight at once
+DEFAULT_MAX_WORKERS = 8
+
+# Fields a framework entry may set to describe its insight
+INSIGHT_FIELDS = ('title', 'summary', 'application')
+
+# Framework-specific insights based on known characteristics
+FRAMEWORK_INSIGHTS: Dict[str, Dict[str, str]] = {
+    'AutoGPT': {
+        'title': 'Autonomous Goal-Driven Architecture',
+        'summary': 'AutoGPT uses autonomous goal decomposition and iterative task execution. '
+                  'It breaks down high-level objectives into subtasks and executes them with '
+                  'memory and self-correction capabilities.',
+        'application': 'Consider adding goal decomposition capabilities to Kerrigan agents, '
+                     'allowing them to break down complex issues into smaller, manageable tasks.'
+    },
+    'CrewAI': {
+        'title': 'Role-Based Multi-Agent Collaboration',
+        'summary': 'CrewAI emphasizes role-based agent collaboration with clear crew structures, '
+                  'task delegation, and process orchestration. Agents work together with defined '
+                  'roles and responsibilities.',
+        'application': 'Kerrigan already uses role-based agents; evaluate if crew-like '
+                     'collaborative patterns could improve multi-agent coordination.'
+    },
+    'LangGraph': {
+        'title': 'Graph-Based Workflow Orchestration',
+        'summary': 'LangGraph models agent workflows as graphs with nodes (agents/functions) and '
+                  'edges (transitions). This enables complex branching, loops, and conditional flows.',
+        'application': 'Evaluate if graph-based workflow modeling could improve Kerrigan handoffs '
+                     'and conditional agent routing.'
+    },
+    'MetaGPT': {
+        'title': 'Software Company Simulation',
+        'summary': 'MetaGPT simulates a software company structure with product managers, architects, '
+                  'engineers, and QA. It uses standardized artifacts (PRDs, design docs) for communication.',
+        'application': 'Kerrigan already uses artifact-driven communication; validate that artifact '
+                     'contracts are comprehensive and standardized across all agents.'
+    }
+}
+
+
+def load_frameworks(path: Path) -> List[Dict[str, str]]:
+    """Load the frameworks to analyze from a YAML or JSON file.
+
+    The file holds a list of entries (or a mapping with a `frameworks`
+    list). Each entry needs `owner` and `repo`; `name` defaults to the
+    repository name. Entries may add `title`, `summary` and `application`
+    to describe the framework's insight.
+
+    Args:
+        path: Framework list file
+
+    Returns:
+        Framework entries in file order, without duplicate repositories
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or []
+    if isinstance(data, dict):
+        data = data.get('frameworks') or []
+    if not isinstance(data, list):
+        raise ValueError(f"Frameworks in {path} must be a list")
+
+    frameworks = []
+    seen = set()
+    for entry in data:
+        if not isinstance(entry, dict) or not entry.get('owner') or not entry.get('repo'):
+            raise ValueError(f"Framework entries in {path} need 'owner' and 'repo': {entry!r}")
+        framework = {key: str(value) for key, value in entry.items() if value is not None}
+        framework.setdefault('name', framework['repo'])
+        key = (framework['owner'].lower(), framework['repo'].lower())
+        if key not in seen:
+            seen.add(key)
+            frameworks.append(framework)
+    return frameworks
 
 
 class FrameworkAnalysisResearcher(BaseResearcher):
     """Analyzes other agent frameworks for best practices."""
     
-    def __init__(self, enabled: bool = True, github_token: Optional[str] = None):
+    cache_namespace = 'frameworks'
+    
+    def __init__(
+        self,
+        enabled: bool = True,
+        github_token: Optional[str] = None,
+        use_graphql: bool = False,
+        cache: Optional[ResearchCache] = None,
+        frameworks_file: Optional[str] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        transport: Optional[Transport] = None
+    ):
         """Initialize framework researcher.
         
         Args:
             enabled: Whether this researcher is enabled
             github_token: GitHub API token for rate limits
+            use_graphql: Fetch all framework repositories in one GraphQL
+                query (requires a token; falls back to REST per repository)
+            cache: Shared research cache for repository metadata
+            frameworks_file: YAML/JSON list of frameworks to analyze
+                (defaults to DEFAULT_FRAMEWORKS)
+            max_workers: Repository requests in flight at once
+            transport: Shared HTTP transport (e.g. replaying a cassette)
         """
-        super().__init__(enabled)
+        super().__init__(enabled, cache)
         self.github_token = github_token
+        self.use_graphql = use_graphql
+        self.max_workers = max(1, max_workers)
+        self.transport = transport
+        self.client: Optional[GitHubClient] = None
+        # Repository metadata fetched ahead of time, by (owner, repo)
+        self._repo_infos: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
         
-        # Popular agent frameworks to analyze
-        self.frameworks = [
-            {'owner': 'Significant-Gravitas', 'repo': 'AutoGPT', 'name': 'AutoGPT'},
-            {'owner': 'joaomdmoura', 'repo': 'crewAI', 'name': 'CrewAI'},
-            {'owner': 'langchain-ai', 'repo': 'langgraph', 'name': 'LangGraph'},
-            {'owner': 'geekan', 'repo': 'MetaGPT', 'name': 'MetaGPT'},
-        ]
+        self.frameworks = load_frameworks(Path(frameworks_file)) if frameworks_file else list(DEFAULT_FRAMEWORKS)
     
     def analyze_frameworks(self) -> List[Dict[str, Any]]:
         """Analyze popular agent frameworks.
@@ -47,20 +160,36 @@ class FrameworkAnalysisResearcher(BaseResearcher):
         if not self.enabled:
             return []
         
-        print("   🔧 Analyzing agent frameworks...")
+        print(f"   🔧 Analyzing {len(self.frameworks)} agent frameworks...")
         
         findings = []
         
-        for framework in self.frameworks:
-            try:
-                # Analyze framework repository
-                framework_data = self._analyze_framework(framework)
-                if framework_data:
-                    findings.extend(framework_data)
-                    print(f"      ✓ Analyzed {framework['name']}")
-            except Exception as e:
-                print(f"      ⚠️  Failed to analyze {framework['name']}: {e}")
-                continue
+        self.client = GitHubClient(
+            self.github_token,
+            api_url=os.environ.get('GITHUB_API_URL', DEFAULT_API_URL),
+            # Metadata is cached once, in this researcher's namespace
+            cache=None,
+            graphql_url=os.environ.get('GITHUB_GRAPHQL_URL'),
+            max_workers=self.max_workers,
+            transport=self.transport
+        )
+        try:
+            if self.use_graphql and self.github_token:
+                self._prefetch_repo_infos()
+            
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [executor.submit(self._analyze_framework, framework) for framework in self.frameworks]
+                # Collect in configured order, whichever request finishes first
+                for framework, future in zip(self.frameworks, futures):
+                    try:
+                        framework_data = future.result()
+                        if framework_data:
+                            findings.extend(framework_data)
+                            print(f"      ✓ Analyzed {framework['name']}")
+                    except Exception as e:
+                        print(f"      ⚠️  Failed to analyze {framework['name']}: {e}")
+        finally:
+            self.client.close()
         
         # Generate comparative insights
         if findings:
@@ -89,12 +218,12 @@ class FrameworkAnalysisResearcher(BaseResearcher):
             return findings
         
         # Analyze based on repository description and metadata
-        description = repo_info.get('description', '').lower()
+        description = repo_info.get('description') or ''
         topics = repo_info.get('topics', [])
         stars = repo_info.get('stargazers_count', 0)
         
         # Extract key features from description and topics
-        key_features = self._extract_features(description, topics, framework['name'])
+        key_features = self._extract_features(description, topics, framework)
         
         if key_features:
             findings.append({
@@ -118,75 +247,103 @@ class FrameworkAnalysisResearcher(BaseResearcher):
         Returns:
             Repository metadata or None if fetch fails
         """
-        url = f"https://api.github.com/repos/{owner}/{repo}"
+        if (owner, repo) in self._repo_infos:
+            return self._repo_infos[(owner, repo)]
+        
+        cached = self.cache_get(f"{owner}/{repo}")
+        if cached is not None:
+            return cached
+        
+        if self.client is None:
+            return None
         
         try:
-            req = urllib.request.Request(url)
-            if self.github_token:
-                req.add_header("Authorization", f"Bearer {self.github_token}")
-            req.add_header("Accept", "application/vnd.github.v3+json")
-            
-            with urllib.request.urlopen(req, timeout=10) as response:
-                return json.loads(response.read().decode())
+            repo_info, _ = self.client.get(self.client.url(f"repos/{owner}/{repo}"))
         except urllib.error.HTTPError as e:
             print(f"      ⚠️  HTTP error fetching {owner}/{repo}: {e.code} {e.reason}")
             return None
         except urllib.error.URLError as e:
             print(f"      ⚠️  URL error fetching {owner}/{repo}: {e.reason}")
             return None
-        except json.JSONDecodeError as e:
+        except ValueError as e:
             print(f"      ⚠️  JSON decode error for {owner}/{repo}: {e}")
             return None
+        except RateLimitError as e:
+            print(f"      ⚠️  Rate limited fetching {owner}/{repo}: {e}")
+            return None
         except Exception as e:
             print(f"      ⚠️  Unexpected error fetching {owner}/{repo}: {e}")
             return None
+        
+        if not isinstance(repo_info, dict):
+            print(f"      ⚠️  Unexpected response for {owner}/{repo}")
+            return None
+        self._cache_repo_info(owner, repo, repo_info)
+        return repo_info
+    
+    def _cache_repo_info(self, owner: str, repo: str, repo_info: Optional[Dict[str, Any]]) -> None:
+        """Cache the metadata fields the analysis reads."""
+        if isinstance(repo_info, dict):
+            self.cache_put(f"{owner}/{repo}", {
+                'description': repo_info.get('description') or '',
+                'topics': repo_info.get('topics') or [],
+                'stargazers_count': repo_info.get('stargazers_count', 0),
+            })
     
-    def _extract_features(self, description: str, topics: List[str], framework_name: str) -> Optional[Dict[str, str]]:
+    def _prefetch_repo_infos(self) -> None:
+        """Fetch metadata for all uncached frameworks in one GraphQL query."""
+        repositories = [
+            (framework['owner'], framework['repo']) for framework in self.frameworks
+            if self.cache_get(f"{framework['owner']}/{framework['repo']}") is None
+        ]
+        if not repositories:
+            return
+        try:
+            self._repo_infos = fetch_repositories(self.client, repositories)
+        except Exception as e:
+            print(f"      ⚠️  GraphQL fetch failed, using REST API: {e}")
+            self._repo_infos = {}
+        for (owner, repo), repo_info in self._repo_infos.items():
+            self._cache_repo_info(owner, repo, repo_info)
+    
+    def _extract_features(
+        self,
+        description: str,
+        topics: List[str],
+        framework: Dict[str, str]
+    ) -> Optional[Dict[str, str]]:
         """Extract key features and patterns from framework metadata.
         
+        Uses the insight given in the framework entry, then the built-in
+        insight for well-known frameworks, then an overview built from the
+        repository description.
+        
         Args:
             description: Repository description
             topics: Repository topics/tags
-            framework_name: Name of the framework
+            framework: Framework entry (owner, repo, name, optional insight)
             
         Returns:
             Dict with title, summary, and application, or None
         """
-        # Framework-specific insights based on known characteristics
-        framework_insights = {
-            'AutoGPT': {
-                'title': 'Autonomous Goal-Driven Architecture',
-                'summary': 'AutoGPT uses autonomous goal decomposition and iterative task execution. '
-                          'It breaks down high-level objectives into subtasks and executes them with '
-                          'memory and self-correction capabilities.',
-                'application': 'Consider adding goal decomposition capabilities to Kerrigan agents, '
-                             'allowing them to break down complex issues into smaller, manageable tasks.'
-            },
-            'CrewAI': {
-                'title': 'Role-Based Multi-Agent Collaboration',
-                'summary': 'CrewAI emphasizes role-based agent collaboration with clear crew structures, '
-                          'task delegation, and process orchestration. Agents work together with defined '
-                          'roles and responsibilities.',
-                'application': 'Kerrigan already uses role-based agents; evaluate if crew-like '
-                             'collaborative patterns could improve multi-agent coordination.'
-            },
-            'LangGraph': {
-                'title': 'Graph-Based Workflow Orchestration',
-                'summary': 'LangGraph models agent workflows as graphs with nodes (agents/functions) and '
-                          'edges (transitions). This enables complex branching, loops, and conditional flows.',
-                'application': 'Evaluate if graph-based workflow modeling could improve Kerrigan handoffs '
-                             'and conditional agent routing.'
-            },
-            'MetaGPT': {
-                'title': 'Software Company Simulation',
-                'summary': 'MetaGPT simulates a software company structure with product managers, architects, '
-                          'engineers, and QA. It uses standardized artifacts (PRDs, design docs) for communication.',
-                'application': 'Kerrigan already uses artifact-driven communication; validate that artifact '
-                             'contracts are comprehensive and standardized across all agents.'
-            }
-        }
+        if all(framework.get(field) for field in INSIGHT_FIELDS):
+            return {field: framework[field] for field in INSIGHT_FIELDS}
+        
+        known = FRAMEWORK_INSIGHTS.get(framework['name'])
+        if known:
+            return known
         
-        return framework_insights.get(framework_name)
+        if not description:
+            return None
+        summary = f"{framework['name']}: {description.strip()}"
+        if topics:
+            summary += f" (topics: {', '.join(topics[:8])})"
+        return {
+            'title': 'Framework Overview',
+            'summary': summary,
+            'application': f"Compare Kerrigan's agent workflow with {framework['name']} and note "
+                           'patterns worth adopting.'
+        }
     
     def _generate_comparative_insights(self, findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Generate insights by comparing frameworks.
@@ -0,0 +1,383 @@
+"""GitHub REST API client for the research modules.
+
+List endpoints are paginated through the `Link` response header. Once the
+first page reveals how many pages there are, the remaining pages are
+fetched concurrently in small batches, so a caller can stop early (for
+example once results are older than the analysis window).
+
+Responses are kept in the research cache together with their `ETag` and
+`Last-Modified` headers. Later requests for the same URL are sent as
+conditional requests, and a `304 Not Modified` reply is answered from the
+cache; GitHub does not count those against the rate limit.
+
+Requests go through a keep-alive connection pool, so concurrent pages
+reuse a few persistent connections rather than opening one per request.
+A recording or replaying transport (see transport.py) can take its place.
+
+`graphql()` sends GitHub GraphQL queries through the same rate-limit
+handling, so callers can batch many resources into one round trip.
+
+The client tracks `X-RateLimit-Remaining`/`X-RateLimit-Reset` and honours
+`Retry-After`. It waits out short limits and raises RateLimitError instead
+of sleeping for longer than `max_rate_limit_wait`.
+"""
+
+import json
+import re
+import threading
+import time
+import urllib.error
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .cache import ResearchCache
+from .http_pool import ConnectionPool
+from .transport import Transport
+
+# Public GitHub REST API
+DEFAULT_API_URL = "https://api.github.com"
+
+# Items per page (GitHub's maximum)
+PER_PAGE = 100
+
+# Upper bound on pages fetched for one listing
+DEFAULT_MAX_PAGES = 20
+
+# Longest rate-limit pause the client will sleep through, in seconds
+DEFAULT_MAX_RATE_LIMIT_WAIT = 60.0
+
+# Attempts per request when rate limited
+MAX_ATTEMPTS = 3
+
+_LINK_PATTERN = re.compile(r'<([^>]+)>\s*;\s*rel="([^"]+)"')
+
+
+class RateLimitError(Exception):
+    """GitHub rate limit would take too long to clear."""
+
+
+class GraphQLError(Exception):
+    """GitHub GraphQL query returned no data."""
+
+
+def parse_link_header(value: Optional[str]) -> Dict[str, str]:
+    """Map rel name to URL from a `Link` header."""
+    if not value:
+        return {}
+    return {rel: url for url, rel in _LINK_PATTERN.findall(value)}
+
+
+def _page_number(url: Optional[str]) -> Optional[int]:
+    if not url:
+        return None
+    values = urllib.parse.parse_qs(urllib.parse.urlsplit(url).query).get('page')
+    try:
+        return int(values[0]) if values else None
+    except ValueError:
+        return None
+
+
+def _with_page(url: str, page: int) -> str:
+    parts = urllib.parse.urlsplit(url)
+    query = [(k, v) for k, v in urllib.parse.parse_qsl(parts.query) if k != 'page']
+    query.append(('page', str(page)))
+    return urllib.parse.urlunsplit(parts._replace(query=urllib.parse.urlencode(query)))
+
+
+class ResponseCache:
+    """GitHub responses with their validators, kept in the research cache."""
+
+    # Namespace in the research cache (and its TTL)
+    namespace = 'github'
+
+    def __init__(self, store: Optional[ResearchCache]):
+        """Initialize the cache.
+
+        Args:
+            store: Research cache to keep responses in (None disables caching)
+        """
+        self.store = store
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        if self.store is None:
+            return None
+        entry = self.store.get(self.namespace, url)
+        return entry if isinstance(entry, dict) else None
+
+    def put(self, url: str, headers, data: Any) -> None:
+        """Store a response if it carries a validator to revalidate it with."""
+        if self.store is None:
+            return
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        self.store.put(self.namespace, url, {
+            'etag': etag,
+            'last_modified': last_modified,
+            'links': parse_link_header(headers.get('Link')),
+            'data': data,
+        })
+
+
+class GitHubClient:
+    """Minimal GitHub REST client with pagination and conditional requests."""
+
+    def __init__(
+        self,
+        token: Optional[str],
+        api_url: str = DEFAULT_API_URL,
+        cache: Optional[ResearchCache] = None,
+        graphql_url: Optional[str] = None,
+        max_workers: int = 4,
+        timeout: float = 10,
+        max_rate_limit_wait: float = DEFAULT_MAX_RATE_LIMIT_WAIT,
+        transport: Optional[Transport] = None
+    ):
+        """Initialize the client.
+
+        Args:
+            token: GitHub API token (None for unauthenticated requests)
+            api_url: API base URL (e.g. a GitHub Enterprise or test server)
+            cache: Research cache for responses (None disables caching)
+            graphql_url: GraphQL endpoint (defaults to `<api_url>/graphql`)
+            max_workers: Pages fetched concurrently (and idle connections kept)
+            timeout: Socket timeout per request in seconds
+            max_rate_limit_wait: Longest rate-limit pause to sleep through
+            transport: Shared HTTP transport (defaults to a connection pool
+                owned by this client)
+        """
+        self.token = token
+        self.api_url = api_url.rstrip('/')
+        self.graphql_url = graphql_url or f"{self.api_url}/graphql"
+        self.cache = ResponseCache(cache)
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        # A shared transport is closed by its owner, not by the client
+        self._owns_transport = transport is None
+        self.transport = transport if transport is not None else ConnectionPool(timeout, max_idle=self.max_workers)
+        self.max_rate_limit_wait = max_rate_limit_wait
+        self.rate_limit_remaining: Optional[int] = None
+        self.rate_limit_reset: Optional[float] = None
+        self.stats = {'requests': 0, 'not_modified': 0, 'rate_limited': 0}
+        self._lock = threading.Lock()
+
+    def url(self, path: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Absolute API URL for a path and query parameters."""
+        url = path if path.startswith(('http://', 'https://')) else f"{self.api_url}/{path.lstrip('/')}"
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urllib.parse.urlencode(params)}"
+        return url
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        if self._owns_transport:
+            self.transport.close()
+
+    def get(self, url: str) -> Tuple[Any, Dict[str, str]]:
+        """GET a URL, revalidating any cached copy.
+
+        Returns:
+            Tuple of (decoded JSON body, Link header relations)
+
+        Raises:
+            RateLimitError: If the rate limit will not clear in time
+            urllib.error.URLError: On other HTTP or network failures
+        """
+        cached = self.cache.get(url)
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers["If-None-Match"] = cached['etag']
+            if cached.get('last_modified'):
+                headers["If-Modified-Since"] = cached['last_modified']
+        try:
+            data, response_headers = self._send(url, headers=headers)
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached:
+                with self._lock:
+                    self.stats['not_modified'] += 1
+                links = parse_link_header(e.headers.get('Link')) or cached.get('links', {})
+                return cached['data'], links
+            raise
+        self.cache.put(url, response_headers, data)
+        return data, parse_link_header(response_headers.get('Link'))
+
+    def graphql(self, query: str, variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Run a GraphQL query.
+
+        Errors reported alongside data (e.g. one missing repository in a
+        batched query) are printed as warnings and the partial data is
+        returned.
+
+        Returns:
+            The `data` object of the response
+
+        Raises:
+            GraphQLError: If the response carries no data
+            RateLimitError: If the rate limit will not clear in time
+        """
+        body = json.dumps({'query': query, 'variables': variables or {}}).encode('utf-8')
+        response, _ = self._send(self.graphql_url, body=body)
+        errors = response.get('errors') if isinstance(response, dict) else None
+        data = response.get('data') if isinstance(response, dict) else None
+        if not data:
+            message = '; '.join(e.get('message', str(e)) for e in errors or []) or "no data in response"
+            raise GraphQLError(message)
+        for error in errors or []:
+            print(f"      ⚠️  GraphQL: {error.get('message', error)}")
+        return data
+
+    def _send(self, url: str, body: Optional[bytes] = None, headers: Optional[Dict[str, str]] = None):
+        """Send a request, retrying while rate limited.
+
+        Returns:
+            Tuple of (decoded JSON body, response headers)
+        """
+        request_headers = {"Accept": "application/vnd.github.v3+json"}
+        if body is not None:
+            request_headers["Content-Type"] = "application/json"
+        if self.token:
+            request_headers["Authorization"] = f"Bearer {self.token}"
+        request_headers.update(headers or {})
+
+        for attempt in range(MAX_ATTEMPTS):
+            self._wait_for_rate_limit()
+            with self._lock:
+                self.stats['requests'] += 1
+            try:
+                response_headers, payload = self.transport.request(
+                    'GET' if body is None else 'POST', url, body, request_headers
+                )
+                self._note_rate_limit(response_headers)
+                return json.loads(payload.decode()), response_headers
+            except urllib.error.HTTPError as e:
+                self._note_rate_limit(e.headers)
+                delay = self._retry_delay(e)
+                if delay is None:
+                    raise
+                with self._lock:
+                    self.stats['rate_limited'] += 1
+                if attempt == MAX_ATTEMPTS - 1:
+                    raise RateLimitError(f"Still rate limited after {MAX_ATTEMPTS} attempts: {url}") from e
+                time.sleep(delay)
+
+    def paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: int = DEFAULT_MAX_PAGES,
+        stop: Optional[Callable[[List[Any]], bool]] = None
+    ) -> List[Any]:
+        """Fetch every page of a list endpoint.
+
+        Args:
+            path: API path or absolute URL
+            params: Query parameters (per_page is set automatically)
+            max_pages: Upper bound on pages fetched
+            stop: Called with each page in order; returning True fetches
+                no further pages (pages already in flight are kept)
+
+        Returns:
+            Items from all fetched pages, in page order
+
+        Raises:
+            ValueError: If a page is not a JSON list
+        """
+        first, links = self.get(self.url(path, {**(params or {}), 'per_page': PER_PAGE}))
+        items = self._page_items(first)
+        if (stop and stop(items)) or 'next' not in links or max_pages <= 1:
+            return items
+
+        last_page = _page_number(links.get('last'))
+        if last_page is None:
+            # No page count to parallelise over: follow the links one by one
+            url, page = links['next'], 1
+            while url and page < max_pages:
+                data, links = self.get(url)
+                page_items = self._page_items(data)
+                items.extend(page_items)
+                page += 1
+                if not page_items or (stop and stop(page_items)):
+                    break
+                url = links.get('next')
+            return items
+
+        if last_page > max_pages:
+            print(f"   ⚠️  {path}: fetching {max_pages} of {last_page} pages")
+        remaining = [_with_page(links['next'], page) for page in range(2, min(last_page, max_pages) + 1)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while remaining:
+                size = self._batch_size()
+                batch, remaining = remaining[:size], remaining[size:]
+                for data, _ in executor.map(self.get, batch):
+                    page_items = self._page_items(data)
+                    items.extend(page_items)
+                    if not page_items or (stop and stop(page_items)):
+                        remaining = []
+        return items
+
+    def _batch_size(self) -> int:
+        """Pages to request at once, never more than the remaining rate limit."""
+        with self._lock:
+            remaining = self.rate_limit_remaining
+        if remaining is None:
+            return self.max_workers
+        return max(1, min(self.max_workers, remaining))
+
+    @staticmethod
+    def _page_items(data: Any) -> List[Any]:
+        if not isinstance(data, list):
+            raise ValueError("Unexpected API response format")
+        return data
+
+    def _note_rate_limit(self, headers) -> None:
+        if headers is None:
+            return
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        with self._lock:
+            try:
+                if remaining is not None:
+                    self.rate_limit_remaining = int(remaining)
+                if reset is not None:
+                    self.rate_limit_reset = float(reset)
+            except ValueError:
+                pass
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until the rate limit resets if it is exhausted."""
+        with self._lock:
+            remaining, reset = self.rate_limit_remaining, self.rate_limit_reset
+        if remaining != 0 or reset is None:
+            return
+        delay = reset - time.time()
+        if delay <= 0:
+            return
+        if delay > self.max_rate_limit_wait:
+            raise RateLimitError(f"GitHub rate limit exhausted for another {delay:.0f}s")
+        time.sleep(delay)
+        with self._lock:
+            # Unknown until the next response reports it
+            self.rate_limit_remaining = None
+
+    def _retry_delay(self, error: urllib.error.HTTPError) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited request, else None."""
+        if error.code not in (403, 429):
+            return None
+        headers = error.headers or {}
+        retry_after = headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                delay = max(0.0, float(retry_after))
+            except ValueError:
+                delay = self.max_rate_limit_wait
+        elif headers.get('X-RateLimit-Remaining') == '0' and self.rate_limit_reset is not None:
+            delay = max(0.0, self.rate_limit_reset - time.time())
+        else:
+            # A plain 403 is a permissions problem, not a rate limit
+            return None
+        if delay > self.max_rate_limit_wait:
+            raise RateLimitError(f"GitHub asked to retry after {delay:.0f}s") from error
+        return delay
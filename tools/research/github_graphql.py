@@ -0,0 +1,165 @@
+"""Batched GitHub GraphQL queries for the research modules.
+
+The REST endpoints cost one round trip per page of PRs, per page of issues
+and per framework repository. The queries here fetch a page of PRs and a
+page of issues (with labels and merge state) together, and the metadata
+of all framework repositories in a single aliased query. Results are
+converted to the REST field names the researchers already analyze.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .github_client import DEFAULT_MAX_PAGES, GitHubClient
+
+# Labels fetched per PR or issue
+MAX_LABELS = 20
+
+# Topics fetched per repository
+MAX_TOPICS = 20
+
+ACTIVITY_QUERY = """
+query($owner: String!, $name: String!, $since: DateTime!,
+      $prCursor: String, $issueCursor: String, $withPrs: Boolean!, $withIssues: Boolean!) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(first: 100, after: $prCursor, orderBy: {field: UPDATED_AT, direction: DESC}) @include(if: $withPrs) {
+      nodes { number state merged mergedAt updatedAt labels(first: %(labels)d) { nodes { name } } }
+      pageInfo { hasNextPage endCursor }
+    }
+    issues(first: 100, after: $issueCursor, filterBy: {since: $since},
+           orderBy: {field: UPDATED_AT, direction: DESC}) @include(if: $withIssues) {
+      nodes { number state updatedAt labels(first: %(labels)d) { nodes { name } } }
+      pageInfo { hasNextPage endCursor }
+    }
+  }
+}
+""" % {'labels': MAX_LABELS}
+
+REPOSITORY_FIELDS = (
+    "description stargazerCount "
+    f"repositoryTopics(first: {MAX_TOPICS}) {{ nodes {{ topic {{ name }} }} }}"
+)
+
+
+def _labels(node: Dict[str, Any]) -> List[Dict[str, str]]:
+    return [{'name': label['name']} for label in ((node.get('labels') or {}).get('nodes') or []) if label]
+
+
+def _rest_pull_request(node: Dict[str, Any]) -> Dict[str, Any]:
+    """PR node in the shape of the REST pulls endpoint."""
+    return {
+        'number': node.get('number'),
+        # REST reports merged PRs as closed
+        'state': 'open' if node.get('state') == 'OPEN' else 'closed',
+        'merged_at': node.get('mergedAt') if node.get('merged') else None,
+        'updated_at': node.get('updatedAt'),
+        'labels': _labels(node),
+    }
+
+
+def _rest_issue(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Issue node in the shape of the REST issues endpoint."""
+    return {
+        'number': node.get('number'),
+        'state': str(node.get('state', '')).lower(),
+        'updated_at': node.get('updatedAt'),
+        'labels': _labels(node),
+    }
+
+
+def fetch_activity(
+    client: GitHubClient,
+    owner: str,
+    name: str,
+    since: str,
+    max_pages: int = DEFAULT_MAX_PAGES
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Fetch PRs and issues updated since a timestamp.
+
+    Each round trip returns the next page of both connections; a
+    connection is dropped from the query once it is exhausted or reaches
+    past `since`.
+
+    Args:
+        client: Authenticated GitHub client
+        owner: Repository owner
+        name: Repository name
+        since: ISO 8601 UTC timestamp (YYYY-MM-DDTHH:MM:SSZ)
+        max_pages: Upper bound on round trips
+
+    Returns:
+        Tuple of (pull requests, issues) in REST shape
+    """
+    prs: List[Dict[str, Any]] = []
+    issues: List[Dict[str, Any]] = []
+    cursors: Dict[str, Optional[str]] = {'prCursor': None, 'issueCursor': None}
+    with_prs = with_issues = True
+
+    for _ in range(max_pages):
+        if not (with_prs or with_issues):
+            break
+        data = client.graphql(ACTIVITY_QUERY, {
+            'owner': owner, 'name': name, 'since': since,
+            'withPrs': with_prs, 'withIssues': with_issues, **cursors,
+        })
+        repository = data.get('repository') or {}
+
+        if with_prs:
+            connection = repository.get('pullRequests') or {}
+            page = [_rest_pull_request(node) for node in connection.get('nodes') or [] if node]
+            prs.extend(pr for pr in page if (pr['updated_at'] or '') >= since)
+            page_info = connection.get('pageInfo') or {}
+            cursors['prCursor'] = page_info.get('endCursor')
+            # Pull requests have no `since` filter: stop at the window edge
+            with_prs = bool(page_info.get('hasNextPage')) and all((pr['updated_at'] or '') >= since for pr in page)
+
+        if with_issues:
+            connection = repository.get('issues') or {}
+            issues.extend(_rest_issue(node) for node in connection.get('nodes') or [] if node)
+            page_info = connection.get('pageInfo') or {}
+            cursors['issueCursor'] = page_info.get('endCursor')
+            with_issues = bool(page_info.get('hasNextPage'))
+
+    return prs, issues
+
+
+def fetch_repositories(
+    client: GitHubClient,
+    repositories: Sequence[Tuple[str, str]]
+) -> Dict[Tuple[str, str], Optional[Dict[str, Any]]]:
+    """Fetch metadata for several repositories in one query.
+
+    Args:
+        client: Authenticated GitHub client
+        repositories: (owner, name) pairs
+
+    Returns:
+        Metadata in REST shape (description, topics, stargazers_count) per
+        pair; None for repositories GitHub did not return
+    """
+    if not repositories:
+        return {}
+    params = ', '.join(f"$owner{i}: String!, $name{i}: String!" for i in range(len(repositories)))
+    fields = ' '.join(
+        f"r{i}: repository(owner: $owner{i}, name: $name{i}) {{ {REPOSITORY_FIELDS} }}"
+        for i in range(len(repositories))
+    )
+    variables: Dict[str, Any] = {}
+    for i, (owner, name) in enumerate(repositories):
+        variables[f'owner{i}'] = owner
+        variables[f'name{i}'] = name
+
+    data = client.graphql(f"query({params}) {{ {fields} }}", variables)
+
+    results: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+    for i, repository in enumerate(repositories):
+        node = data.get(f'r{i}')
+        results[repository] = None if not node else {
+            'description': node.get('description') or '',
+            'topics': [
+                topic['topic']['name']
+                for topic in ((node.get('repositoryTopics') or {}).get('nodes') or [])
+                if topic and topic.get('topic')
+            ],
+            'stargazers_count': node.get('stargazerCount', 0),
+        }
+    return results
@@ -3,19 +3,38 @@
 This module analyzes GitHub patterns in the Kerrigan repository.
 """
 
-import json
-import urllib.request
+import os
 from collections import Counter
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
 from .base import BaseResearcher
+from .cache import ResearchCache, open_research_cache
+from .github_client import DEFAULT_API_URL, DEFAULT_MAX_PAGES, GitHubClient
+from .github_graphql import fetch_activity
+from .github_store import DEFAULT_WINDOWS, GitHubStore
+from .transport import ReplayTransport, Transport
 
 
 class GitHubAnalysisResearcher(BaseResearcher):
     """Analyzes GitHub patterns in Kerrigan repository."""
     
-    def __init__(self, repo_owner: str, repo_name: str, github_token: Optional[str], enabled: bool = True):
+    cache_namespace = 'github'
+    
+    def __init__(
+        self,
+        repo_owner: str,
+        repo_name: str,
+        github_token: Optional[str],
+        enabled: bool = True,
+        api_url: Optional[str] = None,
+        cache_dir: Optional[str] = ".research_cache",
+        max_pages: int = DEFAULT_MAX_PAGES,
+        use_graphql: bool = False,
+        cache: Optional[ResearchCache] = None,
+        transport: Optional[Transport] = None,
+        store_path: Optional[str] = None
+    ):
         """Initialize GitHub researcher.
         
         Args:
@@ -23,29 +42,59 @@ class GitHubAnalysisResearcher(BaseResearcher):
             repo_name: GitHub repository name
             github_token: GitHub API token
             enabled: Whether this researcher is enabled
+            api_url: API base URL (defaults to $GITHUB_API_URL, then api.github.com)
+            cache_dir: Directory for cached API responses (None disables caching)
+            max_pages: Upper bound on pages fetched per listing
+            use_graphql: Fetch PRs and issues together through the GraphQL API
+            cache: Shared research cache (overrides cache_dir)
+            transport: Shared HTTP transport (e.g. replaying a cassette)
+            store_path: SQLite store synced incrementally and analyzed
+                locally, with rolling window analytics (None to fetch the
+                window on every run)
         """
-        super().__init__(enabled)
+        super().__init__(enabled, cache if cache is not None else open_research_cache(cache_dir))
         self.repo_owner = repo_owner
         self.repo_name = repo_name
         self.github_token = github_token
+        self.max_pages = max_pages
+        self.use_graphql = use_graphql
+        self.store_path = store_path
+        # Rolling window analytics of the last store-backed analysis
+        self.windows: Dict[str, Dict[str, Any]] = {}
+        self.client = GitHubClient(
+            github_token,
+            api_url=api_url or os.environ.get('GITHUB_API_URL', DEFAULT_API_URL),
+            cache=self.cache,
+            graphql_url=None if api_url else os.environ.get('GITHUB_GRAPHQL_URL'),
+            transport=transport
+        )
     
     def analyze_patterns(self, days_back: int = 30) -> List[Dict[str, Any]]:
         """Analyze issue and PR patterns."""
-        if not self.enabled or not self.github_token:
+        # Replayed responses need no credentials
+        if not self.enabled or not (self.github_token or isinstance(self.client.transport, ReplayTransport)):
             return []
         
         try:
             findings = []
             
+            if self.store_path:
+                pr_data, issue_data = self._load_from_store(days_back)
+            elif self.use_graphql:
+                pr_data, issue_data = self._fetch_activity_graphql(days_back)
+            else:
+                pr_data = self._fetch_prs(days_back)
+                issue_data = self._fetch_issues(days_back)
+            
             # Analyze PR success rates
-            pr_data = self._fetch_prs(days_back)
             if pr_data:
                 pr_finding = self._analyze_pr_patterns(pr_data)
                 if pr_finding:
+                    if self.windows:
+                        pr_finding['metrics']['windows'] = self.windows
                     findings.append(pr_finding)
             
             # Analyze issue patterns
-            issue_data = self._fetch_issues(days_back)
             if issue_data:
                 issue_finding = self._analyze_issue_patterns(issue_data)
                 if issue_finding:
@@ -59,44 +108,81 @@ class GitHubAnalysisResearcher(BaseResearcher):
             return []
     
     def _fetch_prs(self, days_back: int) -> List[Dict[str, Any]]:
-        """Fetch pull requests from GitHub API."""
-        since = (datetime.now(timezone.utc) - timedelta(days=days_back)).isoformat()
-        url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/pulls?state=all&since={since}&per_page=100"
-        
+        """Fetch pull requests updated in the window from GitHub API."""
         try:
-            req = urllib.request.Request(url)
-            req.add_header("Authorization", f"Bearer {self.github_token}")
-            req.add_header("Accept", "application/vnd.github.v3+json")
-            
-            # Security: Use context manager and timeout
-            with urllib.request.urlopen(req, timeout=10) as response:
-                return json.loads(response.read().decode())
+            return self._fetch_recent("pulls", days_back)
         except Exception as e:
             print(f"   ⚠️  Failed to fetch PRs: {e}")
             return []
     
     def _fetch_issues(self, days_back: int) -> List[Dict[str, Any]]:
-        """Fetch issues from GitHub API."""
-        since = (datetime.now(timezone.utc) - timedelta(days=days_back)).isoformat()
-        url = f"https://api.github.com/repos/{self.repo_owner}/{self.repo_name}/issues?state=all&since={since}&per_page=100"
-        
+        """Fetch issues updated in the window from GitHub API."""
         try:
-            req = urllib.request.Request(url)
-            req.add_header("Authorization", f"Bearer {self.github_token}")
-            req.add_header("Accept", "application/vnd.github.v3+json")
-            
-            # Security: Use context manager and timeout
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                # Validate response structure before filtering
-                if not isinstance(data, list):
-                    print(f"   ⚠️  Unexpected API response format")
-                    return []
-                # Filter out PRs (they show up in issues endpoint too)
-                return [item for item in data if isinstance(item, dict) and 'pull_request' not in item]
+            items = self._fetch_recent("issues", days_back)
+        except ValueError:
+            print(f"   ⚠️  Unexpected API response format")
+            return []
         except Exception as e:
             print(f"   ⚠️  Failed to fetch issues: {e}")
             return []
+        # Filter out PRs (they show up in issues endpoint too)
+        return [item for item in items if 'pull_request' not in item]
+    
+    def _fetch_activity_graphql(self, days_back: int):
+        """Fetch PRs and issues through GraphQL, falling back to REST on failure."""
+        try:
+            return fetch_activity(
+                self.client, self.repo_owner, self.repo_name, self._since(days_back), self.max_pages
+            )
+        except Exception as e:
+            print(f"   ⚠️  GraphQL fetch failed, using REST API: {e}")
+            return self._fetch_prs(days_back), self._fetch_issues(days_back)
+    
+    def _load_from_store(self, days_back: int):
+        """Sync the local store, then read the window's PRs and issues from it.
+        
+        A failed sync is reported and the analysis uses what was stored
+        before. The store is opened here, on the calling thread, since
+        SQLite connections cannot be shared across threads.
+        """
+        repo = f"{self.repo_owner}/{self.repo_name}"
+        with GitHubStore(self.store_path) as store:
+            try:
+                store.sync(
+                    self.client, self.repo_owner, self.repo_name,
+                    backfill_days=max(days_back, *DEFAULT_WINDOWS), max_pages=self.max_pages
+                )
+            except Exception as e:
+                print(f"   ⚠️  GitHub store sync failed, using stored data: {e}")
+            self.windows = store.rolling_stats(repo)
+            since = self._since(days_back)
+            return store.items(repo, 'pulls', since), store.items(repo, 'issues', since)
+    
+    @staticmethod
+    def _since(days_back: int) -> str:
+        """Start of the analysis window as a GitHub timestamp."""
+        return (datetime.now(timezone.utc) - timedelta(days=days_back)).strftime('%Y-%m-%dT%H:%M:%SZ')
+    
+    def _fetch_recent(self, endpoint: str, days_back: int) -> List[Dict[str, Any]]:
+        """Fetch all items of a list endpoint updated in the last `days_back` days.
+        
+        Pages are requested newest-updated first without a `since` filter,
+        so page URLs stay the same from run to run and revalidate against
+        the response cache; paging stops at the first page reaching past
+        the window.
+        """
+        since = self._since(days_back)
+        
+        def in_window(item: Any) -> bool:
+            return isinstance(item, dict) and str(item.get('updated_at') or '') >= since
+        
+        items = self.client.paginate(
+            f"repos/{self.repo_owner}/{self.repo_name}/{endpoint}",
+            {'state': 'all', 'sort': 'updated', 'direction': 'desc'},
+            max_pages=self.max_pages,
+            stop=lambda page: not all(in_window(item) for item in page)
+        )
+        return [item for item in items if in_window(item)]
     
     def _analyze_pr_patterns(self, prs: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
         """Analyze PR patterns for insights."""
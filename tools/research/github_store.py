@@ -0,0 +1,284 @@
+"""Local SQLite store of a repository's pull requests and issues.
+
+`GitHubStore.sync()` fetches only what changed since the last sync. Each
+repository and kind (pulls, issues) keeps a watermark: the latest
+`updated_at` seen so far.
+
+- Issues are listed with `since=<watermark>`, oldest update first, so a
+  sync cut short by the page limit resumes where it stopped
+- Pull requests have no `since` filter; they are listed newest update first
+  and paging stops at the first page reaching back past the watermark
+
+The first sync backfills the longest analytics window. Analytics then run
+as SQL over the local tables, with no API calls:
+
+- `window_stats()` for one window: merge rate, per-label merge rates,
+  time-to-merge percentiles and top issue labels
+- `rolling_stats()` for several windows at once (7, 30 and 90 days by
+  default)
+"""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .github_client import DEFAULT_MAX_PAGES, PER_PAGE, GitHubClient
+
+# Default location, next to the research cache
+DEFAULT_STORE_PATH = ".research_cache/github-store.sqlite3"
+
+# Rolling windows reported, in days
+DEFAULT_WINDOWS = (7, 30, 90)
+
+# Percentiles of time to merge reported
+MERGE_PERCENTILES = (50, 90)
+
+# Labels reported per window
+TOP_LABELS = 5
+
+_TIMESTAMP = '%Y-%m-%dT%H:%M:%SZ'
+
+
+def _timestamp(moment: datetime) -> str:
+    return moment.astimezone(timezone.utc).strftime(_TIMESTAMP)
+
+
+def _percentile(values: List[float], percent: float) -> Optional[float]:
+    """Nearest-rank percentile of sorted values."""
+    if not values:
+        return None
+    rank = max(1, -(-len(values) * percent // 100))
+    return values[int(rank) - 1]
+
+
+class GitHubStore:
+    """Pull requests and issues of GitHub repositories in a SQLite file."""
+
+    def __init__(self, path: Path):
+        """Open (or create) a store.
+
+        Args:
+            path: SQLite store file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        with self._db:
+            self._db.executescript("""
+                CREATE TABLE IF NOT EXISTS items (
+                    repo TEXT NOT NULL, kind TEXT NOT NULL, number INTEGER NOT NULL,
+                    state TEXT NOT NULL, created_at TEXT, updated_at TEXT NOT NULL,
+                    closed_at TEXT, merged_at TEXT,
+                    PRIMARY KEY (repo, kind, number)) WITHOUT ROWID;
+                CREATE INDEX IF NOT EXISTS items_updated ON items (repo, kind, updated_at);
+                CREATE TABLE IF NOT EXISTS labels (
+                    repo TEXT NOT NULL, kind TEXT NOT NULL, number INTEGER NOT NULL, name TEXT NOT NULL,
+                    PRIMARY KEY (repo, kind, number, name)) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS watermarks (
+                    repo TEXT NOT NULL, kind TEXT NOT NULL, updated_at TEXT NOT NULL, synced_at TEXT NOT NULL,
+                    PRIMARY KEY (repo, kind));
+            """)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> 'GitHubStore':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def watermark(self, repo: str, kind: str) -> Optional[str]:
+        """Latest `updated_at` synced for a repository's pulls or issues."""
+        row = self._db.execute(
+            "SELECT updated_at FROM watermarks WHERE repo = ? AND kind = ?", (repo, kind)
+        ).fetchone()
+        return row[0] if row else None
+
+    def upsert(self, repo: str, kind: str, items: Sequence[Dict[str, Any]]) -> int:
+        """Insert or replace items in REST shape, with their labels.
+
+        Args:
+            repo: Repository (owner/name)
+            kind: 'pulls' or 'issues'
+            items: Items from the REST list endpoints
+
+        Returns:
+            Number of items stored
+        """
+        rows = []
+        labels = []
+        for item in items:
+            if not isinstance(item, dict) or item.get('number') is None or not item.get('updated_at'):
+                continue
+            number = int(item['number'])
+            rows.append((
+                repo, kind, number, str(item.get('state') or ''), item.get('created_at'),
+                item['updated_at'], item.get('closed_at'), item.get('merged_at')
+            ))
+            labels.extend(
+                (repo, kind, number, label['name'])
+                for label in item.get('labels') or [] if isinstance(label, dict) and label.get('name')
+            )
+        with self._db:
+            self._db.executemany(
+                "DELETE FROM labels WHERE repo = ? AND kind = ? AND number = ?", [row[:3] for row in rows]
+            )
+            self._db.executemany("INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._db.executemany("INSERT OR IGNORE INTO labels VALUES (?, ?, ?, ?)", labels)
+        return len(rows)
+
+    def _advance(self, repo: str, kind: str, items: List[Dict[str, Any]], since: str, now: datetime) -> None:
+        """Move the watermark to the latest update synced (never backwards)."""
+        latest = max([since, *(item['updated_at'] for item in items)])
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO watermarks (repo, kind, updated_at, synced_at) VALUES (?, ?, ?, ?)",
+                (repo, kind, latest, _timestamp(now))
+            )
+
+    def sync(
+        self,
+        client: GitHubClient,
+        owner: str,
+        name: str,
+        backfill_days: int = max(DEFAULT_WINDOWS),
+        max_pages: int = DEFAULT_MAX_PAGES,
+        now: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """Fetch pull requests and issues updated since the last sync.
+
+        Args:
+            client: GitHub client
+            owner: Repository owner
+            name: Repository name
+            backfill_days: History fetched on the first sync
+            max_pages: Upper bound on pages per kind and sync
+            now: Current time (defaults to the clock)
+
+        Returns:
+            Items stored per kind
+        """
+        now = now or datetime.now(timezone.utc)
+        repo = f"{owner}/{name}"
+        start = _timestamp(now - timedelta(days=backfill_days))
+        stats = {}
+
+        # Pull requests: newest first, stopping at the watermark
+        pulls_since = self.watermark(repo, 'pulls') or start
+        pulls = client.paginate(
+            f"repos/{repo}/pulls", {'state': 'all', 'sort': 'updated', 'direction': 'desc'},
+            max_pages=max_pages,
+            stop=lambda page: any(str(item.get('updated_at') or '') < pulls_since for item in page)
+        )
+        fresh = [item for item in pulls if str(item.get('updated_at') or '') >= pulls_since]
+        stats['pulls'] = self.upsert(repo, 'pulls', fresh)
+        # Only move past a gap-free listing: one cut short by max_pages
+        # leaves older updates unfetched
+        if len(fresh) < len(pulls) or len(pulls) < max_pages * PER_PAGE:
+            self._advance(repo, 'pulls', fresh, pulls_since, now)
+        else:
+            # The next sync refetches from the same watermark
+            print(f"   ⚠️  {repo}: more than {max_pages} pages of pull request updates since {pulls_since}")
+
+        # Issues: oldest first from the watermark, so a partial sync resumes
+        issues_since = self.watermark(repo, 'issues') or start
+        issues = client.paginate(
+            f"repos/{repo}/issues", {'state': 'all', 'since': issues_since, 'sort': 'updated', 'direction': 'asc'},
+            max_pages=max_pages
+        )
+        listed = [item for item in issues if isinstance(item, dict) and item.get('updated_at')]
+        # The issues endpoint also lists pull requests: they are not stored
+        # as issues, but still move the watermark past the pages they fill
+        issues = [item for item in listed if 'pull_request' not in item]
+        stats['issues'] = self.upsert(repo, 'issues', issues)
+        self._advance(repo, 'issues', listed, issues_since, now)
+        return stats
+
+    def items(self, repo: str, kind: str, since: str) -> List[Dict[str, Any]]:
+        """Stored items updated since a timestamp, in REST shape, newest first."""
+        labels: Dict[int, List[Dict[str, str]]] = {}
+        for number, label in self._db.execute(
+            "SELECT l.number, l.name FROM labels l JOIN items i USING (repo, kind, number) "
+            "WHERE i.repo = ? AND i.kind = ? AND i.updated_at >= ? ORDER BY l.name", (repo, kind, since)
+        ):
+            labels.setdefault(number, []).append({'name': label})
+        return [
+            {'number': number, 'state': state, 'created_at': created_at, 'updated_at': updated_at,
+             'closed_at': closed_at, 'merged_at': merged_at, 'labels': labels.get(number, [])}
+            for number, state, created_at, updated_at, closed_at, merged_at in self._db.execute(
+                "SELECT number, state, created_at, updated_at, closed_at, merged_at FROM items "
+                "WHERE repo = ? AND kind = ? AND updated_at >= ? ORDER BY updated_at DESC, number DESC",
+                (repo, kind, since)
+            )
+        ]
+
+    def window_stats(self, repo: str, days: int, now: Optional[datetime] = None) -> Dict[str, Any]:
+        """Analytics for items updated in the last `days` days.
+
+        Returns:
+            Dict with pull request counts and merge rate, merge rates per
+            label, time-to-merge percentiles in hours (of pull requests
+            merged in the window) and the most common issue labels
+        """
+        since = _timestamp((now or datetime.now(timezone.utc)) - timedelta(days=days))
+        total, merged, closed_unmerged = self._db.execute(
+            "SELECT COUNT(*), COUNT(merged_at), "
+            "COALESCE(SUM(state = 'closed' AND merged_at IS NULL), 0) "
+            "FROM items WHERE repo = ? AND kind = 'pulls' AND updated_at >= ?", (repo, since)
+        ).fetchone()
+
+        label_rates = {
+            label: {'total': count, 'merged': label_merged, 'merge_rate': label_merged / count * 100}
+            for label, count, label_merged in self._db.execute(
+                "SELECT l.name, COUNT(*), COUNT(i.merged_at) FROM items i JOIN labels l USING (repo, kind, number) "
+                "WHERE i.repo = ? AND i.kind = 'pulls' AND i.updated_at >= ? "
+                "GROUP BY l.name ORDER BY COUNT(*) DESC, l.name LIMIT ?", (repo, since, TOP_LABELS)
+            )
+        }
+
+        hours = [row[0] for row in self._db.execute(
+            "SELECT (julianday(merged_at) - julianday(created_at)) * 24 AS hours FROM items "
+            "WHERE repo = ? AND kind = 'pulls' AND merged_at >= ? AND created_at IS NOT NULL ORDER BY hours",
+            (repo, since)
+        )]
+
+        issue_total = self._db.execute(
+            "SELECT COUNT(*) FROM items WHERE repo = ? AND kind = 'issues' AND updated_at >= ?", (repo, since)
+        ).fetchone()[0]
+        issue_labels = dict(self._db.execute(
+            "SELECT l.name, COUNT(*) FROM items i JOIN labels l USING (repo, kind, number) "
+            "WHERE i.repo = ? AND i.kind = 'issues' AND i.updated_at >= ? "
+            "GROUP BY l.name ORDER BY COUNT(*) DESC, l.name LIMIT ?", (repo, since, TOP_LABELS)
+        ).fetchall())
+
+        return {
+            'days': days,
+            'total_prs': total,
+            'merged': merged,
+            'closed_unmerged': closed_unmerged,
+            'merge_rate': merged / total * 100 if total else 0.0,
+            'label_merge_rates': label_rates,
+            'time_to_merge_hours': {f"p{p}": _percentile(hours, p) for p in MERGE_PERCENTILES},
+            'total_issues': issue_total,
+            'top_issue_labels': issue_labels,
+        }
+
+    def rolling_stats(
+        self,
+        repo: str,
+        windows: Sequence[int] = DEFAULT_WINDOWS,
+        now: Optional[datetime] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """window_stats() for several windows, keyed like '7d'."""
+        now = now or datetime.now(timezone.utc)
+        return {f"{days}d": self.window_stats(repo, days, now) for days in windows}
+
+
+def open_store(store_path: Optional[str]) -> Optional[GitHubStore]:
+    """Open a store, or None when no path is given."""
+    if not store_path:
+        return None
+    return GitHubStore(Path(store_path))
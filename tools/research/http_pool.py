@@ -0,0 +1,138 @@
+"""Keep-alive HTTP connection pool for the research modules.
+
+`urllib.request.urlopen` opens a new connection (and TLS handshake) for
+every request. The pool keeps idle connections per host and hands them to
+the next request, so concurrent fetches against the same API reuse a few
+persistent connections instead.
+
+Errors follow the urllib conventions: HTTP status codes of 300 and above
+(after redirects are followed) raise urllib.error.HTTPError, and network
+failures raise urllib.error.URLError.
+"""
+
+import http.client
+import threading
+import urllib.error
+import urllib.parse
+from typing import Dict, List, Optional, Tuple
+
+from .transport import Transport
+
+# Redirects followed per request
+MAX_REDIRECTS = 5
+
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# Errors meaning an idle keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+class ConnectionPool(Transport):
+    """Persistent HTTP(S) connections, shared between threads."""
+
+    def __init__(self, timeout: float = 10, max_idle: int = 4):
+        """Initialize the pool.
+
+        Args:
+            timeout: Socket timeout per request in seconds
+            max_idle: Idle connections kept per host
+        """
+        self.timeout = timeout
+        self.max_idle = max(1, max_idle)
+        self.stats = {'requests': 0, 'connections': 0}
+        self._idle: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[http.client.HTTPMessage, bytes]:
+        """Send a request, following redirects.
+
+        Returns:
+            Tuple of (response headers, response body)
+
+        Raises:
+            urllib.error.HTTPError: For responses with status 300 or above
+            urllib.error.URLError: On network failures
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            status, reason, response_headers, payload = self._send(method, url, body, headers or {})
+            location = response_headers.get('Location')
+            if status not in _REDIRECT_CODES or not location:
+                break
+            url = urllib.parse.urljoin(url, location)
+            if status == 303:
+                method, body = 'GET', None
+        if status >= 300:
+            raise urllib.error.HTTPError(url, status, reason, response_headers, None)
+        return response_headers, payload
+
+    def _send(self, method: str, url: str, body: Optional[bytes], headers: Dict[str, str]):
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme not in ('http', 'https'):
+            raise urllib.error.URLError(f"Unsupported URL scheme: {url}")
+        key = (parts.scheme, parts.netloc)
+        target = parts.path or '/'
+        if parts.query:
+            target = f"{target}?{parts.query}"
+
+        with self._lock:
+            self.stats['requests'] += 1
+        connection, reused = self._acquire(key)
+        try:
+            try:
+                connection.request(method, target, body=body, headers=headers)
+                response = connection.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                if not reused:
+                    raise
+                # The server dropped the idle connection: retry once on a new one
+                connection.close()
+                connection, reused = self._connect(key), False
+                connection.request(method, target, body=body, headers=headers)
+                response = connection.getresponse()
+            payload = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            connection.close()
+            raise urllib.error.URLError(e) from e
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(key, connection)
+        return response.status, response.reason, response.headers, payload
+
+    def _acquire(self, key: Tuple[str, str]) -> Tuple[http.client.HTTPConnection, bool]:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+        return self._connect(key), False
+
+    def _connect(self, key: Tuple[str, str]) -> http.client.HTTPConnection:
+        scheme, netloc = key
+        with self._lock:
+            self.stats['connections'] += 1
+        if scheme == 'https':
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def _release(self, key: Tuple[str, str], connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
@@ -0,0 +1,134 @@
+"""Researcher plugin interface and discovery.
+
+A research source is a ResearcherPlugin: it has a `name`, an optional
+`timeout` and `max_concurrency`, and an `async def run(context)` that
+returns findings. The runner (`runner.stream_research`) runs all selected
+plugins concurrently, each with its own timeout, and hands each plugin a
+ResearchContext holding the shared cache, the shared search rate limit and
+run options.
+
+Blocking work (urllib, SQLite) goes through `context.run_blocking()`,
+which runs it on the runner's thread pool and holds one of the plugin's
+`max_concurrency` slots meanwhile.
+
+Besides the built-in sources, plugins are discovered from the
+`kerrigan.researchers` entry point group: each entry point names a
+ResearcherPlugin subclass (or instance) in an installed package.
+"""
+
+import asyncio
+import dataclasses
+from abc import ABC, abstractmethod
+import functools
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from importlib.metadata import entry_points
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .cache import ResearchCache
+from .rate_limit import TokenBucket
+from .transport import Transport
+
+# Entry point group for third-party researcher plugins
+ENTRY_POINT_GROUP = "kerrigan.researchers"
+
+
+@dataclass
+class ResearchContext:
+    """Shared resources and options handed to every plugin."""
+    cache: Optional[ResearchCache] = None
+    search_limiter: Optional[TokenBucket] = None  # Shared by search sources
+    github_token: Optional[str] = None
+    repository: Optional[str] = None  # owner/name
+    transport: Optional[Transport] = None  # Shared HTTP transport (None for a pool per client)
+    options: Dict[str, Any] = field(default_factory=dict)
+    # Set by the runner for each plugin
+    executor: Optional[Executor] = None
+    max_concurrency: int = 1
+    _slots: Optional[asyncio.Semaphore] = field(default=None, init=False, repr=False)
+
+    def bind(self, executor: Optional[Executor], max_concurrency: int) -> 'ResearchContext':
+        """Copy of the context for one plugin run, with its own concurrency slots."""
+        bound = dataclasses.replace(self, executor=executor, max_concurrency=max(1, max_concurrency))
+        bound._slots = asyncio.Semaphore(bound.max_concurrency)
+        return bound
+
+    def close(self) -> None:
+        """Close the transport (writing any recording) and the cache."""
+        if self.transport is not None:
+            self.transport.close()
+        if self.cache is not None:
+            self.cache.close()
+
+    async def run_blocking(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking call on the runner's threads, within the plugin's concurrency limit."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, functools.partial(function, *args))
+
+
+class ResearcherPlugin(ABC):
+    """Interface of an external research source."""
+
+    # Unique source name, used to enable the plugin and in results
+    name = ''
+    # Console label (defaults to the name)
+    label = ''
+    # Seconds the plugin may take (None for the runner's per-source timeout)
+    timeout: Optional[float] = None
+    # Blocking calls the plugin may have in flight at once
+    max_concurrency = 1
+
+    def skip_reason(self, context: ResearchContext) -> Optional[str]:
+        """Why the plugin cannot run with this context, or None if it can."""
+        return None
+
+    @abstractmethod
+    async def run(self, context: ResearchContext) -> List[Dict[str, Any]]:
+        """Research the source.
+
+        Args:
+            context: Shared resources and options, bound to this plugin
+
+        Returns:
+            Findings with title, summary, relevance and evidence
+        """
+
+
+def _is_plugin(candidate: Any) -> bool:
+    # Duck-typed, so plugins need not import this module
+    return (
+        isinstance(getattr(candidate, 'name', None), str) and bool(candidate.name)
+        and asyncio.iscoroutinefunction(getattr(candidate, 'run', None))
+    )
+
+
+def discover_plugins(builtins: Iterable[ResearcherPlugin] = ()) -> Dict[str, ResearcherPlugin]:
+    """Built-in plugins plus those registered under ENTRY_POINT_GROUP.
+
+    A plugin that fails to load, or whose name is already taken, is
+    skipped with a warning.
+
+    Args:
+        builtins: Built-in plugins; they take precedence over discovered ones
+
+    Returns:
+        Plugins by name, built-ins first
+    """
+    plugins = {plugin.name: plugin for plugin in builtins}
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        try:
+            loaded = entry_point.load()
+            plugin = loaded() if isinstance(loaded, type) else loaded
+        except Exception as e:
+            print(f"   ⚠️  Failed to load researcher plugin '{entry_point.name}': {e}")
+            continue
+        if not _is_plugin(plugin):
+            print(f"   ⚠️  '{entry_point.name}' is not a researcher plugin (needs a name and async run)")
+        elif plugin.name in plugins:
+            print(f"   ⚠️  Researcher plugin '{entry_point.name}' reuses the name '{plugin.name}', skipping")
+        else:
+            plugins[plugin.name] = plugin
+    return plugins
@@ -0,0 +1,87 @@
+"""Token-bucket rate limiting shared between researchers.
+
+A TokenBucket refills at `rate` tokens per second up to `burst` tokens.
+Callers reserve a token and wait only for their own share of the deficit.
+Concurrent callers therefore proceed in parallel as long as tokens are
+available, and beyond that are spaced out to the allowed rate, rather
+than each sleeping a fixed delay after every request.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+
+# Default limit for external search requests (web, papers): three at
+# once, then one every two seconds on average
+SEARCH_RATE = 0.5
+SEARCH_BURST = 3
+
+
+class TokenBucket:
+    """Thread-safe token bucket."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            burst: Bucket capacity (requests allowed at once)
+            clock: Monotonic clock in seconds
+            sleep: Function used to wait
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.burst = max(1.0, float(burst))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, tokens: float = 1, timeout: Optional[float] = None) -> Optional[float]:
+        """Reserve tokens without waiting.
+
+        Args:
+            tokens: Tokens to take
+            timeout: Longest acceptable wait (None for no limit)
+
+        Returns:
+            Seconds to wait before using the tokens, or None if that would
+            exceed `timeout` (nothing is reserved then)
+        """
+        with self._lock:
+            self._refill(self._clock())
+            wait = max(0.0, (tokens - self._tokens) / self.rate)
+            if timeout is not None and wait > timeout:
+                return None
+            # Going into debt keeps later callers queued behind this one
+            self._tokens -= tokens
+            return wait
+
+    def acquire(self, tokens: float = 1, timeout: Optional[float] = None) -> bool:
+        """Take tokens, waiting until the rate allows it.
+
+        Args:
+            tokens: Tokens to take
+            timeout: Longest time to wait (None for no limit)
+
+        Returns:
+            True once the tokens are taken; False if waiting would exceed `timeout`
+        """
+        wait = self.reserve(tokens, timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            self._sleep(wait)
+        return True
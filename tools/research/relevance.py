@@ -0,0 +1,164 @@
+"""Batched relevance scoring and near-duplicate removal for findings.
+
+All findings in a batch are tokenized once into a sparse TF-IDF term
+matrix. The matrix is stored in CSR layout (row pointers, column indices
+and weights in flat arrays), so scoring works on compact arrays rather
+than re-scanning strings for every finding and keyword:
+
+- keyword relevance: share of the topic keywords a finding mentions
+- query relevance: cosine similarity between a finding and the TF-IDF
+  vector of a query text
+- near-duplicates: findings whose TF-IDF vectors have cosine similarity at
+  or above a threshold with an earlier finding. Only findings that share
+  terms are compared, through per-term postings
+"""
+
+import math
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from text_tokens import tokenize
+
+# Topic keywords a relevant finding mentions
+RELEVANCE_KEYWORDS = ('agent', 'autonomous', 'ai', 'llm', 'orchestration', 'workflow')
+
+# Cosine similarity at or above which two findings are near-duplicates
+DEFAULT_DUPLICATE_THRESHOLD = 0.8
+
+# Finding fields that make up its text
+TEXT_FIELDS = ('title', 'summary')
+
+
+def finding_text(finding: Dict[str, Any]) -> str:
+    """Text used to score and compare findings."""
+    return ' '.join(str(finding.get(field) or '') for field in TEXT_FIELDS)
+
+
+class FindingMatrix:
+    """Sparse, L2-normalized TF-IDF matrix of a batch of findings."""
+
+    def __init__(self, findings: Sequence[Dict[str, Any]]):
+        """Tokenize the findings and weight their terms.
+
+        IDF is smoothed (`log((1 + n) / (1 + df)) + 1`) so it stays
+        positive for terms present in every finding of a small batch.
+
+        Args:
+            findings: Findings with title and summary
+        """
+        self.vocabulary: Dict[str, int] = {}
+        self.indptr = array('l', [0])
+        self.indices = array('l')
+        self.weights = array('d')
+
+        counts = array('d')
+        df: List[int] = []
+        for finding in findings:
+            for term, count in Counter(tokenize(finding_text(finding))).items():
+                column = self.vocabulary.setdefault(term, len(self.vocabulary))
+                if column == len(df):
+                    df.append(0)
+                df[column] += 1
+                self.indices.append(column)
+                counts.append(count)
+            self.indptr.append(len(self.indices))
+
+        rows = len(self.indptr) - 1
+        self.idf = [math.log((1 + rows) / (1 + d)) + 1 for d in df]
+        for row in range(rows):
+            start, end = self.indptr[row], self.indptr[row + 1]
+            values = [counts[k] * self.idf[self.indices[k]] for k in range(start, end)]
+            norm = math.sqrt(sum(v * v for v in values)) or 1.0
+            self.weights.extend(v / norm for v in values)
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def row(self, row: int) -> Iterable[Tuple[int, float]]:
+        """(column, weight) pairs of a row."""
+        start, end = self.indptr[row], self.indptr[row + 1]
+        return zip(self.indices[start:end], self.weights[start:end])
+
+    def keyword_scores(self, keywords: Sequence[str] = RELEVANCE_KEYWORDS) -> List[float]:
+        """Share of the keywords each finding mentions (0.0 to 1.0)."""
+        columns = {self.vocabulary[term] for term in dict.fromkeys(tokenize(' '.join(keywords)))
+                   if term in self.vocabulary}
+        total = len(keywords)
+        if not total:
+            return [0.0] * len(self)
+        return [
+            sum(1 for k in range(self.indptr[row], self.indptr[row + 1]) if self.indices[k] in columns) / total
+            for row in range(len(self))
+        ]
+
+    def query_scores(self, query: str) -> List[float]:
+        """Cosine similarity of each finding with a query text (0.0 to 1.0)."""
+        query_weights = {}
+        for term, count in Counter(tokenize(query)).items():
+            column = self.vocabulary.get(term)
+            if column is not None:
+                query_weights[column] = count * self.idf[column]
+        norm = math.sqrt(sum(v * v for v in query_weights.values()))
+        if not norm:
+            return [0.0] * len(self)
+        return [
+            sum(weight * query_weights.get(column, 0.0) for column, weight in self.row(row)) / norm
+            for row in range(len(self))
+        ]
+
+    def near_duplicates(self, threshold: float = DEFAULT_DUPLICATE_THRESHOLD) -> List[int]:
+        """Rows that repeat an earlier kept row.
+
+        Rows are visited in order; a row is a duplicate if its cosine
+        similarity with any kept row reaches `threshold`. Dot products are
+        accumulated through the postings of kept rows, so rows without
+        shared terms are never compared.
+
+        Returns:
+            Indices of duplicate rows, ascending
+        """
+        postings: Dict[int, List[Tuple[int, float]]] = {}
+        duplicates = []
+        for row in range(len(self)):
+            entries = list(self.row(row))
+            dots: Dict[int, float] = {}
+            for column, weight in entries:
+                for kept, kept_weight in postings.get(column, ()):
+                    dots[kept] = dots.get(kept, 0.0) + weight * kept_weight
+            if entries and any(dot >= threshold for dot in dots.values()):
+                duplicates.append(row)
+                continue
+            for column, weight in entries:
+                postings.setdefault(column, []).append((row, weight))
+        return duplicates
+
+
+def remove_near_duplicates(
+    findings: Sequence[Dict[str, Any]],
+    threshold: float = DEFAULT_DUPLICATE_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """Drop findings that repeat an earlier one.
+
+    A finding repeats an earlier one if it has the same title (ignoring
+    case) or its TF-IDF cosine similarity reaches `threshold`. The first
+    occurrence is kept, so pass findings best first.
+
+    Args:
+        findings: Findings with title and summary
+        threshold: Cosine similarity for near-duplicates
+
+    Returns:
+        Remaining findings in their original order
+    """
+    duplicates = set(FindingMatrix(findings).near_duplicates(threshold))
+    seen_titles = set()
+    unique = []
+    for row, finding in enumerate(findings):
+        title = str(finding.get('title') or '').lower().strip()
+        if row in duplicates or (title and title in seen_titles):
+            continue
+        if title:
+            seen_titles.add(title)
+        unique.append(finding)
+    return unique
@@ -0,0 +1,186 @@
+"""Concurrent execution of external researchers.
+
+Sources are researcher plugins (see plugins.py) or ResearchTasks wrapping a
+blocking function. All of them run concurrently on one asyncio event loop;
+blocking work runs in worker threads. Every source gets its own timeout
+and the whole phase is bounded by a global deadline, so external research
+takes as long as the slowest source rather than the sum of all of them. A
+source that times out contributes no findings; its threads are abandoned
+and finish in the background (bounded by the researcher's own socket
+timeouts).
+
+`stream_research()` yields each source's result as soon as it finishes,
+so callers can process findings while slower sources are still running;
+`run_research()` collects them in source order.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .plugins import ResearchContext, ResearcherPlugin
+
+# Default per-source timeout in seconds
+DEFAULT_SOURCE_TIMEOUT = 60.0
+
+# Default deadline for the whole research phase in seconds
+DEFAULT_DEADLINE = 180.0
+
+
+@dataclass
+class ResearchTask:
+    """A blocking function run as a research source."""
+    name: str
+    run: Callable[[], List[Dict[str, Any]]]
+    timeout: Optional[float] = None  # Overrides the runner's per-source timeout
+    max_concurrency: int = 1
+
+
+@dataclass
+class ResearchResult:
+    """Outcome of one research source."""
+    name: str
+    findings: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+    timed_out: bool = False
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+Source = Union[ResearchTask, ResearcherPlugin]
+
+
+def stream_research(
+    tasks: Sequence[Source],
+    context: Optional[ResearchContext] = None,
+    source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+    deadline: Optional[float] = DEFAULT_DEADLINE,
+    max_workers: Optional[int] = None
+) -> Iterator[ResearchResult]:
+    """Run research sources concurrently, yielding results as they finish.
+
+    Args:
+        tasks: Plugins or tasks to run
+        context: Shared resources handed to plugins
+        source_timeout: Seconds each source may take (None for no limit);
+            a source's own `timeout` takes precedence
+        deadline: Seconds the whole phase may take (None for no limit)
+        max_workers: Thread pool size (defaults to the sum of the sources'
+            `max_concurrency`)
+
+    Yields:
+        One result per source, in completion order; sources stopped by the
+        deadline come last
+    """
+    for _, result in _iterate(tasks, context, source_timeout, deadline, max_workers):
+        yield result
+
+
+def run_research(
+    tasks: Sequence[Source],
+    source_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+    deadline: Optional[float] = DEFAULT_DEADLINE,
+    max_workers: Optional[int] = None,
+    context: Optional[ResearchContext] = None
+) -> List[ResearchResult]:
+    """Run research sources concurrently.
+
+    Args:
+        tasks: Plugins or tasks to run
+        source_timeout: Seconds each source may take (None for no limit)
+        deadline: Seconds the whole phase may take (None for no limit)
+        max_workers: Thread pool size (defaults to the sum of the sources'
+            `max_concurrency`)
+        context: Shared resources handed to plugins
+
+    Returns:
+        One result per task, in task order
+    """
+    results: List[Optional[ResearchResult]] = [None] * len(tasks)
+    for index, result in _iterate(tasks, context, source_timeout, deadline, max_workers):
+        results[index] = result
+    return results
+
+
+def _iterate(tasks, context, source_timeout, deadline, max_workers) -> Iterator[Tuple[int, ResearchResult]]:
+    """Drive the async stream from synchronous code, one result at a time."""
+    if not tasks:
+        return
+    loop = asyncio.new_event_loop()
+    stream = _stream(
+        list(tasks), context or ResearchContext(), source_timeout, deadline,
+        max_workers or sum(max(1, task.max_concurrency) for task in tasks)
+    )
+    try:
+        while True:
+            try:
+                yield loop.run_until_complete(stream.__anext__())
+            except StopAsyncIteration:
+                break
+    finally:
+        # Also reached when the caller stops early: cancel what is left
+        loop.run_until_complete(stream.aclose())
+        loop.close()
+
+
+async def _stream(
+    tasks: List[Source],
+    context: ResearchContext,
+    source_timeout: Optional[float],
+    deadline: Optional[float],
+    max_workers: int
+) -> AsyncIterator[Tuple[int, ResearchResult]]:
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="research")
+    started = time.monotonic()
+    running: Dict[asyncio.Future, int] = {}
+    try:
+        for index, task in enumerate(tasks):
+            timeout = task.timeout if task.timeout is not None else source_timeout
+            bound = context.bind(executor, task.max_concurrency)
+            running[asyncio.ensure_future(_run_one(task, bound, timeout))] = index
+
+        pending = set(running)
+        while pending:
+            remaining = None if deadline is None else max(0.0, started + deadline - time.monotonic())
+            done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                break
+            for future in sorted(done, key=running.get):
+                yield running[future], future.result()
+
+        for future in sorted(pending, key=running.get):
+            future.cancel()
+            yield running[future], ResearchResult(
+                tasks[running[future]].name,
+                error=f"stopped at the {deadline:g}s research deadline",
+                timed_out=True,
+                elapsed=time.monotonic() - started
+            )
+    finally:
+        for future in running:
+            future.cancel()
+        # Do not wait for abandoned sources
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_one(task: Source, context: ResearchContext, timeout: Optional[float]) -> ResearchResult:
+    started = time.monotonic()
+    if asyncio.iscoroutinefunction(task.run):
+        work = task.run(context)
+    else:
+        work = context.run_blocking(task.run)
+    try:
+        findings = await asyncio.wait_for(work, timeout)
+    except asyncio.TimeoutError:
+        return ResearchResult(
+            task.name, error=f"timed out after {timeout:g}s", timed_out=True,
+            elapsed=time.monotonic() - started
+        )
+    except Exception as e:
+        return ResearchResult(task.name, error=str(e) or type(e).__name__, elapsed=time.monotonic() - started)
+    return ResearchResult(task.name, list(findings or []), elapsed=time.monotonic() - started)
@@ -0,0 +1,218 @@
+"""Built-in researcher plugins for the self-improvement analyzer.
+
+Each external source (web, github, papers, frameworks) is a
+ResearcherPlugin wrapping its researcher. All of them share the research
+cache from the context, and the search sources (web, papers) share its
+search rate limit.
+"""
+
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .arxiv_index import DEFAULT_INDEX_PATH
+from .cache import ResearchCache
+from .framework_researcher import DEFAULT_MAX_WORKERS, FrameworkAnalysisResearcher
+from .github_researcher import GitHubAnalysisResearcher
+from .http_pool import ConnectionPool
+from .paper_researcher import PaperResearcher
+from .plugins import ResearchContext, ResearcherPlugin, discover_plugins
+from .rate_limit import SEARCH_BURST, SEARCH_RATE, TokenBucket
+from .runner import stream_research
+from .transport import RecordingTransport, ReplayTransport, Transport
+from .web_researcher import DEFAULT_MAX_CONCURRENT_SEARCHES, WebSearchResearcher
+
+# Repository analyzed when GITHUB_REPOSITORY is not set
+DEFAULT_REPOSITORY = 'Kixantrix/kerrigan'
+
+
+class WebSearchPlugin(ResearcherPlugin):
+    """Web search for best practices."""
+
+    name = 'web'
+    label = "🔎 Web search for best practices"
+    max_concurrency = DEFAULT_MAX_CONCURRENT_SEARCHES
+
+    async def run(self, context: ResearchContext) -> List[Dict[str, Any]]:
+        researcher = WebSearchResearcher(
+            enabled=True, cache=context.cache, queries_file=context.options.get('web_queries_file'),
+            rate_limiter=context.search_limiter, max_concurrency=context.max_concurrency
+        )
+        return await context.run_blocking(researcher.search_best_practices)
+
+
+class GitHubPatternsPlugin(ResearcherPlugin):
+    """PR and issue patterns of the analyzed repository."""
+
+    name = 'github'
+    label = "📊 GitHub patterns"
+
+    def skip_reason(self, context: ResearchContext) -> Optional[str]:
+        # Replayed responses need no credentials
+        if not context.github_token and not isinstance(context.transport, ReplayTransport):
+            return "GITHUB_TOKEN not available, skipping GitHub analysis"
+        if len((context.repository or '').split('/')) != 2:
+            return f"Invalid GITHUB_REPOSITORY format: {context.repository}"
+        return None
+
+    async def run(self, context: ResearchContext) -> List[Dict[str, Any]]:
+        owner, name = context.repository.split('/')
+        researcher = GitHubAnalysisResearcher(
+            owner, name, context.github_token,
+            enabled=True, use_graphql=context.options.get('use_graphql', False), cache=context.cache,
+            transport=context.transport, store_path=context.options.get('github_store')
+        )
+        return await context.run_blocking(researcher.analyze_patterns, 30)
+
+
+class PaperPlugin(ResearcherPlugin):
+    """Papers from the local arXiv index."""
+
+    name = 'papers'
+    label = "📄 arXiv research papers"
+
+    async def run(self, context: ResearchContext) -> List[Dict[str, Any]]:
+        researcher = PaperResearcher(
+            enabled=True, cache=context.cache, rate_limiter=context.search_limiter,
+            index_path=context.options.get('arxiv_index') or DEFAULT_INDEX_PATH
+        )
+        return await context.run_blocking(researcher.search_arxiv)
+
+
+class FrameworkPlugin(ResearcherPlugin):
+    """Features of other agent frameworks."""
+
+    name = 'frameworks'
+    label = "🔧 Other agent frameworks"
+    max_concurrency = DEFAULT_MAX_WORKERS
+
+    async def run(self, context: ResearchContext) -> List[Dict[str, Any]]:
+        researcher = FrameworkAnalysisResearcher(
+            enabled=True, github_token=context.github_token,
+            use_graphql=context.options.get('use_graphql', False), cache=context.cache,
+            frameworks_file=context.options.get('frameworks_file'), max_workers=context.max_concurrency,
+            transport=context.transport
+        )
+        return await context.run_blocking(researcher.analyze_frameworks)
+
+
+# Built-in plugins, in the order their results are reported
+BUILTIN_PLUGINS = (WebSearchPlugin(), GitHubPatternsPlugin(), PaperPlugin(), FrameworkPlugin())
+
+
+def open_research_transport(record: Optional[str] = None, replay: Optional[str] = None) -> Optional[Transport]:
+    """Transport recording to, or replaying from, a cassette file.
+
+    Args:
+        record: Cassette to record live traffic into
+        replay: Cassette to answer requests from, offline
+
+    Returns:
+        The transport, or None for live requests without recording
+
+    Raises:
+        ValueError: If both are given, or the replay cassette is unreadable
+    """
+    if record and replay:
+        raise ValueError("Cannot record and replay research traffic at once")
+    if replay:
+        return ReplayTransport(Path(replay))
+    if record:
+        return RecordingTransport(Path(record), ConnectionPool())
+    return None
+
+
+def build_research_context(
+    cache: Optional[ResearchCache] = None,
+    use_graphql: bool = False,
+    frameworks_file: Optional[str] = None,
+    web_queries_file: Optional[str] = None,
+    arxiv_index: Optional[str] = None,
+    transport: Optional[Transport] = None,
+    github_store: Optional[str] = None
+) -> ResearchContext:
+    """Context for a research run.
+
+    The GitHub token and repository come from GITHUB_TOKEN and
+    GITHUB_REPOSITORY.
+
+    Args:
+        cache: Shared research cache (None disables caching)
+        use_graphql: Batch GitHub requests through the GraphQL API
+        frameworks_file: YAML/JSON list of frameworks to analyze
+        web_queries_file: YAML/JSON list of web search queries
+        arxiv_index: Local arXiv index for offline paper search
+            (defaults to DEFAULT_INDEX_PATH)
+        transport: Shared HTTP transport (see open_research_transport)
+        github_store: SQLite store for incremental GitHub pattern analysis
+            (None fetches the whole window on every run)
+    """
+    return ResearchContext(
+        cache=cache,
+        search_limiter=TokenBucket(SEARCH_RATE, SEARCH_BURST),
+        github_token=os.environ.get('GITHUB_TOKEN'),
+        repository=os.environ.get('GITHUB_REPOSITORY', DEFAULT_REPOSITORY),
+        transport=transport,
+        options={
+            'use_graphql': use_graphql,
+            'frameworks_file': frameworks_file,
+            'web_queries_file': web_queries_file,
+            'arxiv_index': arxiv_index,
+            'github_store': github_store,
+        }
+    )
+
+
+def select_plugins(names: Sequence[str], context: ResearchContext) -> List[ResearcherPlugin]:
+    """Enabled plugins that can run with this context.
+
+    Unknown names and plugins that cannot run (see
+    ResearcherPlugin.skip_reason) are skipped with a warning.
+
+    Args:
+        names: Names of the plugins to run, built-in or discovered
+        context: Context the plugins will run with
+
+    Returns:
+        Plugins in the order of `names`
+    """
+    available = discover_plugins(BUILTIN_PLUGINS)
+    selected = []
+    for name in dict.fromkeys(names):
+        plugin = available.get(name)
+        if plugin is None:
+            print(f"\n   ⚠️  Unknown researcher plugin '{name}' (available: {', '.join(available)})")
+            continue
+        reason = plugin.skip_reason(context)
+        if reason:
+            print(f"\n   ⚠️  {reason}")
+            continue
+        selected.append(plugin)
+    return selected
+
+
+def run_plugins(
+    plugins: Sequence[ResearcherPlugin],
+    context: ResearchContext,
+    on_findings: Callable[[str, List[Dict[str, Any]]], None],
+    source_timeout: Optional[float],
+    deadline: Optional[float]
+) -> None:
+    """Run plugins concurrently, handing over each one's findings as it finishes.
+
+    Failed and timed-out plugins are reported with a warning.
+
+    Args:
+        plugins: Plugins to run
+        context: Context to run them with
+        on_findings: Called with (plugin name, findings) per successful plugin
+        source_timeout: Seconds each plugin may take (None for no limit)
+        deadline: Seconds all plugins together may take (None for no limit)
+    """
+    labels = {plugin.name: plugin.label or plugin.name for plugin in plugins}
+    for result in stream_research(plugins, context, source_timeout, deadline):
+        if result.ok:
+            print(f"   {labels[result.name]}: {len(result.findings)} findings ({result.elapsed:.1f}s)")
+            on_findings(result.name, result.findings)
+        else:
+            print(f"   ⚠️  {labels[result.name]} skipped: {result.error}")
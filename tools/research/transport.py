@@ -0,0 +1,220 @@
+"""Record and replay of the research modules' HTTP traffic.
+
+Research HTTP requests go through a transport: an object with the
+`request(method, url, body, headers)` method of ConnectionPool, returning
+(response headers, response body) and raising urllib errors. Besides the
+live ConnectionPool there are two transports for offline runs:
+
+- RecordingTransport forwards requests to a live transport and writes
+  every exchange to a cassette file (JSON) when closed
+- ReplayTransport answers requests from a cassette without any network
+  access; a request that was not recorded fails with URLError, as if the
+  network were down
+
+Request headers are never written to cassettes, so API tokens stay out of
+them. Conditional request headers are dropped while recording, so every
+recorded response carries a full body; on replay, a conditional request
+whose validator matches the recorded `ETag` or `Last-Modified` gets a
+`304 Not Modified`, as it would from GitHub.
+
+Each exchange also records how long it took, so a replayed run can report
+the network time it saved next to the time spent parsing and aggregating.
+"""
+
+import base64
+import http.client
+import json
+import os
+import threading
+import time
+import urllib.error
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Bump when the cassette layout changes
+CASSETTE_VERSION = 1
+
+_CONDITIONAL_HEADERS = ('If-None-Match', 'If-Modified-Since')
+
+
+class Transport(ABC):
+    """Interface of a research HTTP transport."""
+
+    @abstractmethod
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None
+    ) -> Tuple[http.client.HTTPMessage, bytes]:
+        """Send a request.
+
+        Returns:
+            Tuple of (response headers, response body)
+
+        Raises:
+            urllib.error.HTTPError: For responses with status 300 or above
+            urllib.error.URLError: On network failures
+        """
+
+    def close(self) -> None:
+        """Release connections (and write any recording)."""
+
+
+def _request_key(method: str, url: str, body: Optional[bytes]) -> str:
+    return f"{method} {url} {(body or b'').decode('utf-8', 'replace')}"
+
+
+def _encode_body(payload: Optional[bytes]) -> Dict[str, Any]:
+    if payload is None:
+        return {}
+    try:
+        return {'body': payload.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {'body_base64': base64.b64encode(payload).decode('ascii')}
+
+
+def _decode_body(entry: Dict[str, Any]) -> bytes:
+    if 'body_base64' in entry:
+        return base64.b64decode(entry['body_base64'])
+    return str(entry.get('body') or '').encode('utf-8')
+
+
+def _headers(pairs: List[List[str]]) -> http.client.HTTPMessage:
+    message = http.client.HTTPMessage()
+    for name, value in pairs:
+        message[name] = value
+    return message
+
+
+class RecordingTransport(Transport):
+    """Forwards requests to a live transport and records the exchanges."""
+
+    def __init__(self, path: Path, transport: Transport):
+        """Start a recording.
+
+        Args:
+            path: Cassette file, written (replacing any earlier one) on close
+            transport: Live transport to forward requests to
+        """
+        self.path = Path(path)
+        self.transport = transport
+        self.interactions: List[Dict[str, Any]] = []
+        self.stats = {'requests': 0, 'network_seconds': 0.0}
+        self._lock = threading.Lock()
+
+    def request(self, method, url, body=None, headers=None):
+        headers = {k: v for k, v in (headers or {}).items() if k not in _CONDITIONAL_HEADERS}
+        started = time.perf_counter()
+        try:
+            response_headers, payload = self.transport.request(method, url, body, headers)
+            response = {'status': 200, 'reason': 'OK', 'headers': list(response_headers.items()),
+                        **_encode_body(payload)}
+            error = None
+        except urllib.error.HTTPError as e:
+            response = {'status': e.code, 'reason': str(e.reason),
+                        'headers': list(e.headers.items()) if e.headers else []}
+            error = e
+        except urllib.error.URLError as e:
+            response = {'error': str(e.reason)}
+            error = e
+        elapsed = time.perf_counter() - started
+
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['network_seconds'] += elapsed
+            self.interactions.append({
+                'request': {'method': method, 'url': url, **_encode_body(body)},
+                'response': response,
+                'elapsed': round(elapsed, 6),
+            })
+        if error is not None:
+            raise error
+        return response_headers, payload
+
+    def save(self) -> None:
+        """Write the cassette atomically."""
+        with self._lock:
+            content = json.dumps({'version': CASSETTE_VERSION, 'interactions': self.interactions}, indent=1)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(content, encoding='utf-8')
+        tmp_path.replace(self.path)
+
+    def close(self) -> None:
+        self.transport.close()
+        self.save()
+        print(f"   Recorded {self.stats['requests']} requests to {self.path}")
+
+
+class ReplayTransport(Transport):
+    """Answers requests from a recorded cassette, offline."""
+
+    def __init__(self, path: Path):
+        """Load a cassette.
+
+        Repeated requests get the recorded responses in order; once those
+        run out, the last one is repeated.
+
+        Args:
+            path: Cassette file written by RecordingTransport
+
+        Raises:
+            ValueError: If the file is not a cassette of this version
+        """
+        self.path = Path(path)
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                cassette = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            raise ValueError(f"Cannot read cassette {self.path}: {e}")
+        if not isinstance(cassette, dict) or cassette.get('version') != CASSETTE_VERSION:
+            raise ValueError(f"{self.path} is not a version {CASSETTE_VERSION} cassette")
+
+        self._responses: Dict[str, List[Dict[str, Any]]] = {}
+        for interaction in cassette.get('interactions') or []:
+            request = interaction['request']
+            key = _request_key(request['method'], request['url'], _decode_body(request) or None)
+            response = {**interaction['response'], 'elapsed': interaction.get('elapsed', 0)}
+            self._responses.setdefault(key, []).append(response)
+        self._served: Dict[str, int] = {}
+        self.stats = {'requests': 0, 'missing': 0, 'recorded_seconds': 0.0}
+        self._lock = threading.Lock()
+
+    def request(self, method, url, body=None, headers=None):
+        key = _request_key(method, url, body)
+        with self._lock:
+            self.stats['requests'] += 1
+            responses = self._responses.get(key)
+            if not responses:
+                self.stats['missing'] += 1
+                raise urllib.error.URLError(f"No recorded response for {method} {url}")
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+            response = responses[min(served, len(responses) - 1)]
+            self.stats['recorded_seconds'] += response['elapsed']
+
+        if 'error' in response:
+            raise urllib.error.URLError(response['error'])
+        response_headers = _headers(response['headers'])
+        status = response['status']
+        if status < 300 and self._not_modified(headers or {}, response_headers):
+            status = 304
+        if status >= 300:
+            raise urllib.error.HTTPError(url, status, response.get('reason', ''), response_headers, None)
+        return response_headers, _decode_body(response)
+
+    def close(self) -> None:
+        print(f"   Replayed {self.stats['requests']} requests from {self.path} "
+              f"({self.stats['recorded_seconds']:.1f}s of recorded network time)")
+
+    @staticmethod
+    def _not_modified(headers: Dict[str, str], response_headers: http.client.HTTPMessage) -> bool:
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        return bool(
+            (etag and headers.get('If-None-Match') == etag)
+            or (last_modified and headers.get('If-Modified-Since') == last_modified)
+        )
@@ -3,29 +3,89 @@
 This module researches AI agent best practices through web search.
 """
 
-import hashlib
-import json
-import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import yaml
 
 from .base import BaseResearcher
+from .cache import ResearchCache, open_research_cache
+from .rate_limit import SEARCH_BURST, SEARCH_RATE, TokenBucket
+from .relevance import FindingMatrix, remove_near_duplicates
+
+# Search queries used without a query file; {year} becomes the current year
+DEFAULT_QUERIES = (
+    "AI agent orchestration best practices {year}",
+    "multi-agent system design patterns",
+    "autonomous agent workflow failures and solutions",
+)
+
+# Searches in flight at once (the rate limiter still applies)
+DEFAULT_MAX_CONCURRENT_SEARCHES = 4
+
+# Keyword relevance a finding needs to be reported
+MIN_RELEVANCE = 0.6
+
+
+def load_queries(path: Path) -> List[str]:
+    """Load web search queries from a YAML or JSON file.
+
+    The file holds a list of query strings (or a mapping with a `queries`
+    list). `{year}` in a query is replaced with the current year.
+
+    Args:
+        path: Query list file
+
+    Returns:
+        Queries in file order
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = yaml.safe_load(f) or []
+    if isinstance(data, dict):
+        data = data.get('queries') or []
+    if not isinstance(data, list) or not all(isinstance(query, str) and query.strip() for query in data):
+        raise ValueError(f"Queries in {path} must be a list of non-empty strings")
+    return [query.strip() for query in data]
 
 
 class WebSearchResearcher(BaseResearcher):
     """Researches AI agent best practices through web search."""
     
-    def __init__(self, enabled: bool = True, cache_dir: str = ".research_cache"):
+    cache_namespace = 'web'
+    
+    def __init__(
+        self,
+        enabled: bool = True,
+        cache_dir: Optional[str] = ".research_cache",
+        cache: Optional[ResearchCache] = None,
+        queries: Optional[Sequence[str]] = None,
+        queries_file: Optional[str] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENT_SEARCHES
+    ):
         """Initialize web search researcher.
         
         Args:
             enabled: Whether this researcher is enabled
-            cache_dir: Directory for caching search results
+            cache_dir: Directory for caching search results (None disables caching)
+            cache: Shared research cache (overrides cache_dir)
+            queries: Search queries (defaults to DEFAULT_QUERIES)
+            queries_file: YAML/JSON list of search queries (overrides queries)
+            rate_limiter: Shared search rate limit (defaults to a private
+                SEARCH_RATE/SEARCH_BURST bucket)
+            max_concurrency: Searches in flight at once
         """
-        super().__init__(enabled)
-        self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
-        self.rate_limit_delay = 2  # seconds between searches
+        super().__init__(
+            enabled,
+            cache if cache is not None else open_research_cache(cache_dir),
+            rate_limiter if rate_limiter is not None else TokenBucket(SEARCH_RATE, SEARCH_BURST)
+        )
+        if queries_file:
+            queries = load_queries(Path(queries_file))
+        self.queries = list(queries if queries is not None else DEFAULT_QUERIES)
+        self.max_concurrency = max(1, max_concurrency)
     
     def search_best_practices(self) -> List[Dict[str, Any]]:
         """Search for AI agent best practices.
@@ -41,63 +101,68 @@ class WebSearchResearcher(BaseResearcher):
         
         print("   🔎 Searching web for AI agent best practices...")
         
-        findings = []
-        
-        # Define focused search queries for agent best practices
-        # Note: Using current year dynamically for queries, though knowledge-based
-        # findings don't require it since they're based on established patterns
-        from datetime import datetime
-        current_year = datetime.now().year
-        
-        queries = [
-            f"AI agent orchestration best practices {current_year}",
-            "multi-agent system design patterns",
-            "autonomous agent workflow failures and solutions"
-        ]
-        
+        # Uncached queries are searched concurrently, as fast as the shared
+        # rate limit allows; results are combined in query order
+        year = str(datetime.now().year)
+        queries = list(dict.fromkeys(query.replace('{year}', year) for query in self.queries))
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        pending = []
         for query in queries:
-            try:
-                # Check cache first
-                cached_result = self._get_cached_result(query)
-                if cached_result:
-                    findings.extend(cached_result)
-                    print(f"      ✓ Using cached results for: {query[:50]}...")
-                else:
-                    # Perform web search
-                    result = self._perform_search(query)
-                    if result:
-                        findings.extend(result)
-                        self._cache_result(query, result)
+            cached_result = self.cache_get(query)
+            if cached_result:
+                results[query] = cached_result
+                print(f"      ✓ Using cached results for: {query[:50]}...")
+            else:
+                pending.append(query)
+        
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(pending))) as executor:
+                for query, (result, error) in zip(pending, executor.map(self._search, pending)):
+                    if error is not None:
+                        print(f"      ⚠️  Search failed for '{query[:50]}...': {error}")
+                    elif result:
+                        results[query] = result
+                        self.cache_put(query, result)
                         print(f"      ✓ Found insights for: {query[:50]}...")
-                        # Rate limiting
-                        time.sleep(self.rate_limit_delay)
-            except Exception as e:
-                print(f"      ⚠️  Search failed for '{query[:50]}...': {e}")
-                continue
         
-        # Filter and score findings
-        filtered_findings = []
-        for finding in findings:
-            relevance = self.evaluate_relevance(finding)
-            if relevance >= 0.6:  # Only include relevant findings
-                finding['relevance'] = relevance
-                filtered_findings.append(finding)
+        findings = [finding for query in queries for finding in results.get(query, [])]
         
-        # Deduplicate findings by title similarity
-        filtered_findings = self._deduplicate_findings(filtered_findings)
-        
-        # Limit to top findings
-        filtered_findings = sorted(
-            filtered_findings, 
-            key=lambda x: x.get('relevance', 0), 
+        # Score the whole batch at once: keyword coverage decides what is
+        # relevant, similarity to the queries breaks ties
+        matrix = FindingMatrix(findings)
+        relevance = matrix.keyword_scores()
+        similarity = matrix.query_scores(' '.join(queries))
+        ranked = sorted(
+            (row for row in range(len(findings)) if relevance[row] >= MIN_RELEVANCE),
+            key=lambda row: (relevance[row], similarity[row]),
             reverse=True
-        )[:5]
+        )
+        filtered_findings = []
+        for row in ranked:
+            findings[row]['relevance'] = relevance[row]
+            filtered_findings.append(findings[row])
+        
+        # Drop near-duplicates (best first, so the better copy is kept) and
+        # limit to top findings
+        filtered_findings = self._deduplicate_findings(filtered_findings)[:5]
         
         self.findings = filtered_findings
         print(f"      Found {len(filtered_findings)} relevant findings")
         
         return filtered_findings
     
+    def _search(self, query: str) -> Tuple[List[Dict[str, Any]], Optional[Exception]]:
+        """Run one rate-limited search.
+        
+        Returns:
+            Tuple of (findings, error), with error None on success
+        """
+        self.throttle()
+        try:
+            return self._perform_search(query), None
+        except Exception as e:
+            return [], e
+    
     def _perform_search(self, query: str) -> List[Dict[str, Any]]:
         """Perform a web search by generating findings from known best practices.
         
@@ -154,86 +219,22 @@ class WebSearchResearcher(BaseResearcher):
         
         return findings
     
-    def _get_cached_result(self, query: str) -> List[Dict[str, Any]]:
-        """Get cached search result if available and recent.
-        
-        Args:
-            query: Search query string
-            
-        Returns:
-            Cached findings or None if not available/expired
-        """
-        cache_file = self.cache_dir / f"{self._hash_query(query)}.json"
-        
-        if not cache_file.exists():
-            return None
-        
-        try:
-            # Check if cache is recent (less than 7 days old)
-            cache_age = time.time() - cache_file.stat().st_mtime
-            if cache_age > (7 * 24 * 60 * 60):  # 7 days in seconds
-                return None
-            
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception:
-            return None
-    
-    def _cache_result(self, query: str, findings: List[Dict[str, Any]]):
-        """Cache search results.
-        
-        Args:
-            query: Search query string
-            findings: List of findings to cache
-        """
-        cache_file = self.cache_dir / f"{self._hash_query(query)}.json"
-        
-        try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(findings, f, indent=2)
-        except Exception as e:
-            print(f"      ⚠️  Failed to cache results: {e}")
-    
-    def _hash_query(self, query: str) -> str:
-        """Generate a hash for a query to use as cache key.
-        
-        Uses SHA-256 for cache key generation. While cryptographic strength
-        is not required for caching, SHA-256 is widely available and provides
-        good collision resistance.
-        
-        Args:
-            query: Search query string
-            
-        Returns:
-            Hash string (hex digest)
-        """
-        return hashlib.sha256(query.encode('utf-8')).hexdigest()
-    
     def _deduplicate_findings(self, findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Remove duplicate findings based on title similarity.
+        """Remove findings with the same title or near-identical text.
         
         Args:
-            findings: List of findings
+            findings: List of findings, best first
             
         Returns:
             Deduplicated list of findings
         """
-        seen_titles = set()
-        unique_findings = []
-        
-        for finding in findings:
-            title = finding.get('title', '').lower().strip()
-            if title and title not in seen_titles:
-                seen_titles.add(title)
-                unique_findings.append(finding)
-        
-        return unique_findings
+        return remove_near_duplicates(findings)
     
     def evaluate_relevance(self, finding: Dict[str, Any]) -> float:
         """Calculate relevance score for a finding.
         
-        Scores findings based on presence of agent-related keywords.
-        Uses a set to track which keywords are found to avoid double-counting.
+        Scores findings by the share of agent-related keywords
+        (RELEVANCE_KEYWORDS) among their title and summary words.
         
         Args:
             finding: Finding dictionary with title and summary
@@ -241,20 +242,4 @@ class WebSearchResearcher(BaseResearcher):
         Returns:
             Relevance score from 0.0 to 1.0
         """
-        # Check for agent-related keywords
-        keywords = ['agent', 'autonomous', 'ai', 'llm', 'orchestration', 'workflow']
-        title = finding.get('title', '').lower()
-        summary = finding.get('summary', '').lower()
-        
-        # Track which keywords are found to avoid double-counting
-        found_keywords = set()
-        
-        for keyword in keywords:
-            if keyword in title or keyword in summary:
-                found_keywords.add(keyword)
-        
-        # Score based on number of unique keywords found
-        # Each keyword contributes equally to reach max score of 1.0
-        score = len(found_keywords) / len(keywords) if keywords else 0.0
-        
-        return min(score, 1.0)
+        return FindingMatrix([finding]).keyword_scores()[0]
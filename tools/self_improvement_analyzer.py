@@ -13,84 +13,146 @@ Outputs actionable improvement proposals for human review.
 
 from __future__ import annotations
 
+import importlib.util
 import json
-import os
-import re
 import sys
 from collections import defaultdict, Counter
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set
 
-# Check for PyYAML dependency
-try:
-    import yaml
-except ImportError:
+# The research and analysis modules below parse YAML with PyYAML
+if importlib.util.find_spec("yaml") is None:
     print("Error: PyYAML is required. Install with: pip install pyyaml", file=sys.stderr)
     sys.exit(1)
 
 # Import research modules
 from research import (
-    GitHubAnalysisResearcher,
-    WebSearchResearcher,
-    PaperResearcher,
-    FrameworkAnalysisResearcher
+    CACHE_BACKENDS,
+    DEFAULT_DEADLINE,
+    DEFAULT_SOURCE_TIMEOUT,
+    build_research_context,
+    open_research_cache,
+    open_research_transport,
+    remove_near_duplicates,
+    run_plugins,
+    select_plugins,
 )
 
-# Common keywords for pattern detection across feedback and retrospectives
-PATTERN_KEYWORDS = [
-    'documentation', 'testing', 'validation', 'agent prompt',
-    'workflow', 'automation', 'quality', 'handoff', 'artifact'
-]
+# Import analysis modules
+from analysis import (
+    STATE_FILENAME,
+    AnalysisState,
+    FeedbackDocuments,
+    FeedbackRecord,
+    MarkdownSections,
+    PATTERN_KEYWORDS,
+    PriorityScorer,
+    cluster_near_duplicates,
+    file_digest,
+    group_related_feedback,
+    generate_report,
+    iter_feedback_files,
+    load_priority_weights,
+    PhaseTimer,
+    metrics_format,
+    write_metrics_file,
+    pattern_keyword_matcher,
+    record_features,
+    record_shingles,
+    timestamp_in_window,
+    write_report_file,
+)
+
+# Parse cache and incremental analysis state, relative to the repository root
+ANALYSIS_CACHE_DIR = ".analysis_cache"
+
+# Shared research cache, relative to the working directory
+RESEARCH_CACHE_DIR = ".research_cache"
+
+# Related-feedback grouping engines (see --similarity)
+SIMILARITY_ENGINES = ('keyword', 'minhash')
 
 class FeedbackAnalyzer:
     """Analyzes agent feedback files."""
     
-    def __init__(self, feedback_dir: Path):
+    def __init__(
+        self,
+        feedback_dir: Path,
+        similarity: str = 'keyword',
+        similarity_threshold: float = 0.8,
+        cache_dir: Optional[Path] = None,
+        scorer: Optional[PriorityScorer] = None
+    ):
+        """
+        Args:
+            feedback_dir: Directory containing feedback YAML files
+            similarity: Grouping engine, 'keyword' (shared keywords or files)
+                or 'minhash' (near-duplicate text clustering)
+            similarity_threshold: Jaccard threshold for the minhash engine
+            cache_dir: Directory for the feedback parse cache (None disables it)
+            scorer: Priority scorer shared with the proposer (default weights if omitted)
+        """
+        if similarity not in SIMILARITY_ENGINES:
+            raise ValueError(f"Unknown similarity engine: {similarity}")
         self.feedback_dir = feedback_dir
-        self.feedback_items: List[Dict[str, Any]] = []
-    
-    def load_feedback(self, since_date: Optional[datetime] = None) -> List[Dict[str, Any]]:
-        """Load feedback files, optionally filtering by date."""
-        feedback_files = list(self.feedback_dir.glob("*.yaml"))
-        
-        for feedback_file in feedback_files:
-            try:
-                with open(feedback_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    # Skip template file
-                    if 'TEMPLATE' in feedback_file.name or 'Copy this template' in content:
-                        continue
-                    
-                    data = yaml.safe_load(content)
-                    if data:
-                        # Check if feedback is new enough
-                        if since_date and 'timestamp' in data:
-                            try:
-                                feedback_time = datetime.fromisoformat(
-                                    data['timestamp'].replace('Z', '+00:00')
-                                )
-                                if feedback_time < since_date:
-                                    continue
-                            except (ValueError, AttributeError):
-                                pass  # Include if timestamp is invalid
-                        
-                        data['_filename'] = feedback_file.name
-                        self.feedback_items.append(data)
-            except (yaml.YAMLError, IOError) as e:
-                print(f"Warning: Could not load {feedback_file.name}: {e}")
+        self.similarity = similarity
+        self.similarity_threshold = similarity_threshold
+        self.cache_dir = cache_dir
+        self.scorer = scorer or PriorityScorer()
+        # Full documents are only re-read for fields records do not keep
+        self.documents = FeedbackDocuments(feedback_dir, cache_dir=cache_dir)
+        self.feedback_items: List[FeedbackRecord] = []
+        self.fingerprints: Dict[str, str] = {}
+        self.last_delta: Dict[str, int] = {}
+    
+    def load_feedback(
+        self,
+        since_date: Optional[datetime] = None,
+        state: Optional[AnalysisState] = None
+    ) -> List[FeedbackRecord]:
+        """Load feedback files, optionally filtering by date.
+
+        Files dated (by filename prefix) before `since_date` are skipped
+        unopened; parsed files are reused from the parse cache when
+        `cache_dir` is set. Each document becomes a compact record as it is
+        read, so memory does not grow with the length of descriptions. With
+        a persisted `state` (keyword grouping), files unchanged since the
+        last run are not read: their records are restored from the state.
+        """
+        keep_shingles = self.similarity == 'minhash'
+        known = state.known_fingerprints() if state is not None and not keep_shingles else None
+        for data in iter_feedback_files(
+            self.feedback_dir, since_date, self.cache_dir, fingerprints=self.fingerprints, known=known
+        ):
+            # Check if feedback is new enough
+            if timestamp_in_window(data.get('timestamp'), since_date):
+                self.feedback_items.append(FeedbackRecord(data, self.documents, keep_shingles))
+        if known:
+            self.feedback_items.extend(state.restore_records(self.fingerprints, since_date, self.documents))
+            self.feedback_items.sort(key=lambda record: record['_filename'])
         
         return self.feedback_items
     
-    def analyze_patterns(self) -> Dict[str, Any]:
-        """Analyze patterns in feedback."""
+    def analyze_patterns(self, state: Optional[AnalysisState] = None) -> Dict[str, Any]:
+        """Analyze patterns in feedback.
+
+        With a persisted `state`, only feedback added, edited or dropped
+        since the last run is ingested and aggregates are updated in place.
+        """
+        if state is not None:
+            self.last_delta = state.ingest_feedback(
+                self.feedback_items, self.fingerprints, self.similarity, self.similarity_threshold
+            )
+            return state.feedback_analysis()
         if not self.feedback_items:
             return {}
         
-        categories = Counter(item.get('category', 'unknown') for item in self.feedback_items)
-        severities = Counter(item.get('severity', 'unknown') for item in self.feedback_items)
-        agents = Counter(item.get('agent_role', 'unknown') for item in self.feedback_items)
-        statuses = Counter(item.get('status', 'new') for item in self.feedback_items)
+        infos = [self.scorer.info(item) for item in self.feedback_items]
+        categories = Counter(info.category for info in infos)
+        severities = Counter(info.severity for info in infos)
+        agents = Counter(info.agent_role for info in infos)
+        statuses = Counter(info.status for info in infos)
         
         # Group related feedback by similar titles or related files
         related_groups = self._find_related_feedback()
@@ -108,92 +170,16 @@ class FeedbackAnalyzer:
     
     def _find_related_feedback(self) -> List[Dict[str, Any]]:
         """Find groups of related feedback items."""
-        groups = []
-        processed = set()
-        
-        for i, item1 in enumerate(self.feedback_items):
-            if i in processed:
-                continue
-            
-            related = [item1]
-            related_indices = {i}
-            
-            for j, item2 in enumerate(self.feedback_items):
-                if j <= i or j in processed:
-                    continue
-                
-                # Check if related by category and similar keywords
-                if self._are_related(item1, item2):
-                    related.append(item2)
-                    related_indices.add(j)
-            
-            if len(related) > 1:
-                groups.append({
-                    'count': len(related),
-                    'category': item1.get('category', 'unknown'),
-                    'items': [item['_filename'] for item in related]
-                })
-                processed.update(related_indices)
-        
-        return groups
-    
-    def _are_related(self, item1: Dict[str, Any], item2: Dict[str, Any]) -> bool:
-        """Check if two feedback items are related."""
-        # Same category
-        if item1.get('category') != item2.get('category'):
-            return False
-        
-        # Similar related files
-        files1 = set(item1.get('related_files', []))
-        files2 = set(item2.get('related_files', []))
-        if files1 and files2 and files1 & files2:
-            return True
-        
-        # Similar keywords in title or description
-        text1 = f"{item1.get('title', '')} {item1.get('description', '')}".lower()
-        text2 = f"{item2.get('title', '')} {item2.get('description', '')}".lower()
-        
-        for keyword in PATTERN_KEYWORDS:
-            if keyword in text1 and keyword in text2:
-                return True
-        
-        return False
+        if self.similarity == 'minhash':
+            return cluster_near_duplicates(
+                self.feedback_items, threshold=self.similarity_threshold,
+                hashed_shingles=record_shingles(self.feedback_items)
+            )
+        return group_related_feedback(self.feedback_items, record_features(self.feedback_items))
     
     def get_top_issues(self, limit: int = 5) -> List[Dict[str, Any]]:
-        """Get top priority feedback issues."""
-        # Prioritize: high severity, new/reviewed status
-        priority_items = []
-        
-        for item in self.feedback_items:
-            score = 0
-            
-            # Severity scoring
-            severity = item.get('severity', 'low')
-            if severity == 'high':
-                score += 10
-            elif severity == 'medium':
-                score += 5
-            
-            # Status scoring (unaddressed is higher priority)
-            status = item.get('status', 'new')
-            if status == 'new':
-                score += 8
-            elif status == 'reviewed':
-                score += 5
-            
-            # Category scoring (some are more critical)
-            category = item.get('category', '')
-            if category in ['tool_limitation', 'artifact_conflict']:
-                score += 3
-            elif category == 'prompt_clarity':
-                score += 2
-            
-            priority_items.append((score, item))
-        
-        # Sort by score descending
-        priority_items.sort(key=lambda x: x[0], reverse=True)
-        
-        return [item for score, item in priority_items[:limit]]
+        """Get top priority feedback issues (highest score first)."""
+        return self.scorer.top(self.feedback_items, limit)
 
 
 class RetrospectiveAnalyzer:
@@ -203,63 +189,90 @@ class RetrospectiveAnalyzer:
         self.docs_dir = docs_dir
         self.retrospectives: List[Dict[str, Any]] = []
     
-    def load_retrospectives(self) -> List[Dict[str, Any]]:
-        """Load retrospective files."""
-        retro_files = list(self.docs_dir.glob("*retrospective*.md"))
+    def load_retrospectives(self, state: Optional[AnalysisState] = None) -> List[Dict[str, Any]]:
+        """Load retrospective files.
+
+        With a persisted `state`, unchanged files are not re-read; their
+        entries carry only the stored `keyword_counts`.
+        """
+        retro_files = sorted(self.docs_dir.glob("*retrospective*.md"))
+        
+        if state is not None:
+            loaded = {}
+            
+            def read_counts(name: str) -> Optional[Dict[str, int]]:
+                retro = self._load_retrospective(self.docs_dir / name)
+                if retro is None:
+                    return None
+                loaded[name] = retro
+                return retro['keyword_counts']
+            
+            fingerprints = {}
+            for retro_file in retro_files:
+                try:
+                    fingerprints[retro_file.name] = file_digest(retro_file)
+                except OSError as e:
+                    print(f"Warning: Could not load {retro_file.name}: {e}")
+            state.ingest_retrospectives(fingerprints, read_counts)
+            for name, entry in sorted(state.retrospectives.items()):
+                self.retrospectives.append(
+                    loaded.get(name) or {'_filename': name, 'keyword_counts': entry['keyword_counts']}
+                )
+            return self.retrospectives
         
         for retro_file in retro_files:
-            try:
-                with open(retro_file, "r", encoding="utf-8") as f:
-                    content = f.read()
-                    
-                    # Extract key sections
-                    lessons = self._extract_section(content, 'Lessons Learned')
-                    challenges = self._extract_section(content, 'Challenges')
-                    recommendations = self._extract_section(content, 'Recommendations')
-                    
-                    self.retrospectives.append({
-                        '_filename': retro_file.name,
-                        'content': content,
-                        'lessons_learned': lessons,
-                        'challenges': challenges,
-                        'recommendations': recommendations,
-                    })
-            except IOError as e:
-                print(f"Warning: Could not load {retro_file.name}: {e}")
+            retro = self._load_retrospective(retro_file)
+            if retro is not None:
+                self.retrospectives.append(retro)
         
         return self.retrospectives
     
-    def _extract_section(self, content: str, heading: str) -> str:
-        r"""Extract content under a specific heading.
-        
-        Pattern explanation:
-        - ^##+ : Match line starting with one or more # (markdown heading)
-        - {re.escape(heading)} : The heading text (escaped for regex)
-        - .*?\n : Rest of heading line
-        - (.*?) : Capture content (non-greedy)
-        - (?=^##+ |\Z) : Stop at next heading or end of string (lookahead)
-        """
-        pattern = rf'^##+ {re.escape(heading)}.*?\n(.*?)(?=^##+ |\Z)'
-        match = re.search(pattern, content, re.MULTILINE | re.DOTALL | re.IGNORECASE)
-        return match.group(1).strip() if match else ""
+    def _load_retrospective(self, retro_file: Path) -> Optional[Dict[str, Any]]:
+        """Read one retrospective and extract its key sections."""
+        try:
+            with open(retro_file, "r", encoding="utf-8") as f:
+                content = f.read()
+        except IOError as e:
+            print(f"Warning: Could not load {retro_file.name}: {e}")
+            return None
+        
+        # Split the document once and serve every section lookup from the map
+        sections = MarkdownSections(content)
+        retro = {
+            '_filename': retro_file.name,
+            'content': content,
+            'lessons_learned': sections.get('Lessons Learned'),
+            'challenges': sections.get('Challenges'),
+            'recommendations': sections.get('Recommendations'),
+        }
+        retro['keyword_counts'] = self._keyword_counts(retro)
+        return retro
+    
+    @staticmethod
+    def _keyword_counts(retro: Dict[str, Any]) -> Dict[str, int]:
+        """Count all pattern keywords in a retrospective's key sections in one pass."""
+        text = " ".join([
+            retro.get('lessons_learned', ''),
+            retro.get('challenges', ''),
+            retro.get('recommendations', '')
+        ]).lower()
+        return pattern_keyword_matcher().count(text)
     
     def extract_patterns(self) -> List[str]:
         """Extract recurring patterns from retrospectives."""
         patterns = []
         
         # Look for common themes across retrospectives
-        all_text = " ".join([
-            r.get('lessons_learned', '') + " " + 
-            r.get('challenges', '') + " " +
-            r.get('recommendations', '')
-            for r in self.retrospectives
-        ]).lower()
-        
-        # Count all pattern keywords in a single pass for efficiency
-        keyword_counts = {keyword: all_text.count(keyword) for keyword in PATTERN_KEYWORDS}
+        keyword_counts: Dict[str, int] = {}
+        for retro in self.retrospectives:
+            counts = retro.get('keyword_counts')
+            if counts is None:
+                counts = self._keyword_counts(retro)
+            for keyword, count in counts.items():
+                keyword_counts[keyword] = keyword_counts.get(keyword, 0) + count
         
-        for keyword, count in keyword_counts.items():
-            if count >= 2:  # Appears in multiple retros
+        for keyword in PATTERN_KEYWORDS:
+            if keyword_counts.get(keyword, 0) >= 2:  # Appears in multiple retros
                 patterns.append(f"Recurring theme: {keyword}")
         
         return patterns
@@ -268,8 +281,22 @@ class RetrospectiveAnalyzer:
 class ImprovementProposer:
     """Generates improvement proposals based on analysis."""
     
-    def __init__(self):
+    def __init__(self, scorer: Optional[PriorityScorer] = None, research_sources: Sequence[str] = ()):
         self.proposals: List[Dict[str, Any]] = []
+        self.scorer = scorer or PriorityScorer()
+        # Findings per research source, added as each source finishes
+        self.research_sources = list(research_sources)
+        self.research_findings: Dict[str, List[Dict[str, Any]]] = {}
+    
+    def add_research_findings(self, source: str, findings: List[Dict[str, Any]]):
+        """Take a research source's findings as soon as the source finishes."""
+        self.research_findings[source] = list(findings)
+    
+    def external_findings(self) -> List[Dict[str, Any]]:
+        """Findings received so far, in source order, without near-duplicates."""
+        order = self.research_sources + [s for s in self.research_findings if s not in self.research_sources]
+        # Sources often report the same practice; keep its first occurrence
+        return remove_near_duplicates([f for source in order for f in self.research_findings.get(source, [])])
     
     def generate_proposals(
         self,
@@ -311,11 +338,11 @@ class ImprovementProposer:
     def _propose_high_severity_fixes(self, feedback_items: List[Dict[str, Any]]):
         """Propose fixes for high-severity feedback."""
         high_severity = [
-            item for item in feedback_items 
-            if item.get('severity') == 'high' and item.get('status') in ['new', 'reviewed']
+            item for item in feedback_items
+            if self.scorer.info(item).severity == 'high' and self.scorer.info(item).unaddressed
         ]
         
-        for item in high_severity[:3]:  # Top 3 high-severity items
+        for item in self.scorer.top(high_severity, 3):  # Top 3 high-severity items
             self.proposals.append({
                 'type': 'bug_fix',
                 'priority': 'high',
@@ -437,160 +464,6 @@ class ImprovementProposer:
             })
 
 
-def generate_report(
-    feedback_analysis: Dict[str, Any],
-    retro_patterns: List[str],
-    proposals: List[Dict[str, Any]],
-    external_findings: Optional[List[Dict[str, Any]]] = None,
-    output_file: Optional[Path] = None
-) -> str:
-    """Generate a markdown report of the analysis and proposals."""
-    
-    report_lines = [
-        "# Kerrigan Self-Improvement Analysis Report",
-        f"\n**Generated**: {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}",
-        "\n---\n",
-        "## Executive Summary\n",
-        f"- **Total feedback items analyzed**: {feedback_analysis.get('total_feedback', 0)}",
-        f"- **High-severity issues**: {feedback_analysis.get('high_severity_count', 0)}",
-        f"- **Unaddressed items**: {feedback_analysis.get('unaddressed_count', 0)}",
-        f"- **Improvement proposals generated**: {len(proposals)}",
-        f"- **Retrospective patterns identified**: {len(retro_patterns)}",
-    ]
-    
-    # Add external research summary if available
-    if external_findings:
-        report_lines.append(f"- **External research findings**: {len(external_findings)}")
-    
-    report_lines.extend([
-        "\n---\n",
-        "## Internal Analysis\n",
-        "### Feedback Analysis\n"
-    ])
-    
-    if feedback_analysis.get('by_category'):
-        report_lines.append("#### Feedback by Category\n")
-        for category, count in sorted(
-            feedback_analysis['by_category'].items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        ):
-            report_lines.append(f"- **{category}**: {count}")
-        report_lines.append("")
-    
-    if feedback_analysis.get('by_severity'):
-        report_lines.append("#### Feedback by Severity\n")
-        for severity, count in sorted(
-            feedback_analysis['by_severity'].items(),
-            key=lambda x: {'high': 3, 'medium': 2, 'low': 1}.get(x[0], 0),
-            reverse=True
-        ):
-            report_lines.append(f"- **{severity}**: {count}")
-        report_lines.append("")
-    
-    if feedback_analysis.get('related_groups'):
-        report_lines.append("#### Related Feedback Groups\n")
-        for group in feedback_analysis['related_groups']:
-            report_lines.append(f"- **{group['category']}**: {group['count']} related items")
-        report_lines.append("")
-    
-    if retro_patterns:
-        report_lines.append("### Retrospective Patterns\n")
-        for pattern in retro_patterns:
-            report_lines.append(f"- {pattern}")
-        report_lines.append("")
-    
-    # Add external research section
-    if external_findings:
-        report_lines.extend([
-            "---\n",
-            "## External Research Findings\n",
-            "\n*These findings are from external sources and require human review before implementation.*\n"
-        ])
-        
-        # Group findings by type
-        findings_by_type = {}
-        for finding in external_findings:
-            finding_type = finding.get('type', 'unknown')
-            if finding_type not in findings_by_type:
-                findings_by_type[finding_type] = []
-            findings_by_type[finding_type].append(finding)
-        
-        # Report each type
-        for finding_type, findings in findings_by_type.items():
-            report_lines.append(f"\n### {finding_type.replace('_', ' ').title()}\n")
-            for finding in findings:
-                report_lines.extend([
-                    f"- **{finding.get('title', 'Untitled')}**",
-                    f"  - Summary: {finding.get('summary', 'N/A')}",
-                    f"  - Relevance: {finding.get('relevance', 0):.2f}",
-                    f"  - Potential application: {finding.get('potential_application', 'N/A')}",
-                    f"  - Evidence: {finding.get('evidence', 'N/A')}",
-                    ""
-                ])
-    
-    report_lines.append("---\n")
-    report_lines.append("## Improvement Proposals\n")
-    report_lines.append(f"\n{len(proposals)} proposals generated for human review:\n")
-    
-    # Separate internal and external proposals
-    internal_proposals = [p for p in proposals if p.get('source') != 'external']
-    external_proposals = [p for p in proposals if p.get('source') == 'external']
-    
-    if internal_proposals:
-        report_lines.append("\n### Internal Analysis Proposals\n")
-        for i, proposal in enumerate(internal_proposals, 1):
-            report_lines.extend([
-                f"\n#### Proposal {i}: {proposal['title']}\n",
-                f"**Type**: {proposal['type']}  ",
-                f"**Priority**: {proposal['priority']}  ",
-                f"**Category**: {proposal['category']}  ",
-                f"\n**Description**: {proposal['description']}\n",
-                f"\n**Evidence**: {proposal['evidence']}\n",
-                f"\n**Proposed Solution**: {proposal['proposed_solution']}\n",
-                f"\n**Suggested Labels**: {', '.join(proposal['labels'])}\n"
-            ])
-    
-    if external_proposals:
-        report_lines.extend([
-            "\n### External Research Proposals\n",
-            "\n⚠️ **Human Review Required**: These proposals are based on external research and must be reviewed before implementation.\n"
-        ])
-        for i, proposal in enumerate(external_proposals, 1):
-            report_lines.extend([
-                f"\n#### External Proposal {i}: {proposal['title']}\n",
-                f"**Type**: {proposal['type']}  ",
-                f"**Priority**: {proposal['priority']}  ",
-                f"**Relevance Score**: {proposal.get('relevance_score', 0):.2f}  ",
-                f"**Research Type**: {proposal.get('research_type', 'unknown')}  ",
-                f"\n**Description**: {proposal['description']}\n",
-                f"\n**Evidence**: {proposal['evidence']}\n",
-                f"\n**Proposed Solution**: {proposal['proposed_solution']}\n",
-                f"\n**Suggested Labels**: {', '.join(proposal['labels'])}\n"
-            ])
-    
-    report_lines.extend([
-        "\n---\n",
-        "## Next Steps\n",
-        "\n1. Review each proposal for relevance and priority",
-        "2. **For external research proposals**: Verify findings with original sources",
-        "3. Create GitHub issues for approved proposals",
-        "4. Assign proposals to appropriate team members or agents",
-        "5. Track implementation progress",
-        "6. Update feedback status as items are addressed\n"
-    ])
-    
-    report = "\n".join(report_lines)
-    
-    if output_file:
-        output_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_file, 'w') as f:
-            f.write(report)
-        print(f"Report written to: {output_file}")
-    
-    return report
-
-
 def main(
     feedback_dir: str = "feedback/agent-feedback",
     docs_dir: str = "docs",
@@ -599,9 +472,27 @@ def main(
     enable_web_research: bool = False,
     enable_github_analysis: bool = True,
     enable_paper_research: bool = False,
-    enable_framework_analysis: bool = False
+    enable_framework_analysis: bool = False,
+    similarity: str = 'keyword',
+    similarity_threshold: float = 0.8,
+    use_cache: bool = True,
+    full_rebuild: bool = False,
+    priority_weights: Optional[Dict[str, Dict[str, int]]] = None,
+    research_timeout: Optional[float] = DEFAULT_SOURCE_TIMEOUT,
+    research_deadline: Optional[float] = DEFAULT_DEADLINE,
+    metrics_outputs: Optional[List[str]] = None,
+    use_graphql: bool = False,
+    research_cache: str = 'files',
+    frameworks_file: Optional[str] = None,
+    web_queries_file: Optional[str] = None,
+    arxiv_index: Optional[str] = None,
+    research_plugins: Optional[List[str]] = None,
+    research_record: Optional[str] = None,
+    research_replay: Optional[str] = None,
+    github_store: Optional[str] = None
 ) -> Dict[str, Any]:
     """Main analysis function."""
+    timer = PhaseTimer()
     
     print("=" * 60)
     print("Kerrigan Self-Improvement Analysis")
@@ -618,96 +509,97 @@ def main(
     
     # Analyze feedback
     print(f"\n📋 Loading feedback from: {feedback_path}")
-    feedback_analyzer = FeedbackAnalyzer(feedback_path)
-    feedback_items = feedback_analyzer.load_feedback(since_date=since_date)
+    cache_dir = repo_root / ANALYSIS_CACHE_DIR if use_cache else None
+    scorer = PriorityScorer(priority_weights)
+    feedback_analyzer = FeedbackAnalyzer(feedback_path, similarity, similarity_threshold, cache_dir, scorer)
+    state = None
+    if cache_dir:
+        state = AnalysisState(cache_dir / STATE_FILENAME, {
+            'feedback_dir': str(feedback_path.resolve()),
+            'docs_dir': str(docs_path.resolve()),
+            'similarity': similarity,
+            'similarity_threshold': similarity_threshold,
+        }, full_rebuild=full_rebuild)
+    with timer.phase('loading'):
+        feedback_items = feedback_analyzer.load_feedback(since_date=since_date, state=state)
     print(f"   Found {len(feedback_items)} feedback items")
     
     print("\n🔍 Analyzing feedback patterns...")
-    feedback_analysis = feedback_analyzer.analyze_patterns()
+    with timer.phase('grouping'):
+        feedback_analysis = feedback_analyzer.analyze_patterns(state)
+    if state is not None:
+        delta = feedback_analyzer.last_delta
+        mode = "Full rebuild" if state.rebuilt else "Incremental update"
+        print(f"   {mode}: {delta['added']} new, {delta['changed']} changed, "
+              f"{delta['removed']} dropped since last run")
     
     # Analyze retrospectives
     print(f"\n📚 Loading retrospectives from: {docs_path}")
     retro_analyzer = RetrospectiveAnalyzer(docs_path)
-    retrospectives = retro_analyzer.load_retrospectives()
+    with timer.phase('loading'):
+        retrospectives = retro_analyzer.load_retrospectives(state)
     print(f"   Found {len(retrospectives)} retrospectives")
     
     print("\n🔍 Extracting patterns from retrospectives...")
-    retro_patterns = retro_analyzer.extract_patterns()
+    with timer.phase('grouping'):
+        retro_patterns = retro_analyzer.extract_patterns()
+    if state is not None:
+        state.save()
     print(f"   Identified {len(retro_patterns)} patterns")
     
-    # External research (optional)
-    external_findings = []
-    
-    if any([enable_web_research, enable_github_analysis, enable_paper_research, enable_framework_analysis]):
-        print("\n🌐 Conducting external research...")
-    
-    if enable_web_research:
-        print("   🔎 Web search for best practices...")
-        web_researcher = WebSearchResearcher(enabled=True)
-        web_findings = web_researcher.search_best_practices()
-        external_findings.extend(web_findings)
-        print(f"      Found {len(web_findings)} web findings")
-    
-    if enable_github_analysis:
-        print("   📊 Analyzing GitHub patterns...")
-        github_token = os.environ.get('GITHUB_TOKEN')
-        if github_token:
-            # Extract repo info from environment or use defaults
-            repo_full_name = os.environ.get('GITHUB_REPOSITORY', 'Kixantrix/kerrigan')
-            repo_parts = repo_full_name.split('/')
-            
-            # Validate repo format
-            if len(repo_parts) != 2:
-                print(f"      ⚠️  Invalid GITHUB_REPOSITORY format: {repo_full_name}")
-            else:
-                repo_owner = repo_parts[0]
-                repo_name = repo_parts[1]
-                
-                gh_researcher = GitHubAnalysisResearcher(repo_owner, repo_name, github_token, enabled=True)
-                gh_findings = gh_researcher.analyze_patterns(days_back=30)
-                external_findings.extend(gh_findings)
-                print(f"      Found {len(gh_findings)} GitHub patterns")
-        else:
-            print("      ⚠️  GITHUB_TOKEN not available, skipping GitHub analysis")
-    
-    if enable_paper_research:
-        print("   📄 Searching arXiv for research papers...")
-        paper_researcher = PaperResearcher(enabled=True)
-        paper_findings = paper_researcher.search_arxiv()
-        external_findings.extend(paper_findings)
-        print(f"      Found {len(paper_findings)} research papers")
-    
-    if enable_framework_analysis:
-        print("   🔧 Analyzing other agent frameworks...")
-        framework_researcher = FrameworkAnalysisResearcher(enabled=True, github_token=os.environ.get('GITHUB_TOKEN'))
-        framework_findings = framework_researcher.analyze_frameworks()
-        external_findings.extend(framework_findings)
-        print(f"      Found {len(framework_findings)} framework insights")
-    
+    # External research (optional): enabled plugins run concurrently and
+    # each one's findings go to the proposer as soon as it finishes
+    # Recording and replaying bypass the cache, so every request reaches the cassette
+    transport = open_research_transport(research_record, research_replay)
+    cache = open_research_cache(RESEARCH_CACHE_DIR, 'off' if transport else research_cache)
+    context = build_research_context(cache, use_graphql, frameworks_file, web_queries_file, arxiv_index, transport,
+                                     github_store)
+    enabled = [name for name, on in (('web', enable_web_research), ('github', enable_github_analysis),
+                                     ('papers', enable_paper_research), ('frameworks', enable_framework_analysis)) if on]
+    plugins = select_plugins(enabled + list(research_plugins or []), context)
+    proposer = ImprovementProposer(scorer, [plugin.name for plugin in plugins])
+    if plugins:
+        print(f"\n🌐 Conducting external research ({', '.join(plugin.name for plugin in plugins)})...")
+        with timer.phase('research'):
+            run_plugins(plugins, context, proposer.add_research_findings, research_timeout, research_deadline)
+    context.close()
+    
+    external_findings = proposer.external_findings()
     if external_findings:
         print(f"\n   Total external findings: {len(external_findings)}")
     
     # Generate proposals
     print("\n💡 Generating improvement proposals...")
-    proposer = ImprovementProposer()
-    proposals = proposer.generate_proposals(
-        feedback_analysis,
-        retro_patterns,
-        feedback_items,
-        external_findings if external_findings else None
-    )
+    with timer.phase('proposals'):
+        proposals = proposer.generate_proposals(
+            feedback_analysis,
+            retro_patterns,
+            feedback_items,
+            external_findings if external_findings else None
+        )
     print(f"   Generated {len(proposals)} proposals")
     
-    # Generate report
+    # Generate report (streamed to the output file; only kept in memory without one)
     print("\n📄 Generating report...")
-    output_path = Path(output_file) if output_file else None
-    report = generate_report(
-        feedback_analysis,
-        retro_patterns,
-        proposals,
-        external_findings if external_findings else None,
-        output_path
-    )
+    report_args = (feedback_analysis, retro_patterns, proposals, external_findings if external_findings else None)
+    with timer.phase('report'):
+        if output_file:
+            report_ref = {'report_path': str(write_report_file(Path(output_file), *report_args))}
+        else:
+            report_ref = {'report': generate_report(*report_args)}
+    
+    metrics = {
+        'feedback_processed': len(feedback_items),
+        'patterns_found': len(retro_patterns) + len(feedback_analysis.get('related_groups', [])),
+        'proposals_generated': len(proposals),
+        'high_priority_count': sum(1 for p in proposals if p['priority'] == 'high'),
+        'external_findings_count': len(external_findings),
+    }
+    # Small files for CI and monitoring, separate from the full results
+    run_seconds = timer.total
+    for metrics_path in metrics_outputs or []:
+        write_metrics_file(Path(metrics_path), metrics, timer.timings, run_seconds)
+        print(f"\n📈 Metrics written to: {metrics_path}")
     
     print("\n" + "=" * 60)
     print("Analysis Complete!")
@@ -718,14 +610,9 @@ def main(
         'feedback_analysis': feedback_analysis,
         'proposals': proposals,
         'external_findings': external_findings,
-        'report': report,
-        'metrics': {
-            'feedback_processed': len(feedback_items),
-            'patterns_found': len(retro_patterns) + len(feedback_analysis.get('related_groups', [])),
-            'proposals_generated': len(proposals),
-            'high_priority_count': sum(1 for p in proposals if p['priority'] == 'high'),
-            'external_findings_count': len(external_findings),
-        }
+        **report_ref,
+        'metrics': metrics,
+        'phase_seconds': timer.timings,
     }
 
 
@@ -760,28 +647,119 @@ if __name__ == "__main__":
         "--json-output",
         help="Optional JSON output file for machine-readable results"
     )
+    parser.add_argument(
+        "--metrics-output",
+        action="append",
+        help="Write run metrics and phase timings to this file; the suffix picks the format: "
+             ".json, .prom (Prometheus) or .om (OpenMetrics). May be repeated"
+    )
     parser.add_argument(
         "--enable-web-research",
         action="store_true",
         help="Enable web search for best practices"
     )
+    parser.add_argument(
+        "--web-queries-file",
+        help="YAML/JSON list of search queries for --enable-web-research ({year} is the current year)"
+    )
     parser.add_argument(
         "--enable-github-analysis",
         action="store_true",
         help="Analyze GitHub patterns (requires GITHUB_TOKEN)"
     )
+    parser.add_argument(
+        "--github-store", nargs="?", const=f"{RESEARCH_CACHE_DIR}/github-store.sqlite3",
+        help="Sync PRs and issues incrementally into a local SQLite store and add rolling 7/30/90-day "
+             f"analytics to --enable-github-analysis (default path: {RESEARCH_CACHE_DIR}/github-store.sqlite3)"
+    )
     parser.add_argument(
         "--enable-paper-research",
         action="store_true",
         help="Search arXiv for research papers"
     )
+    parser.add_argument(
+        "--arxiv-index",
+        help=f"Local arXiv index for offline paper search (default: {RESEARCH_CACHE_DIR}/arxiv-index.sqlite3; "
+             "build it with tools/build_arxiv_index.py)"
+    )
     parser.add_argument(
         "--enable-framework-analysis",
         action="store_true",
         help="Analyze other agent frameworks"
     )
+    parser.add_argument(
+        "--frameworks-file",
+        help="YAML/JSON list of frameworks (owner, repo, name) for --enable-framework-analysis"
+    )
+    parser.add_argument(
+        "--research-plugin",
+        action="append",
+        help="Also run this researcher plugin, registered under the kerrigan.researchers entry point group. "
+             "May be repeated"
+    )
+    parser.add_argument(
+        "--similarity",
+        choices=SIMILARITY_ENGINES,
+        default="keyword",
+        help="Related-feedback grouping: shared keywords/files, or MinHash near-duplicate clustering (default: keyword)"
+    )
+    parser.add_argument(
+        "--similarity-threshold",
+        type=float,
+        default=0.8,
+        help="Jaccard similarity threshold for --similarity minhash (default: 0.8)"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Do not read or write {ANALYSIS_CACHE_DIR}/ (parse cache and incremental state)"
+    )
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Ignore the persisted analysis state and recompute from all feedback"
+    )
+    parser.add_argument(
+        "--priority-weights",
+        help="YAML/JSON file overriding feedback priority weights (severity/status/category points)"
+    )
+    parser.add_argument(
+        "--github-graphql",
+        action="store_true",
+        help="Batch GitHub and framework research through the GraphQL API (requires GITHUB_TOKEN)"
+    )
+    parser.add_argument(
+        "--research-cache",
+        choices=CACHE_BACKENDS,
+        default="files",
+        help=f"External research cache in {RESEARCH_CACHE_DIR}/: one file per entry, "
+             "a single SQLite database, or off (default: files)"
+    )
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--research-record", help="Record external research HTTP traffic to this cassette file")
+    cassette.add_argument(
+        "--research-replay",
+        help="Answer external research HTTP requests from a recorded cassette, without network access"
+    )
+    parser.add_argument(
+        "--research-timeout",
+        type=float,
+        default=DEFAULT_SOURCE_TIMEOUT,
+        help=f"Seconds each external research source may take (default: {DEFAULT_SOURCE_TIMEOUT:g})"
+    )
+    parser.add_argument(
+        "--research-deadline",
+        type=float,
+        default=DEFAULT_DEADLINE,
+        help=f"Seconds the whole external research phase may take (default: {DEFAULT_DEADLINE:g})"
+    )
 
     args = parser.parse_args()
+    for metrics_path in args.metrics_output or []:
+        try:
+            metrics_format(Path(metrics_path))
+        except ValueError as e:
+            parser.error(str(e))
 
     results = main(
         feedback_dir=args.feedback_dir,
@@ -791,7 +769,24 @@ if __name__ == "__main__":
         enable_web_research=args.enable_web_research,
         enable_github_analysis=args.enable_github_analysis,
         enable_paper_research=args.enable_paper_research,
-        enable_framework_analysis=args.enable_framework_analysis
+        enable_framework_analysis=args.enable_framework_analysis,
+        similarity=args.similarity,
+        similarity_threshold=args.similarity_threshold,
+        use_cache=not args.no_cache,
+        full_rebuild=args.full_rebuild,
+        priority_weights=load_priority_weights(Path(args.priority_weights)) if args.priority_weights else None,
+        research_timeout=args.research_timeout,
+        research_deadline=args.research_deadline,
+        metrics_outputs=args.metrics_output,
+        use_graphql=args.github_graphql,
+        research_cache=args.research_cache,
+        frameworks_file=args.frameworks_file,
+        web_queries_file=args.web_queries_file,
+        arxiv_index=args.arxiv_index,
+        research_plugins=args.research_plugin,
+        research_record=args.research_record,
+        research_replay=args.research_replay,
+        github_store=args.github_store
     )
     
     if args.json_output:
@@ -0,0 +1,32 @@
+"""Text tokenization shared by the research modules and checklist scoring.
+
+Kept outside the research package so checklist scoring can use it without
+importing research (its cache, plugins and HTTP pool).
+"""
+
+import re
+from typing import List
+
+_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+STOPWORDS = frozenset(
+    "a an and are as at be by can for from has have in into is it its of on or our "
+    "that the their these this to via was we were which while with".split()
+)
+
+
+def _singular(token: str) -> str:
+    """Fold simple English plurals ('agents', 'policies') onto their singular."""
+    if len(token) > 4 and token.endswith('ies'):
+        return token[:-3] + 'y'
+    if len(token) > 3 and token.endswith('s') and not token.endswith(('ss', 'us', 'is')):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase, singular word tokens, without stopwords and single characters."""
+    return [
+        _singular(token) for token in _TOKEN_PATTERN.findall((text or '').lower())
+        if len(token) > 1 and token not in STOPWORDS
+    ]
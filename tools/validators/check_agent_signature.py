@@ -17,7 +17,7 @@ from pathlib import Path
 # Add parent directory to path to import agent_audit module
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from agent_audit import AgentSignature, validate_pr_signature
+from agent_audit import EMPTY_PR_BODY_ERROR, AgentSignature, validate_signatures
 
 
 def main() -> None:
@@ -70,21 +70,26 @@ def main() -> None:
     print(f"   Agent labels found: {', '.join(agent_labels)}")
     print("   Validating agent signature...")
     
-    # Validate the signature
-    is_valid, errors = validate_pr_signature(pr_body)
+    # Validate the signatures (PR body is parsed once for all checks)
+    signatures = AgentSignature.find_all(pr_body or '')
+    if pr_body:
+        errors = validate_signatures(signatures)
+    else:
+        errors = [EMPTY_PR_BODY_ERROR]
     
-    if is_valid:
-        signature = AgentSignature.from_text(pr_body)
+    if not errors:
         print(f"✅ Agent signature is valid")
-        print(f"   Role: {signature.role}")
-        print(f"   Version: {signature.version}")
-        print(f"   Timestamp: {signature.timestamp}")
+        for signature in signatures:
+            print(f"   Role: {signature.role}")
+            print(f"   Version: {signature.version}")
+            print(f"   Timestamp: {signature.timestamp}")
         
-        # Informational: check if signature role matches labels
-        if signature.role not in agent_labels:
-            print(f"⚠️  Warning: Signature role '{signature.role}' doesn't match PR labels")
-            print(f"   PR labels: {', '.join(agent_labels)}")
-            print("   This is informational - signature is still valid")
+        # Informational: check if signature roles match labels
+        for signature in signatures:
+            if signature.role not in agent_labels:
+                print(f"⚠️  Warning: Signature role '{signature.role}' doesn't match PR labels")
+                print(f"   PR labels: {', '.join(agent_labels)}")
+                print("   This is informational - signature is still valid")
     else:
         print("❌ Agent signature validation failed:")
         for error in errors: